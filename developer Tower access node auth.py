@@ -29,6 +29,11 @@ class QuantumAuthManager:
         self.nonce_ttl = self.auth_config.get("nonce_ttl", 600)
         self.rate_limit_config = self.auth_config.get("rate_limiting", {})
         self.key_version = self.auth_config.get("key_version", "v1")
+        # In-process key-material cache with a lease TTL: verifying a
+        # signature then costs a dict lookup instead of a Redis round-trip
+        # plus a decrypt on every request.
+        self._secret_cache: Dict[Tuple[str, str], Tuple[bytes, float]] = {}
+        self._secret_cache_ttl = self.auth_config.get("secret_cache_ttl", 3600)
     
     async def initialize(self):
         """Initialize the auth manager (e.g., ensure Redis connection)."""
@@ -43,30 +48,38 @@ class QuantumAuthManager:
         """Get the secret key for a given originator from secure storage."""
         if key_version is None:
             key_version = self.key_version
-        
+
+        local_key = (originator, key_version)
+        cached = self._secret_cache.get(local_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
         try:
             redis_client = await get_redis_client()
             cache_key = f"quantum_secret:{originator}:{key_version}"
             cached_secret = await redis_client.get(cache_key)
-            
+
             if cached_secret:
-                return decrypt_secret(cached_secret)
-            
-            # Fall back to secrets.yaml (simplified for Windows Tower)
-            secret = self.secrets.get("quantum_secret", "").encode('utf-8')
-            if not secret:
-                raise QuantumAuthError("Quantum secret not configured")
-            
-            # Cache the encrypted secret
-            encrypted_secret = encrypt_secret(secret)
-            await redis_client.setex(
-                cache_key, 
-                self.auth_config.get("secret_cache_ttl", 3600),
-                encrypted_secret
+                secret = decrypt_secret(cached_secret)
+            else:
+                # Fall back to secrets.yaml (simplified for Windows Tower)
+                secret = self.secrets.get("quantum_secret", "").encode('utf-8')
+                if not secret:
+                    raise QuantumAuthError("Quantum secret not configured")
+
+                # Cache the encrypted secret
+                encrypted_secret = encrypt_secret(secret)
+                await redis_client.setex(
+                    cache_key,
+                    self._secret_cache_ttl,
+                    encrypted_secret
+                )
+
+            self._secret_cache[local_key] = (
+                secret, time.monotonic() + self._secret_cache_ttl
             )
-            
             return secret
-                
+
         except Exception as e:
             logger.error(f"Failed to retrieve secret for {originator}: {e}")
             raise QuantumAuthError("Secret retrieval failed")
@@ -1,5 +1,6 @@
 import os
 import yaml
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from src.common.utils import get_logger
 import re
@@ -72,6 +73,16 @@ class Config:
                 return default
         return value
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Dependency injection for Config."""
-    return Config()
\ No newline at end of file
+    """Dependency injection for Config.
+
+    Cached so the YAML read, environment overrides and env-var substitution
+    run once per process instead of on every call site.
+    """
+    return Config()
+
+def reload_config() -> Config:
+    """Drop the cached Config so the next get_config() re-reads the file."""
+    get_config.cache_clear()
+    return get_config()
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+import hashlib
 import re
 import shutil
 from typing import Dict, Any, Optional, List, Tuple
@@ -66,9 +67,14 @@ class GitController:
         self._operation_semaphore = asyncio.Semaphore(config.max_concurrent_operations)
         self._active_operations: Dict[str, GitOperation] = {}
         self._cleanup_task = None
+        # Cached bare mirrors, one per upstream URL, with a per-URL lock so
+        # concurrent clones of the same repository fetch it only once.
+        self._mirrors: Dict[str, str] = {}
+        self._mirror_locks: Dict[str, asyncio.Lock] = {}
         
         # Ensure base directory exists
         os.makedirs(self.config.base_path, exist_ok=True)
+        os.makedirs(os.path.join(self.config.base_path, ".mirrors"), exist_ok=True)
     
     async def initialize(self):
         """Initialize the Git controller with Redis connection and cleanup task."""
@@ -200,6 +206,48 @@ class GitController:
         except Exception as e:
             logger.warning(f"Failed to check repository size: {e}")
     
+    def _mirror_path(self, repo_url: str) -> str:
+        """Return the on-disk path of the bare mirror for a repository URL."""
+        # Name + URL-hash suffix so equally named repos from different
+        # upstreams get distinct mirrors.
+        repo_name = self._sanitize_repo_name(repo_url)
+        url_hash = hashlib.sha256(repo_url.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.config.base_path, ".mirrors", f"{repo_name}-{url_hash}.git")
+    
+    async def _ensure_mirror(self, repo_url: str, operation_id: Optional[str] = None) -> str:
+        """
+        Ensure an up-to-date bare mirror of the repository exists and return
+        its path. Per-URL single-flight: concurrent clones of the same
+        upstream share one fetch instead of each hitting the network.
+        """
+        lock = self._mirror_locks.setdefault(repo_url, asyncio.Lock())
+        async with lock:
+            mirror_path = self._mirrors.get(repo_url) or self._mirror_path(repo_url)
+            
+            if os.path.exists(mirror_path):
+                # Explicit refspec so heads advance even in mirrors created
+                # before --mirror clones (plain bare clones have no refspec
+                # and a bare `git fetch origin` only updates FETCH_HEAD).
+                fetch_args = [
+                    "git", "fetch", "--prune", "origin",
+                    "+refs/heads/*:refs/heads/*"
+                ]
+                await self._execute_git_command(fetch_args, mirror_path, operation_id)
+            else:
+                # --mirror (not --bare) writes the +refs/*:refs/* fetch
+                # refspec, so the reuse fetch above actually advances the
+                # mirror's branches; a bare clone only updates FETCH_HEAD.
+                # blob:none keeps the mirror small; missing blobs are fetched
+                # on demand when a worktree materializes them.
+                mirror_args = [
+                    "git", "clone", "--mirror", "--filter=blob:none",
+                    repo_url, mirror_path
+                ]
+                await self._execute_git_command(mirror_args, self.config.base_path, operation_id)
+            
+            self._mirrors[repo_url] = mirror_path
+            return mirror_path
+    
     async def clone_repository(
         self,
         repo_url: str,
@@ -209,6 +257,10 @@ class GitController:
     ) -> str:
         """
         Clone a Git repository with comprehensive validation and error handling.
+
+        ``depth`` is accepted for API compatibility but not applied: checkouts
+        materialize as worktrees of a shared blob-filtered mirror, which
+        already avoids transferring file contents for unvisited history.
         """
         operation_id = generate_uuid()
         operation = GitOperation(
@@ -241,17 +293,18 @@ class GitController:
                 else:
                     raise GitError(f"Repository already exists at {repo_path}")
             
-            # Prepare clone command
-            clone_args = [
-                "git", "clone",
-                "--depth", str(depth),
-                "--branch", branch,
-                repo_url,
-                repo_path
-            ]
-            
-            # Execute clone
-            stdout, stderr = await self._execute_git_command(clone_args, self.config.base_path, operation_id)
+            # Materialize the checkout from a cached bare mirror: the first
+            # clone of an upstream pays the network cost, repeat clones are a
+            # local fetch plus a near-instant worktree checkout.
+            mirror_path = await self._ensure_mirror(repo_url, operation_id)
+            
+            # Drop stale bookkeeping for worktrees deleted from disk (e.g.
+            # via force_overwrite) before adding a new one at the same path.
+            prune_args = ["git", "worktree", "prune"]
+            await self._execute_git_command(prune_args, mirror_path, operation_id)
+            
+            worktree_args = ["git", "worktree", "add", "--detach", repo_path, branch]
+            stdout, stderr = await self._execute_git_command(worktree_args, mirror_path, operation_id)
             
             # Check repository size
             await self._check_repo_size(repo_path)
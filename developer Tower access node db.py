@@ -37,7 +37,12 @@ class DatabaseManager:
 
         logger.info(f"Connecting to SQLite database at {db_path}")
         try:
-            self._connection = await aiosqlite.connect(db_path, isolation_level=None)
+            # A generous statement cache keeps the hot queries (get-by-id,
+            # stats GROUP BYs, expired scan) parsed and planned exactly once.
+            self._connection = await aiosqlite.connect(
+                db_path, isolation_level=None, cached_statements=256
+            )
+            await self._connection.execute("PRAGMA cache_size=-20000")
             await self._init_schema()
             self._initialized = True
             logger.info("Database connection established and schema initialized.")
@@ -9,6 +9,7 @@ from common.utils import get_logger
 from common.config import get_config
 from common.models import JobResponse
 from ai.proxy import AIProxy
+from core.sandbox import get_docker_client
 import aiofiles
 import aiofiles.os
 import aiodocker
@@ -59,26 +60,26 @@ class Executor:
         
         if self.use_docker:
             return await self._run_python_docker(manifest, job_id)
-        
-        temp_dir = tempfile.gettempdir()
-        temp_file_path = os.path.join(temp_dir, f"temp_script_{job_id}.py")
 
         try:
-            async with aiofiles.open(temp_file_path, 'w') as f:
-                await f.write(manifest.code)
-            
+            # Feed the script over stdin: no temp-file write/unlink round-trip
+            # per execution. A warm shared process pool was considered, but
+            # pool workers cannot honor the scrubbed per-job environment or
+            # be killed on timeout, which this sandbox relies on.
             proc = await asyncio.create_subprocess_exec(
-                "python", temp_file_path,
+                "python", "-",
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=manifest.environment,  # Explicit environment only
                 limit=1024 * 1024
             )
-            
+
             stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=manifest.timeout_seconds
+                proc.communicate(manifest.code.encode('utf-8')),
+                timeout=manifest.timeout_seconds
             )
-            
+
             return_code = proc.returncode
             stdout_str = stdout.decode('utf-8').strip()
             stderr_str = stderr.decode('utf-8').strip()
@@ -109,13 +110,6 @@ class Executor:
                 status="failed",
                 result={"error": f"Execution failed due to internal error: {e}"}
             )
-        finally:
-            try:
-                await aiofiles.os.remove(temp_file_path)
-            except FileNotFoundError:
-                pass
-            except Exception as e:
-                logger.warning(f"Failed to remove temp file {temp_file_path}: {e}")
 
     async def _run_python_docker(self, manifest: RunPythonManifest, job_id: str) -> JobResponse:
         """
@@ -130,60 +124,60 @@ class Executor:
             async with aiofiles.open(temp_file_path, 'w') as f:
                 await f.write(manifest.code)
             
-            async with aiodocker.Docker() as docker:
-                # Create container with resource limits
-                container_config = {
-                    "Image": self.docker_image,
-                    "Cmd": ["python", "/app/script.py"],
-                    "HostConfig": {
-                        "Memory": 256 * 1024 * 1024,  # 256MB
-                        "NanoCpus": 1_000_000_000,   # 1 CPU
-                        "Mounts": [{
-                            "Target": "/app/script.py",
-                            "Source": temp_file_path,
-                            "Type": "bind",
-                            "ReadOnly": True
-                        }],
-                        "NetworkMode": "none"  # Disable networking for security
-                    },
-                    "Env": [f"{k}={v}" for k, v in manifest.environment.items()]
-                }
-                
-                # Create and start container
-                container = await docker.containers.create(
-                    name=container_name,
-                    config=container_config
+            docker = get_docker_client()
+            # Create container with resource limits
+            container_config = {
+                "Image": self.docker_image,
+                "Cmd": ["python", "/app/script.py"],
+                "HostConfig": {
+                    "Memory": 256 * 1024 * 1024,  # 256MB
+                    "NanoCpus": 1_000_000_000,   # 1 CPU
+                    "Mounts": [{
+                        "Target": "/app/script.py",
+                        "Source": temp_file_path,
+                        "Type": "bind",
+                        "ReadOnly": True
+                    }],
+                    "NetworkMode": "none"  # Disable networking for security
+                },
+                "Env": [f"{k}={v}" for k, v in manifest.environment.items()]
+            }
+            
+            # Create and start container
+            container = await docker.containers.create(
+                name=container_name,
+                config=container_config
+            )
+            await container.start()
+            
+            # Wait for completion with timeout
+            try:
+                await asyncio.wait_for(
+                    container.wait(), timeout=manifest.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                await container.kill()
+                logger.warning(f"[{job_id}] Docker execution timed out")
+                return JobResponse(
+                    job_id=job_id,
+                    status="timeout",
+                    result={"error": f"Docker execution timed out after {manifest.timeout_seconds} seconds."}
                 )
-                await container.start()
-                
-                # Wait for completion with timeout
-                try:
-                    await asyncio.wait_for(
-                        container.wait(), timeout=manifest.timeout_seconds
-                    )
-                except asyncio.TimeoutError:
-                    await container.kill()
-                    logger.warning(f"[{job_id}] Docker execution timed out")
-                    return JobResponse(
-                        job_id=job_id,
-                        status="timeout",
-                        result={"error": f"Docker execution timed out after {manifest.timeout_seconds} seconds."}
-                    )
-                
-                # Get logs
-                logs = await container.log(stdout=True, stderr=True)
-                stdout_str = "".join(logs).strip()
-                status = await container.show()
-                return_code = status["State"]["ExitCode"]
+            
+            # Get logs
+            logs = await container.log(stdout=True, stderr=True)
+            stdout_str = "".join(logs).strip()
+            status = await container.show()
+            return_code = status["State"]["ExitCode"]
 
-                result = {
-                    "return_code": return_code,
-                    "stdout": stdout_str,
-                    "stderr": "" if return_code == 0 else stdout_str
-                }
-                status = "completed" if return_code == 0 else "failed"
-                logger.info(f"[{job_id}] Docker 'runPython' intent finished with status: {status}")
-                return JobResponse(job_id=job_id, status=status, result=result)
+            result = {
+                "return_code": return_code,
+                "stdout": stdout_str,
+                "stderr": "" if return_code == 0 else stdout_str
+            }
+            status = "completed" if return_code == 0 else "failed"
+            logger.info(f"[{job_id}] Docker 'runPython' intent finished with status: {status}")
+            return JobResponse(job_id=job_id, status=status, result=result)
 
         except DockerError as e:
             logger.error(f"[{job_id}] Docker execution failed: {e}")
@@ -207,9 +201,8 @@ class Executor:
             except Exception as e:
                 logger.warning(f"Failed to remove temp file {temp_file_path}: {e}")
             try:
-                async with aiodocker.Docker() as docker:
-                    container = docker.containers.container(container_name)
-                    await container.delete(force=True)
+                container = get_docker_client().containers.container(container_name)
+                await container.delete(force=True)
             except DockerError:
                 pass
 
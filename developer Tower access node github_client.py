@@ -1,14 +1,55 @@
-import aiohttp
+import httpx
 import asyncio
-import json
+import heapq
+import itertools
+import orjson
 import random
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 from src.common.utils import get_logger
-from aiohttp import ClientResponse
 from pydantic import BaseModel
 
 logger = get_logger(__name__)
 
+class RequestGate:
+    """
+    Bounds the number of in-flight requests and admits waiters by priority
+    (lower value = higher priority, FIFO within a priority level).
+    A plain semaphore would cap concurrency but let bulk pagination starve
+    interactive calls; the heap keeps high-priority intents at the front.
+    """
+    def __init__(self, max_concurrency: int):
+        self._capacity = max_concurrency
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int) -> None:
+        if self._active < self._capacity:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.done():
+                waiter.cancel()
+            elif not waiter.cancelled():
+                # The slot was already granted via set_result but the task
+                # got cancelled before resuming: pass it on, or capacity
+                # shrinks permanently.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # Hand the slot directly to the next waiter; _active is unchanged.
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
 class GitHubClientError(Exception):
     """Custom exception for GitHub API errors."""
     def __init__(self, message: str, status_code: Optional[int] = None, error_data: Optional[Dict] = None):
@@ -26,13 +67,17 @@ class BranchProtectionRules(BaseModel):
 class GitHubClient:
     """
     An asynchronous client for the GitHub API with retries, timeouts, and pagination.
+    Owns a single long-lived httpx.AsyncClient so every call shares one connection
+    pool (and, with HTTP/2, one multiplexed TCP connection) per process.
     """
-    def __init__(self, token: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, token: str, timeout: int = 30, max_retries: int = 3, max_concurrency: int = 8):
         self.base_url = "https://api.github.com"
         self.token = token
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = httpx.Timeout(timeout)
         self.max_retries = max_retries
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.max_concurrency = max_concurrency
+        self._gate = RequestGate(max_concurrency)
+        self.client: Optional[httpx.AsyncClient] = None
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "Authorization": f"token {self.token}",
@@ -41,14 +86,19 @@ class GitHubClient:
         logger.info("GitHubClient initialized.")
 
     async def __aenter__(self):
-        """Initializes the aiohttp session with timeout."""
-        self.session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout)
+        """Initializes the httpx client with timeout and pooled keep-alive connections."""
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Closes the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Closes the httpx client."""
+        if self.client and not self.client.is_closed:
+            await self.client.aclose()
             logger.info("GitHubClient session closed.")
 
     async def _request(
@@ -57,49 +107,70 @@ class GitHubClient:
         path: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        priority: int = 10,
     ) -> Union[Dict, List]:
         """A generic method for making authenticated requests to the GitHub API with retries."""
-        if not self.session:
+        if not self.client:
             raise GitHubClientError("Client session is not active. Use 'async with' to manage lifecycle.")
 
         url = f"{self.base_url}{path}"
+        await self._gate.acquire(priority)
+        try:
+            return await self._request_unbounded(method, url, data, params)
+        finally:
+            self._gate.release()
+
+    async def _request_unbounded(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> Union[Dict, List]:
+        """Performs the actual HTTP exchange; concurrency is capped by the caller."""
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.debug(f"Request {method} {url} data={data} params={params} (attempt {attempt}/{self.max_retries})")
-                async with self.session.request(method, url, json=data, params=params) as response:
-                    if response.status >= 400:
-                        try:
-                            error_data = await response.json()
-                        except aiohttp.ContentTypeError:
-                            error_data = {"message": await response.text()}
-                        
-                        logger.error(f"GitHub API error ({response.status}): {error_data}")
-                        if response.status == 403 and "rate limit" in str(error_data.get("message", "")).lower():
-                            raise GitHubClientError(
-                                "GitHub API rate limit exceeded.",
-                                status_code=response.status,
-                                error_data=error_data
-                            )
-                        else:
-                            raise GitHubClientError(
-                                f"GitHub API error ({response.status}): {error_data.get('message', 'Unknown error')}",
-                                status_code=response.status,
-                                error_data=error_data
-                            )
-                    
-                    if response.status == 204:  # No Content
-                        logger.debug(f"Response [{response.status}] No content")
-                        return {}
-                    
+                body = orjson.dumps(data) if data is not None else None
+                response = await self.client.request(
+                    method, url, content=body, params=params,
+                    headers={"Content-Type": "application/json"} if body is not None else None,
+                )
+                # Read the body exactly once; success and error paths share it.
+                raw = response.content
+                if response.status_code >= 400:
                     try:
-                        result = await response.json()
-                        logger.debug(f"Response [{response.status}] {result}")
-                        return result
-                    except aiohttp.ContentTypeError:
-                        logger.debug(f"Response [{response.status}] Non-JSON content")
-                        return {}  # Return an empty dict for non-JSON responses
-
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        error_data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        error_data = {"message": response.text}
+
+                    logger.error(f"GitHub API error ({response.status_code}): {error_data}")
+                    if response.status_code == 403 and "rate limit" in str(error_data.get("message", "")).lower():
+                        raise GitHubClientError(
+                            "GitHub API rate limit exceeded.",
+                            status_code=response.status_code,
+                            error_data=error_data
+                        )
+                    else:
+                        raise GitHubClientError(
+                            f"GitHub API error ({response.status_code}): {error_data.get('message', 'Unknown error')}",
+                            status_code=response.status_code,
+                            error_data=error_data
+                        )
+
+                if response.status_code == 204 or not raw:  # No Content
+                    logger.debug(f"Response [{response.status_code}] No content")
+                    return {}
+
+                try:
+                    result = orjson.loads(raw)
+                    logger.debug(f"Response [{response.status_code}] {result}")
+                    return result
+                except orjson.JSONDecodeError:
+                    logger.debug(f"Response [{response.status_code}] Non-JSON content")
+                    return {}  # Return an empty dict for non-JSON responses
+
+            except (httpx.TransportError, httpx.TimeoutException) as e:
                 if attempt == self.max_retries:
                     logger.error(f"Request failed after {self.max_retries} retries: {str(e)}")
                     raise GitHubClientError(f"Request failed after {self.max_retries} retries: {str(e)}")
@@ -112,7 +183,8 @@ class GitHubClient:
         page = 1
         while True:
             paginated_params = {**(params or {}), "page": page, "per_page": 100}
-            data = await self._request("GET", path, params=paginated_params)
+            # Bulk pagination yields to interactive calls under load.
+            data = await self._request("GET", path, params=paginated_params, priority=20)
             if not data:
                 break
             results.extend(data)
@@ -153,4 +225,4 @@ class GitHubClient:
             },
             "restrictions": None
         }
-        return await self._request("PUT", path, data=data)
\ No newline at end of file
+        return await self._request("PUT", path, data=data)
@@ -209,8 +209,21 @@ def parse_intent(data: Dict[str, Any]) -> Intent:
     Factory to parse a raw dict into the correct Intent subclass.
     Raises ValueError if the intent type is unknown.
     """
-    intent_type = data.get("type")
-    intent_cls = INTENT_MAP.get(intent_type)
-    if not intent_cls:
-        raise ValueError(f"Unknown intent type: {intent_type}")
+    try:
+        intent_cls = INTENT_MAP[data["type"]]
+    except KeyError:
+        raise ValueError(f"Unknown intent type: {data.get('type')}")
     return intent_cls(**data)
+
+def parse_intent_trusted(data: Dict[str, Any]) -> Intent:
+    """
+    Fast-path factory for intents that were already validated upstream
+    (e.g. replayed from a trusted store). Skips all validators via
+    model_construct and only pays attribute-assignment cost.
+    Raises ValueError if the intent type is unknown.
+    """
+    try:
+        intent_cls = INTENT_MAP[data["type"]]
+    except KeyError:
+        raise ValueError(f"Unknown intent type: {data.get('type')}")
+    return intent_cls.model_construct(**data)
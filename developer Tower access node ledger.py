@@ -1,7 +1,9 @@
 # src/artifact/ledger.py
 
+import base64
 import json
 import asyncio
+from operator import itemgetter
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, validator
@@ -11,10 +13,57 @@ from common.redis_client import get_redis_client
 
 logger = get_logger(__name__)
 
+# Hot-path SQL lives in module constants so the connection's statement cache
+# (keyed on identical SQL text) always hits instead of re-parsing.
+SQL_GET_ARTIFACT_BY_ID = "SELECT * FROM artifacts WHERE artifact_id = ?"
+SQL_TOUCH_ARTIFACT_ACCESS = (
+    "UPDATE artifacts SET last_accessed = ?, access_count = access_count + 1 WHERE artifact_id = ?"
+)
+SQL_EXPIRED_ARTIFACT_IDS = (
+    "SELECT artifact_id FROM artifacts WHERE expires_at IS NOT NULL AND expires_at < ?"
+)
+
 class LedgerError(Exception):
     """Custom exception for ledger-related errors."""
     pass
 
+def _dt_to_micros(dt: datetime) -> int:
+    """Convert a datetime to integer epoch microseconds for storage."""
+    return int(dt.timestamp() * 1_000_000)
+
+def _micros_to_dt(micros: int) -> datetime:
+    """Convert stored epoch microseconds back to an aware UTC datetime."""
+    return datetime.fromtimestamp(micros / 1_000_000, tz=timezone.utc)
+
+def _metadata_from_trusted(data: Dict[str, Any]) -> ArtifactMetadata:
+    """Rehydrate metadata we serialized ourselves, skipping field validation.
+
+    Cache blobs were produced by model_dump_json on an already-validated
+    instance, so model_construct can bypass the hash/originator validators
+    and pydantic coercion; only the datetime fields need manual conversion
+    since JSON has no native datetime type.
+    """
+    if data.get("created_at"):
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    if data.get("expires_at"):
+        data["expires_at"] = datetime.fromisoformat(data["expires_at"])
+    return ArtifactMetadata.model_construct(**data)
+
+def encode_artifact_cursor(created_at: datetime, artifact_id: str) -> str:
+    """Encode the keyset pagination cursor for the last row of a page."""
+    raw = f"{_dt_to_micros(created_at)}|{artifact_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_artifact_cursor(cursor: str) -> Tuple[int, str]:
+    """Decode a keyset pagination cursor into (created_at_micros, artifact_id)."""
+    try:
+        created_at, _, artifact_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        if not artifact_id:
+            raise ValueError("malformed cursor")
+        return int(created_at), artifact_id
+    except Exception as e:
+        raise LedgerError(f"Invalid pagination cursor: {e}")
+
 class ArtifactMetadata(BaseModel):
     artifact_id: str = Field(..., description="Unique artifact identifier")
     originator: str = Field(..., description="Resonance signature of the uploader")
@@ -54,7 +103,7 @@ class ArtifactQuery(BaseModel):
     min_size: Optional[int] = Field(None, ge=0)
     max_size: Optional[int] = Field(None, ge=0)
     limit: int = Field(100, ge=1, le=1000)
-    offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page")
     sort_by: str = Field("created_at", description="Field to sort by")
     sort_order: str = Field("desc", description="Sort order: asc or desc")
 
@@ -94,8 +143,10 @@ class ArtifactLedger:
                     size_bytes INTEGER NOT NULL CHECK(size_bytes >= 0),
                     sha256_hash TEXT NOT NULL CHECK(length(sha256_hash) = 64),
                     mime_type TEXT,
-                    created_at TEXT NOT NULL,
-                    expires_at TEXT,
+                    -- Epoch microseconds: integer comparisons and index keys
+                    -- are far cheaper than ISO-8601 string collation.
+                    created_at INTEGER NOT NULL,
+                    expires_at INTEGER,
                     tags TEXT NOT NULL DEFAULT '{}',
                     access_control TEXT NOT NULL DEFAULT '{"read": [], "write": []}',
                     version INTEGER NOT NULL DEFAULT 1,
@@ -106,7 +157,19 @@ class ArtifactLedger:
                     access_count INTEGER DEFAULT 0
                 )
             """)
-            
+
+            await self._migrate_timestamp_columns(db)
+
+
+            # Running counters so stats reads never scan the artifacts table
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS artifact_counters (
+                    key TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    size_bytes INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
             # Create audit table for changes
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS artifact_audit (
@@ -119,17 +182,99 @@ class ArtifactLedger:
                     FOREIGN KEY (artifact_id) REFERENCES artifacts (artifact_id) ON DELETE CASCADE
                 )
             """)
-            
+
+            await self._seed_counters(db)
+
             await db.commit()
-    
+
+    @staticmethod
+    async def _migrate_timestamp_columns(db) -> None:
+        """Backfill legacy ISO-8601 created_at/expires_at rows to epoch micros.
+
+        CREATE TABLE IF NOT EXISTS only shapes fresh databases; existing
+        ones keep their TEXT values, which _micros_to_dt would choke on in
+        every read path. typeof() catches them regardless of declared
+        affinity (TEXT survives in an INTEGER column in SQLite).
+        """
+        cursor = await db.execute(
+            "SELECT artifact_id, created_at, expires_at FROM artifacts "
+            "WHERE typeof(created_at) = 'text' OR typeof(expires_at) = 'text'"
+        )
+        rows = await cursor.fetchall()
+        if not rows:
+            return
+
+        updates = []
+        for artifact_id, created_at, expires_at in rows:
+            if isinstance(created_at, str):
+                created_at = _dt_to_micros(datetime.fromisoformat(created_at))
+            if isinstance(expires_at, str):
+                expires_at = _dt_to_micros(datetime.fromisoformat(expires_at))
+            updates.append((created_at, expires_at, artifact_id))
+
+        await db.executemany(
+            "UPDATE artifacts SET created_at = ?, expires_at = ? WHERE artifact_id = ?",
+            updates
+        )
+        logger.info(f"Migrated {len(updates)} artifact rows from ISO-8601 to epoch-microsecond timestamps")
+
+    @staticmethod
+    async def _seed_counters(db) -> None:
+        """Populate artifact_counters from existing rows on first init.
+
+        _bump_counters only maintains the table incrementally, so a
+        database that predates it would report zero artifacts and zero
+        sizes from the counter-backed stats/count paths. One aggregate
+        pass at init seeds the keys; empty-or-already-seeded databases
+        skip it.
+        """
+        cursor = await db.execute("SELECT EXISTS(SELECT 1 FROM artifact_counters)")
+        seeded = await cursor.fetchone()
+        if seeded and seeded[0]:
+            return
+        cursor = await db.execute("SELECT EXISTS(SELECT 1 FROM artifacts)")
+        has_rows = await cursor.fetchone()
+        if not has_rows or not has_rows[0]:
+            return
+
+        await db.execute(
+            """
+            INSERT INTO artifact_counters (key, count, size_bytes)
+            SELECT '_total', COUNT(*), COALESCE(SUM(size_bytes), 0) FROM artifacts
+            """
+        )
+        await db.execute(
+            """
+            INSERT INTO artifact_counters (key, count, size_bytes)
+            SELECT 'orig:' || originator, COUNT(*), COALESCE(SUM(size_bytes), 0)
+            FROM artifacts GROUP BY originator
+            """
+        )
+        await db.execute(
+            """
+            INSERT INTO artifact_counters (key, count, size_bytes)
+            SELECT 'mime:' || mime_type, COUNT(*), COALESCE(SUM(size_bytes), 0)
+            FROM artifacts WHERE mime_type IS NOT NULL GROUP BY mime_type
+            """
+        )
+        logger.info("Seeded artifact_counters from existing artifact rows")
+
     async def _create_indexes(self):
         """Creates database indexes for performance."""
         async with get_db() as db:
+            # Legacy full index on expires_at: superseded by the partial
+            # idx_artifacts_expires below, but still present (and still
+            # paying write overhead) in databases created before it.
+            await db.execute("DROP INDEX IF EXISTS idx_artifacts_expires_at")
+
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_artifacts_originator ON artifacts(originator)",
                 "CREATE INDEX IF NOT EXISTS idx_artifacts_created_at ON artifacts(created_at)",
-                "CREATE INDEX IF NOT EXISTS idx_artifacts_expires_at ON artifacts(expires_at)",
-                "CREATE INDEX IF NOT EXISTS idx_artifacts_mime_type ON artifacts(mime_type)",
+                # Partial index: expiry sweeps only ever filter rows that can expire
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_expires ON artifacts(expires_at) WHERE expires_at IS NOT NULL",
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_mime ON artifacts(mime_type) WHERE mime_type IS NOT NULL",
+                # Covering composite for originator-scoped queries that also filter/group on MIME type
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_originator_mime ON artifacts(originator, mime_type)",
                 "CREATE INDEX IF NOT EXISTS idx_artifacts_size ON artifacts(size_bytes)",
                 "CREATE INDEX IF NOT EXISTS idx_audit_artifact_id ON artifact_audit(artifact_id)",
                 "CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON artifact_audit(timestamp)"
@@ -137,9 +282,28 @@ class ArtifactLedger:
             
             for index_sql in indexes:
                 await db.execute(index_sql)
-            
+
             await db.commit()
-    
+
+    @staticmethod
+    async def _bump_counters(db, originator: str, mime_type: Optional[str], size_bytes: int, delta: int) -> None:
+        """Incrementally maintain the running stats counters (delta is +1 or -1)."""
+        rows = [
+            ("_total", delta, size_bytes * delta),
+            (f"orig:{originator}", delta, size_bytes * delta),
+        ]
+        if mime_type:
+            rows.append((f"mime:{mime_type}", delta, size_bytes * delta))
+        await db.executemany(
+            """
+            INSERT INTO artifact_counters (key, count, size_bytes) VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                count = count + excluded.count,
+                size_bytes = size_bytes + excluded.size_bytes
+            """,
+            rows
+        )
+
     @transactional
     async def record_artifact(self, metadata: ArtifactMetadata, changed_by: str = "system") -> None:
         """Records a new artifact with transaction support and audit logging."""
@@ -160,8 +324,8 @@ class ArtifactLedger:
                         metadata.size_bytes,
                         metadata.sha256_hash,
                         metadata.mime_type,
-                        metadata.created_at.isoformat(),
-                        metadata.expires_at.isoformat() if metadata.expires_at else None,
+                        _dt_to_micros(metadata.created_at),
+                        _dt_to_micros(metadata.expires_at) if metadata.expires_at else None,
                         json.dumps(metadata.tags),
                         json.dumps(metadata.access_control),
                         metadata.version,
@@ -185,7 +349,12 @@ class ArtifactLedger:
                         datetime.now(timezone.utc).isoformat()
                     )
                 )
-                
+
+                # Maintain running stats counters in the same transaction
+                await self._bump_counters(
+                    db, metadata.originator, metadata.mime_type, metadata.size_bytes, +1
+                )
+
                 # Invalidate cache
                 await self._invalidate_cache(metadata.artifact_id)
                 
@@ -206,7 +375,7 @@ class ArtifactLedger:
             async with get_db() as db:
                 db.row_factory = aiosqlite.Row
                 row = await db.fetch_one(
-                    "SELECT * FROM artifacts WHERE artifact_id = ?",
+                    SQL_GET_ARTIFACT_BY_ID,
                     (artifact_id,)
                 )
                 
@@ -218,7 +387,7 @@ class ArtifactLedger:
                 # Update access statistics if requested
                 if update_access:
                     await db.execute(
-                        "UPDATE artifacts SET last_accessed = ?, access_count = access_count + 1 WHERE artifact_id = ?",
+                        SQL_TOUCH_ARTIFACT_ACCESS,
                         (datetime.now(timezone.utc).isoformat(), artifact_id)
                     )
                     await db.commit()
@@ -232,58 +401,159 @@ class ArtifactLedger:
             logger.error(f"Failed to get metadata for {artifact_id}: {e}")
             raise LedgerError(f"Failed to get metadata: {str(e)}")
     
+    async def get_many_artifact_metadata(
+        self, artifact_ids: List[str]
+    ) -> Dict[str, ArtifactMetadata]:
+        """Retrieves metadata for many artifacts in two round-trips at most.
+
+        Cache hits arrive via one pipelined MGET-style pass; the misses are
+        resolved with a single IN-clause SELECT and written back to the cache
+        in one pipelined SETEX batch. Unknown IDs are simply absent from the
+        returned mapping.
+        """
+        if not artifact_ids:
+            return {}
+
+        try:
+            cached = await self._mget_metadata(artifact_ids)
+            result = {
+                artifact_id: meta
+                for artifact_id, meta in zip(artifact_ids, cached)
+                if meta is not None
+            }
+
+            misses = [aid for aid in artifact_ids if aid not in result]
+            if not misses:
+                return result
+
+            async with get_db() as db:
+                db.row_factory = aiosqlite.Row
+                placeholders = ",".join("?" * len(misses))
+                rows = await db.fetch_all(
+                    f"SELECT * FROM artifacts WHERE artifact_id IN ({placeholders})",
+                    misses
+                )
+
+            fetched = [self._row_to_metadata(row) for row in rows]
+            result.update({meta.artifact_id: meta for meta in fetched})
+
+            # Backfill the cache for every miss in one pipelined round-trip
+            if self._redis_client and fetched:
+                try:
+                    async with self._redis_client.pipeline(transaction=False) as pipe:
+                        for meta in fetched:
+                            pipe.setex(
+                                f"artifact:{meta.artifact_id}:meta",
+                                self._cache_ttl,
+                                meta.model_dump_json()
+                            )
+                        await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"Bulk cache backfill failed for {len(fetched)} artifacts: {e}")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Bulk metadata fetch for {len(artifact_ids)} artifacts failed: {e}")
+            raise LedgerError(f"Bulk metadata fetch failed: {str(e)}")
+
+    @staticmethod
+    def _build_filter_clauses(query: ArtifactQuery) -> Tuple[List[str], List[Any]]:
+        """Builds the shared WHERE clauses and parameters for a query's filters."""
+        sql_parts = []
+        params = []
+
+        if query.originator:
+            sql_parts.append("AND originator = ?")
+            params.append(query.originator)
+
+        if query.mime_type:
+            sql_parts.append("AND mime_type = ?")
+            params.append(query.mime_type)
+
+        if query.created_after:
+            sql_parts.append("AND created_at >= ?")
+            params.append(_dt_to_micros(query.created_after))
+
+        if query.created_before:
+            sql_parts.append("AND created_at <= ?")
+            params.append(_dt_to_micros(query.created_before))
+
+        if query.expires_before:
+            sql_parts.append("AND expires_at <= ?")
+            params.append(_dt_to_micros(query.expires_before))
+
+        if query.min_size is not None:
+            sql_parts.append("AND size_bytes >= ?")
+            params.append(query.min_size)
+
+        if query.max_size is not None:
+            sql_parts.append("AND size_bytes <= ?")
+            params.append(query.max_size)
+
+        if query.tags:
+            for key, value in query.tags.items():
+                sql_parts.append("AND json_extract(tags, ?) = ?")
+                params.append(f"$.{key}")
+                params.append(json.dumps(value))
+
+        return sql_parts, params
+
+    async def count_artifacts(self, query: ArtifactQuery) -> int:
+        """Counts artifacts matching the query filters without fetching rows.
+
+        Unfiltered and originator-only counts are answered from the running
+        artifact_counters table; other filter combinations reuse the query
+        WHERE builder with SELECT COUNT(*) so no rows are materialized.
+        """
+        try:
+            counters_can_answer = not any((
+                query.tags, query.mime_type, query.created_after,
+                query.created_before, query.expires_before,
+                query.min_size is not None, query.max_size is not None,
+            ))
+
+            async with get_db() as db:
+                if counters_can_answer:
+                    key = f"orig:{query.originator}" if query.originator else "_total"
+                    row = await db.fetch_one(
+                        "SELECT count FROM artifact_counters WHERE key = ?", (key,)
+                    )
+                    return row[0] if row else 0
+
+                filter_parts, params = self._build_filter_clauses(query)
+                sql = " ".join(["SELECT COUNT(*) FROM artifacts WHERE 1=1"] + filter_parts)
+                row = await db.fetch_one(sql, params)
+                return row[0]
+
+        except Exception as e:
+            logger.error(f"Artifact count failed: {e}")
+            raise LedgerError(f"Count failed: {str(e)}")
+
     async def query_artifacts(self, query: ArtifactQuery) -> List[ArtifactMetadata]:
         """Advanced artifact querying with filtering, sorting, and pagination."""
         try:
-            # Build query dynamically
-            sql_parts = ["SELECT * FROM artifacts WHERE 1=1"]
-            params = []
-            
-            # Add filters
-            if query.originator:
-                sql_parts.append("AND originator = ?")
-                params.append(query.originator)
-            
-            if query.mime_type:
-                sql_parts.append("AND mime_type = ?")
-                params.append(query.mime_type)
-            
-            if query.created_after:
-                sql_parts.append("AND created_at >= ?")
-                params.append(query.created_after.isoformat())
-            
-            if query.created_before:
-                sql_parts.append("AND created_at <= ?")
-                params.append(query.created_before.isoformat())
-            
-            if query.expires_before:
-                sql_parts.append("AND expires_at <= ?")
-                params.append(query.expires_before.isoformat())
-            
-            if query.min_size is not None:
-                sql_parts.append("AND size_bytes >= ?")
-                params.append(query.min_size)
-            
-            if query.max_size is not None:
-                sql_parts.append("AND size_bytes <= ?")
-                params.append(query.max_size)
-            
-            # Handle tag filtering
-            if query.tags:
-                for key, value in query.tags.items():
-                    sql_parts.append("AND json_extract(tags, ?) = ?")
-                    params.append(f"$.{key}")
-                    params.append(json.dumps(value))
-            
+            # Shared filter WHERE builder, then sorting/pagination on top
+            filter_parts, params = self._build_filter_clauses(query)
+            sql_parts = ["SELECT * FROM artifacts WHERE 1=1"] + filter_parts
+
             # Add sorting
             valid_sort_fields = {"created_at", "size_bytes", "last_accessed", "access_count"}
             sort_field = query.sort_by if query.sort_by in valid_sort_fields else "created_at"
             sort_order = "DESC" if query.sort_order.lower() == "desc" else "ASC"
-            sql_parts.append(f"ORDER BY {sort_field} {sort_order}")
-            
-            # Add pagination
-            sql_parts.append("LIMIT ? OFFSET ?")
-            params.extend([query.limit, query.offset])
+
+            # Keyset pagination: resume after the cursor row instead of
+            # scanning and discarding OFFSET rows. Only the created_at sort
+            # has a stable keyset; other sorts page from the top.
+            if query.cursor and sort_field == "created_at":
+                cursor_created_at, cursor_artifact_id = decode_artifact_cursor(query.cursor)  # epoch micros
+                comparator = "<" if sort_order == "DESC" else ">"
+                sql_parts.append(f"AND (created_at, artifact_id) {comparator} (?, ?)")
+                params.extend([cursor_created_at, cursor_artifact_id])
+
+            sql_parts.append(f"ORDER BY {sort_field} {sort_order}, artifact_id {sort_order}")
+            sql_parts.append("LIMIT ?")
+            params.append(query.limit)
             
             # Execute query
             async with get_db() as db:
@@ -325,7 +595,7 @@ class ArtifactLedger:
                     (
                         json.dumps(updated_meta.tags),
                         json.dumps(updated_meta.access_control),
-                        updated_meta.expires_at.isoformat() if updated_meta.expires_at else None,
+                        _dt_to_micros(updated_meta.expires_at) if updated_meta.expires_at else None,
                         artifact_id
                     )
                 )
@@ -360,16 +630,21 @@ class ArtifactLedger:
         """Deletes an artifact with audit logging."""
         try:
             async with get_db() as db:
-                # Check if artifact exists
-                exists = await db.fetch_val(
-                    "SELECT 1 FROM artifacts WHERE artifact_id = ?",
+                # Fuse existence check + delete into one statement (SQLite 3.35+)
+                deleted = await db.fetch_one(
+                    """
+                    DELETE FROM artifacts WHERE artifact_id = ?
+                    RETURNING artifact_id, originator, mime_type, size_bytes
+                    """,
                     (artifact_id,)
                 )
-                
-                if not exists:
+
+                if not deleted:
                     return False
-                
-                # Record audit entry before deletion
+
+                await self._bump_counters(db, deleted[1], deleted[2], deleted[3], -1)
+
+                # Record audit entry
                 await db.execute(
                     """
                     INSERT INTO artifact_audit (artifact_id, action, changed_by, changes, timestamp)
@@ -383,32 +658,131 @@ class ArtifactLedger:
                         datetime.now(timezone.utc).isoformat()
                     )
                 )
-                
-                # Delete artifact
-                await db.execute(
-                    "DELETE FROM artifacts WHERE artifact_id = ?",
-                    (artifact_id,)
-                )
-                
+
                 # Invalidate cache
                 await self._invalidate_cache(artifact_id)
-                
+
                 logger.info(f"Deleted artifact {artifact_id} from ledger")
                 return True
-                
+
         except Exception as e:
             logger.error(f"Failed to delete artifact {artifact_id}: {e}")
             raise LedgerError(f"Delete failed: {str(e)}")
+
+    @transactional
+    async def delete_artifacts_bulk(self, artifact_ids: List[str], deleted_by: str = "system") -> int:
+        """Deletes a batch of artifacts in a single transaction with audit logging.
+
+        Used by expiry sweeps where per-artifact transactions would cost
+        O(N) round-trips; the audit inserts and deletes are vectorized
+        with executemany.
+        """
+        if not artifact_ids:
+            return 0
+
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            changes = json.dumps({"deleted_by": deleted_by})
+
+            async with get_db() as db:
+                await db.executemany(
+                    """
+                    INSERT INTO artifact_audit (artifact_id, action, changed_by, changes, timestamp)
+                    VALUES (?, 'DELETE', ?, ?, ?)
+                    """,
+                    [(artifact_id, deleted_by, changes, now) for artifact_id in artifact_ids]
+                )
+
+                # Grab counter dimensions before the rows disappear
+                placeholders = ",".join("?" * len(artifact_ids))
+                rows = await db.fetch_all(
+                    f"SELECT originator, mime_type, size_bytes FROM artifacts WHERE artifact_id IN ({placeholders})",
+                    artifact_ids
+                )
+
+                await db.executemany(
+                    "DELETE FROM artifacts WHERE artifact_id = ?",
+                    [(artifact_id,) for artifact_id in artifact_ids]
+                )
+
+                for originator, mime_type, size_bytes in rows:
+                    await self._bump_counters(db, originator, mime_type, size_bytes, -1)
+
+                for artifact_id in artifact_ids:
+                    await self._invalidate_cache(artifact_id)
+
+                logger.info(f"Bulk deleted {len(artifact_ids)} artifacts from ledger")
+                return len(artifact_ids)
+
+        except Exception as e:
+            logger.error(f"Bulk delete of {len(artifact_ids)} artifacts failed: {e}")
+            raise LedgerError(f"Bulk delete failed: {str(e)}")
     
+    @transactional
+    async def delete_expired_returning(self, deleted_by: str = "system") -> List[Tuple]:
+        """Deletes every expired artifact in one statement and returns the rows.
+
+        Each returned row is (artifact_id, originator, size_bytes, mime_type,
+        storage_path) so the caller can unlink storage and settle usage
+        counters without re-fetching metadata per artifact.
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            async with get_db() as db:
+                rows = await db.fetch_all(
+                    """
+                    DELETE FROM artifacts
+                    WHERE expires_at IS NOT NULL AND expires_at < ?
+                    RETURNING artifact_id, originator, size_bytes, mime_type, storage_path
+                    """,
+                    (_dt_to_micros(now),)
+                )
+
+                if not rows:
+                    return []
+
+                changes = json.dumps({"deleted_by": deleted_by, "reason": "expired"})
+                now_iso = now.isoformat()
+                await db.executemany(
+                    """
+                    INSERT INTO artifact_audit (artifact_id, action, changed_by, changes, timestamp)
+                    VALUES (?, 'DELETE', ?, ?, ?)
+                    """,
+                    [(row[0], deleted_by, changes, now_iso) for row in rows]
+                )
+
+                for row in rows:
+                    await self._bump_counters(db, row[1], row[3], row[2], -1)
+
+            # One pipelined round-trip invalidates every cached entry
+            if self._redis_client:
+                try:
+                    async with self._redis_client.pipeline(transaction=False) as pipe:
+                        for row in rows:
+                            pipe.delete(f"artifact:{row[0]}:meta")
+                        pipe.delete("artifact_stats")
+                        await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"Cache invalidation after expiry sweep failed: {e}")
+
+            logger.info(f"Expiry sweep deleted {len(rows)} artifacts from ledger")
+            return rows
+
+        except Exception as e:
+            logger.error(f"Expiry sweep failed: {e}")
+            raise LedgerError(f"Expiry sweep failed: {str(e)}")
+
     async def get_expired_artifacts(self) -> List[str]:
         """Gets a list of expired artifact IDs."""
         try:
             async with get_db() as db:
                 rows = await db.fetch_all(
-                    "SELECT artifact_id FROM artifacts WHERE expires_at IS NOT NULL AND expires_at < ?",
-                    (datetime.now(timezone.utc).isoformat(),)
+                    SQL_EXPIRED_ARTIFACT_IDS,
+                    (_dt_to_micros(datetime.now(timezone.utc)),)
                 )
-                return [row[0] for row in rows]
+                # itemgetter keeps the column extraction in C instead of a
+                # per-row Python subscript
+                return list(map(itemgetter(0), rows))
         except Exception as e:
             logger.error(f"Failed to get expired artifacts: {e}")
             return []
@@ -420,43 +794,42 @@ class ArtifactLedger:
             try:
                 cached_stats = await self._redis_client.get("artifact_stats")
                 if cached_stats:
-                    return ArtifactStats(**json.loads(cached_stats))
+                    return ArtifactStats.model_validate_json(cached_stats)
             except Exception:
                 pass
         
         try:
             async with get_db() as db:
-                # Get basic stats
-                total_artifacts = await db.fetch_val("SELECT COUNT(*) FROM artifacts")
-                total_size = await db.fetch_val("SELECT COALESCE(SUM(size_bytes), 0) FROM artifacts")
-                
-                # Get originator distribution
-                originator_stats = {}
-                rows = await db.fetch_all(
-                    "SELECT originator, COUNT(*) as count FROM artifacts GROUP BY originator"
+                # Counts and sizes come from the running counters — no table scan
+                counter_rows = await db.fetch_all(
+                    "SELECT key, count, size_bytes FROM artifact_counters"
                 )
-                for row in rows:
-                    originator_stats[row[0]] = row[1]
-                
-                # Get MIME type distribution
-                mime_stats = {}
-                rows = await db.fetch_all(
-                    "SELECT mime_type, COUNT(*) as count FROM artifacts WHERE mime_type IS NOT NULL GROUP BY mime_type"
+                counters = {row[0]: (row[1], row[2]) for row in counter_rows}
+
+                total_artifacts, total_size = counters.get("_total", (0, 0))
+                originator_stats = {
+                    key[len("orig:"):]: count
+                    for key, (count, _) in counters.items()
+                    if key.startswith("orig:") and count > 0
+                }
+                mime_stats = {
+                    key[len("mime:"):]: count
+                    for key, (count, _) in counters.items()
+                    if key.startswith("mime:") and count > 0
+                }
+
+                # Time bounds resolve via the created_at index, not a scan
+                oldest, newest = await db.fetch_one(
+                    "SELECT MIN(created_at), MAX(created_at) FROM artifacts"
                 )
-                for row in rows:
-                    mime_stats[row[0]] = row[1]
-                
-                # Get time bounds
-                oldest = await db.fetch_val("SELECT MIN(created_at) FROM artifacts")
-                newest = await db.fetch_val("SELECT MAX(created_at) FROM artifacts")
-                
+
                 stats = ArtifactStats(
                     total_artifacts=total_artifacts,
                     total_size_bytes=total_size,
                     artifacts_by_originator=originator_stats,
                     artifacts_by_mime_type=mime_stats,
-                    oldest_artifact=datetime.fromisoformat(oldest) if oldest else None,
-                    newest_artifact=datetime.fromisoformat(newest) if newest else None
+                    oldest_artifact=_micros_to_dt(oldest) if oldest else None,
+                    newest_artifact=_micros_to_dt(newest) if newest else None
                 )
                 
                 # Cache stats
@@ -464,7 +837,7 @@ class ArtifactLedger:
                     await self._redis_client.setex(
                         "artifact_stats",
                         self._stats_cache_ttl,
-                        json.dumps(stats.model_dump())
+                        stats.model_dump_json()
                     )
                 
                 return stats
@@ -477,14 +850,35 @@ class ArtifactLedger:
         """Get metadata from Redis cache."""
         if not self._redis_client:
             return None
-        
+
         try:
             cached = await self._redis_client.get(f"artifact:{artifact_id}:meta")
             if cached:
-                return ArtifactMetadata(**json.loads(cached))
+                return _metadata_from_trusted(json.loads(cached))
         except Exception as e:
             logger.warning(f"Cache read failed for {artifact_id}: {e}")
         return None
+
+    async def _mget_metadata(self, artifact_ids: List[str]) -> List[Optional[ArtifactMetadata]]:
+        """Fetch cached metadata for many artifacts in a single pipelined round-trip.
+
+        Returns a list aligned with artifact_ids; cache misses are None.
+        """
+        if not self._redis_client or not artifact_ids:
+            return [None] * len(artifact_ids)
+
+        try:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for artifact_id in artifact_ids:
+                    pipe.get(f"artifact:{artifact_id}:meta")
+                cached_blobs = await pipe.execute()
+            return [
+                _metadata_from_trusted(json.loads(blob)) if blob else None
+                for blob in cached_blobs
+            ]
+        except Exception as e:
+            logger.warning(f"Bulk cache read failed for {len(artifact_ids)} artifacts: {e}")
+            return [None] * len(artifact_ids)
     
     async def _cache_metadata(self, artifact_id: str, metadata: ArtifactMetadata):
         """Cache metadata in Redis."""
@@ -495,7 +889,7 @@ class ArtifactLedger:
             await self._redis_client.setex(
                 f"artifact:{artifact_id}:meta",
                 self._cache_ttl,
-                json.dumps(metadata.model_dump())
+                metadata.model_dump_json()
             )
         except Exception as e:
             logger.warning(f"Cache write failed for {artifact_id}: {e}")
@@ -506,8 +900,11 @@ class ArtifactLedger:
             return
         
         try:
-            await self._redis_client.delete(f"artifact:{artifact_id}:meta")
-            await self._redis_client.delete("artifact_stats")  # Invalidate stats cache too
+            # Both DELs travel in one pipelined round-trip
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(f"artifact:{artifact_id}:meta")
+                pipe.delete("artifact_stats")  # Invalidate stats cache too
+                await pipe.execute()
         except Exception as e:
             logger.warning(f"Cache invalidation failed for {artifact_id}: {e}")
     
@@ -519,8 +916,8 @@ class ArtifactLedger:
             size_bytes=row["size_bytes"],
             sha256_hash=row["sha256_hash"],
             mime_type=row["mime_type"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            expires_at=datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None,
+            created_at=_micros_to_dt(row["created_at"]),
+            expires_at=_micros_to_dt(row["expires_at"]) if row["expires_at"] else None,
             tags=json.loads(row["tags"]),
             access_control=json.loads(row["access_control"]),
             version=row["version"],
@@ -1,6 +1,7 @@
 # src/main.py
 
 import os
+import uvloop
 import uvicorn
 import logging
 import signal
@@ -23,6 +24,11 @@ from common.smp_signature import generate_smp_signature
 from common.metrics import metrics_middleware, setup_metrics
 from common.rate_limiting import RateLimiter, RateLimitMiddleware
 
+# Install the libuv-backed event loop before anything creates a loop: the
+# workload is almost entirely network-bound async IO, where uvloop roughly
+# halves per-task scheduling overhead.
+uvloop.install()
+
 # Get logger
 logger = get_logger(__name__)
 
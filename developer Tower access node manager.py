@@ -1,21 +1,46 @@
 import asyncio
 import hashlib
+import heapq
 import json
+import mmap
 import os
+import shutil
+import time
 from typing import Dict, Any, AsyncGenerator, Optional, List, Tuple
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, validator
 from fastapi import Depends, HTTPException, status, UploadFile
 from aiofiles import open as async_open
+from aiofiles.os import remove as async_remove
 
 from common.utils import get_logger, compute_sha256, generate_uuid, format_timestamp
 from artifact.storage import ArtifactStorage, StorageError, StorageConfig
-from artifact.ledger import ArtifactLedger, LedgerError
+from artifact.ledger import ArtifactLedger, LedgerError, ArtifactQuery as LedgerArtifactQuery
 from common.redis_client import get_redis_client
 from common.rate_limiting import rate_limit, RateLimitExceededError
 
 logger = get_logger(__name__)
 
+# Atomically reserves quota: increments usage and rolls back in the same
+# round-trip if the new total would exceed the cap. Returns -1 on rejection.
+QUOTA_RESERVE_SCRIPT = """
+local n = redis.call('INCRBY', KEYS[1], ARGV[1])
+if n > tonumber(ARGV[2]) then
+    redis.call('DECRBY', KEYS[1], ARGV[1])
+    return -1
+end
+return n
+"""
+
+STORAGE_QUOTA_BYTES = 1024 * 1024 * 1024  # 1GB per originator
+
+# Uploads up to this size stay in memory and skip the temp-file round-trip
+SMALL_UPLOAD_LIMIT = 8 * 1024 * 1024  # 8MB
+
+# Sweep fallback when nothing is scheduled, covering expiries recorded by
+# other processes
+EXPIRY_FALLBACK_INTERVAL = 3600
+
 # --- Pydantic Models ---
 class ArtifactMetadata(BaseModel):
     artifact_id: str = Field(..., description="Unique ID of the artifact")
@@ -63,7 +88,21 @@ class ArtifactQuery(BaseModel):
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
     limit: int = Field(100, ge=1, le=1000)
-    offset: int = Field(0, ge=0)
+    cursor: Optional[str] = Field(None, description="Keyset cursor from a previous page")
+
+def _metadata_from_cache(blob: bytes) -> ArtifactMetadata:
+    """Rehydrate a cached metadata blob without re-running field validation.
+
+    The blob came from model_dump_json on an already-validated instance, so
+    model_construct skips the validators; only the datetime fields need
+    manual conversion back from their JSON string form.
+    """
+    data = json.loads(blob)
+    if data.get("created_at"):
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+    if data.get("expires_at"):
+        data["expires_at"] = datetime.fromisoformat(data["expires_at"])
+    return ArtifactMetadata.model_construct(**data)
 
 # --- Artifact Manager ---
 class ArtifactManager:
@@ -71,33 +110,35 @@ class ArtifactManager:
         self._storage = storage
         self._ledger = ledger
         self._redis_client = None
-        self._upload_locks: Dict[str, asyncio.Lock] = {}
-        self._lock = asyncio.Lock()
-    
+        self._quota_script = None
+        # Min-heap of expiry epochs plus a wake event: the cleanup task
+        # sleeps exactly until the earliest scheduled expiry instead of
+        # polling on a fixed interval.
+        self._expiry_heap: List[float] = []
+        self._expiry_wake = asyncio.Event()
+
     async def initialize(self):
         try:
             self._redis_client = await get_redis_client()
+            self._quota_script = self._redis_client.register_script(QUOTA_RESERVE_SCRIPT)
             logger.info("Artifact manager initialized with Redis support")
         except Exception as e:
             logger.warning(f"Redis initialization failed: {e}. Continuing without Redis caching.")
     
-    def _get_upload_lock(self, artifact_id: str) -> asyncio.Lock:
-        async with self._lock:
-            if artifact_id not in self._upload_locks:
-                self._upload_locks[artifact_id] = asyncio.Lock()
-            return self._upload_locks[artifact_id]
-    
-    async def _cleanup_upload_lock(self, artifact_id: str):
-        async with self._lock:
-            if artifact_id in self._upload_locks:
-                del self._upload_locks[artifact_id]
-    
     async def _check_upload_quota(self, originator: str, file_size: int) -> None:
+        """Atomically reserve quota for an upload in a single Redis round-trip.
+
+        On success the usage counter has already been incremented, so the
+        caller must not add the size again.
+        """
         try:
             await rate_limit(f"upload:{originator}", requests_per_minute=10)
-            async with get_redis_client() as redis:
-                current_usage = await redis.get(f"storage_usage:{originator}") or 0
-                if int(current_usage) + file_size > 1024 * 1024 * 1024:  # 1GB
+            if self._quota_script:
+                new_usage = await self._quota_script(
+                    keys=[f"storage_usage:{originator}"],
+                    args=[file_size, STORAGE_QUOTA_BYTES]
+                )
+                if int(new_usage) < 0:
                     raise RateLimitExceededError("Storage quota exceeded")
         except RateLimitExceededError as e:
             logger.warning(f"Upload quota exceeded for {originator}: {e}")
@@ -124,84 +165,150 @@ class ArtifactManager:
         expires_at: Optional[datetime] = None,
         access_control: Optional[Dict[str, List[str]]] = None
     ) -> ArtifactUploadResult:
+        # artifact_id is a fresh UUID, so no concurrent uploader can target the
+        # same id — per-artifact locking here was pure overhead.
         artifact_id = generate_uuid()
-        upload_lock = self._get_upload_lock(artifact_id)
-        
-        async with upload_lock:
-            logger.info(f"Starting upload for artifact '{artifact_id}' from '{originator}'")
-            temp_path = os.path.join(self._storage.config.base_path, f"temp_{artifact_id}")
-            hasher = hashlib.sha256()
-            total_size = 0
-            
+        logger.info(f"Starting upload for artifact '{artifact_id}' from '{originator}'")
+        temp_path = os.path.join(self._storage.config.base_path, f"temp_{artifact_id}")
+        total_size = 0
+        quota_reserved = False
+
+        try:
+            buffer = bytearray()
+            spilled = False
+
+            # Starlette spools uploads to a temp file once they exceed its
+            # in-memory threshold, so a large payload is already on disk and
+            # we can learn its size with a seek instead of streaming it.
+            size_hint = None
             try:
-                # Stream to temporary file and compute hash
-                async with async_open(temp_path, "wb") as temp_file:
+                file.file.seek(0, os.SEEK_END)
+                size_hint = file.file.tell()
+                file.file.seek(0)
+            except (AttributeError, OSError, ValueError):
+                size_hint = None
+
+            if size_hint is not None and size_hint > SMALL_UPLOAD_LIMIT:
+                # Large path: one worker thread does the whole copy+digest —
+                # copyfileobj moves 1 MiB blocks with no event-loop round-trips
+                # and the mmap pass hands sha256 a single contiguous buffer.
+                if size_hint > 100 * 1024 * 1024:
+                    raise StorageError("File size exceeds 100MB limit")
+                total_size = size_hint
+                sha256_hash = await asyncio.to_thread(
+                    self._copy_and_hash, file.file, temp_path
+                )
+                spilled = True
+            else:
+                # Small uploads accumulate in memory and are handed to storage
+                # in one write; if the size hint was unavailable and the stream
+                # crosses SMALL_UPLOAD_LIMIT we spill what is buffered to the
+                # temp file and keep streaming. 1 MiB chunks cut the syscall
+                # count ~128x vs 8 KiB, and hashing in a thread lets the next
+                # read/write overlap with the (OpenSSL SHA-NI) digest work.
+                hasher = hashlib.sha256()
+                spill_file = None
+                try:
                     while True:
-                        chunk = await file.read(8192)
+                        chunk = await file.read(1 << 20)
                         if not chunk:
                             break
                         total_size += len(chunk)
-                        hasher.update(chunk)
-                        await temp_file.write(chunk)
                         if total_size > 100 * 1024 * 1024:
                             raise StorageError("File size exceeds 100MB limit")
-                
+                        await asyncio.to_thread(hasher.update, chunk)
+                        if spill_file is None and total_size > SMALL_UPLOAD_LIMIT:
+                            spill_file = await async_open(temp_path, "wb")
+                            await spill_file.write(bytes(buffer))
+                            buffer.clear()
+                        if spill_file is not None:
+                            await spill_file.write(chunk)
+                        else:
+                            buffer += chunk
+                finally:
+                    if spill_file is not None:
+                        await spill_file.close()
+
                 sha256_hash = hasher.hexdigest()
-                await self._check_upload_quota(originator, total_size)
-                
-                # Move to permanent storage
+                spilled = spill_file is not None
+
+            await self._check_upload_quota(originator, total_size)
+            quota_reserved = True
+
+            # Move to permanent storage
+            if spilled:
                 storage_path = await self._storage.save_file(artifact_id, temp_path)
-                
-                # Create metadata
-                metadata = ArtifactMetadata(
-                    artifact_id=artifact_id,
-                    originator=originator,
-                    size_bytes=total_size,
-                    sha256_hash=sha256_hash,
-                    mime_type=mime_type or file.content_type,
-                    expires_at=expires_at,
-                    tags=tags or {},
-                    access_control=access_control or {"read": [], "write": []}
-                )
-                
-                # Record in ledger
-                await self._ledger.record_artifact(metadata)
-                
-                # Update storage usage
-                await self._update_storage_usage(originator, total_size, "add")
-                
-                # Cache metadata in Redis
-                if self._redis_client:
-                    await self._redis_client.setex(
-                        f"artifact_meta:{artifact_id}",
-                        3600,
-                        json.dumps(metadata.model_dump())
-                    )
-                
-                logger.info(f"Successfully uploaded artifact '{artifact_id}', size: {total_size} bytes")
-                return ArtifactUploadResult(
-                    artifact_id=artifact_id,
-                    size_bytes=total_size,
-                    sha256_hash=sha256_hash,
-                    storage_path=storage_path
+            else:
+                storage_path = await self._storage.save_bytes(artifact_id, bytes(buffer))
+
+            # Create metadata
+            metadata = ArtifactMetadata(
+                artifact_id=artifact_id,
+                originator=originator,
+                size_bytes=total_size,
+                sha256_hash=sha256_hash,
+                mime_type=mime_type or file.content_type,
+                expires_at=expires_at,
+                tags=tags or {},
+                access_control=access_control or {"read": [], "write": []}
+            )
+
+            # Record in ledger (_check_upload_quota already reserved the usage)
+            await self._ledger.record_artifact(metadata)
+
+            if expires_at:
+                self._schedule_expiry(expires_at)
+
+            # Cache metadata in Redis
+            if self._redis_client:
+                await self._redis_client.setex(
+                    f"artifact_meta:{artifact_id}",
+                    3600,
+                    metadata.model_dump_json()
                 )
-                
-            except (StorageError, LedgerError, RateLimitExceededError) as e:
-                await self._cleanup_artifact(artifact_id)
-                logger.error(f"Upload failed for artifact '{artifact_id}': {e}")
-                raise
-            except Exception as e:
-                await self._cleanup_artifact(artifact_id)
-                logger.error(f"Unexpected error during upload for '{artifact_id}': {e}")
-                raise StorageError(f"Upload failed: {str(e)}")
-            finally:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                await self._cleanup_upload_lock(artifact_id)
+
+            logger.info(f"Successfully uploaded artifact '{artifact_id}', size: {total_size} bytes")
+            return ArtifactUploadResult(
+                artifact_id=artifact_id,
+                size_bytes=total_size,
+                sha256_hash=sha256_hash,
+                storage_path=storage_path
+            )
+
+        except (StorageError, LedgerError, RateLimitExceededError) as e:
+            await self._rollback_failed_upload(artifact_id, originator, total_size, quota_reserved)
+            logger.error(f"Upload failed for artifact '{artifact_id}': {e}")
+            raise
+        except Exception as e:
+            await self._rollback_failed_upload(artifact_id, originator, total_size, quota_reserved)
+            logger.error(f"Unexpected error during upload for '{artifact_id}': {e}")
+            raise StorageError(f"Upload failed: {str(e)}")
+        finally:
+            # Async unlink keeps the blocking syscall off the event loop;
+            # FileNotFoundError doubles as the existence check.
+            try:
+                await async_remove(temp_path)
+            except FileNotFoundError:
+                pass
     
+    @staticmethod
+    def _copy_and_hash(src, temp_path: str) -> str:
+        """Copy a spooled upload to temp_path and hash it via mmap.
+
+        Runs in a worker thread. An empty copy cannot be mmapped, but the
+        large path only runs above SMALL_UPLOAD_LIMIT so that never occurs.
+        """
+        with open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+        hasher = hashlib.sha256()
+        with open(temp_path, "rb") as copied:
+            with mmap.mmap(copied.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        return hasher.hexdigest()
+
     async def download_artifact(
-        self, 
-        artifact_id: str, 
+        self,
+        artifact_id: str,
         requester: Optional[str] = None
     ) -> ArtifactDownloadResult:
         try:
@@ -231,12 +338,16 @@ class ArtifactManager:
             logger.error(f"Unexpected error during download for '{artifact_id}': {e}")
             raise StorageError(f"Download failed: {str(e)}")
     
+    def artifact_local_path(self, artifact_id: str) -> Optional[str]:
+        """On-disk path of an artifact for zero-copy downloads, if present."""
+        return self._storage.local_path(artifact_id)
+
     async def get_artifact_metadata(self, artifact_id: str) -> Optional[ArtifactMetadata]:
         if self._redis_client:
             try:
                 cached_meta = await self._redis_client.get(f"artifact_meta:{artifact_id}")
                 if cached_meta:
-                    return ArtifactMetadata(**json.loads(cached_meta))
+                    return _metadata_from_cache(cached_meta)
             except Exception as e:
                 logger.warning(f"Redis cache read failed for {artifact_id}: {e}")
         
@@ -246,7 +357,7 @@ class ArtifactManager:
                 await self._redis_client.setex(
                     f"artifact_meta:{artifact_id}",
                     3600,
-                    json.dumps(metadata.model_dump())
+                    metadata.model_dump_json()
                 )
             return metadata
         except LedgerError as e:
@@ -261,12 +372,27 @@ class ArtifactManager:
                 created_after=query.created_after,
                 created_before=query.created_before,
                 limit=query.limit,
-                offset=query.offset
+                cursor=query.cursor
             )
         except LedgerError as e:
             logger.error(f"Artifact query failed: {e}")
             return []
-    
+
+    async def count_artifacts(self, query: ArtifactQuery) -> int:
+        """Counts matching artifacts without materializing any rows."""
+        try:
+            return await self._ledger.count_artifacts(
+                LedgerArtifactQuery(
+                    originator=query.originator,
+                    tags=query.tags,
+                    created_after=query.created_after,
+                    created_before=query.created_before,
+                )
+            )
+        except LedgerError as e:
+            logger.error(f"Artifact count failed: {e}")
+            return 0
+
     async def delete_artifact(self, artifact_id: str, requester: str) -> bool:
         try:
             metadata = await self.get_artifact_metadata(artifact_id)
@@ -296,6 +422,24 @@ class ArtifactManager:
         allowed_users = metadata.access_control.get(permission, [])
         return requester in allowed_users
     
+    def _schedule_expiry(self, expires_at: datetime) -> None:
+        """Registers an expiry with the sweeper so it wakes exactly on time."""
+        heapq.heappush(self._expiry_heap, expires_at.timestamp())
+        self._expiry_wake.set()
+
+    async def _rollback_failed_upload(
+        self, artifact_id: str, originator: str, total_size: int, quota_reserved: bool
+    ) -> None:
+        """Undo the side effects of an upload that failed partway.
+
+        The quota script reserves usage before the artifact is stored, so a
+        failure after that point must DECRBY the reservation or every
+        failed upload permanently burns quota until the key's TTL.
+        """
+        await self._cleanup_artifact(artifact_id)
+        if quota_reserved and total_size:
+            await self._update_storage_usage(originator, total_size, "remove")
+
     async def _cleanup_artifact(self, artifact_id: str):
         try:
             await self._storage.delete_artifact(artifact_id)
@@ -305,10 +449,26 @@ class ArtifactManager:
     
     async def cleanup_expired_artifacts(self):
         try:
-            expired_artifacts = await self._ledger.get_expired_artifacts()
-            for artifact_id in expired_artifacts:
-                await self.delete_artifact(artifact_id, "system")
-            logger.info(f"Cleaned up {len(expired_artifacts)} expired artifacts")
+            # One DELETE ... RETURNING replaces the per-artifact fetch/check/
+            # delete loop; system cleanup is privileged so no per-row ACLs.
+            expired = await self._ledger.delete_expired_returning()
+            if not expired:
+                logger.info("Cleaned up 0 expired artifacts")
+                return
+
+            await asyncio.gather(
+                *[self._storage.delete_artifact(row[0]) for row in expired],
+                return_exceptions=True
+            )
+
+            if self._redis_client:
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for artifact_id, originator, size_bytes, _, _ in expired:
+                        pipe.delete(f"artifact_meta:{artifact_id}")
+                        pipe.decrby(f"storage_usage:{originator}", size_bytes)
+                    await pipe.execute()
+
+            logger.info(f"Cleaned up {len(expired)} expired artifacts")
         except Exception as e:
             logger.error(f"Expired artifact cleanup failed: {e}")
 
@@ -344,10 +504,43 @@ async def validate_artifact_access(
     return metadata
 
 async def start_artifact_cleanup_task(manager: ArtifactManager):
+    """Event-driven expiry sweeper.
+
+    Sleeps exactly until the next scheduled expiry instead of waking every
+    hour regardless of whether anything is due; uploads with an expiry push
+    onto the manager's heap and set the wake event, which re-plans the
+    sleep. The fallback interval still covers expiries recorded elsewhere.
+    """
+    # The heap is in-memory and starts empty, so sweep once up front:
+    # anything that expired while the process was down (or was recorded
+    # by another writer) must not stay downloadable until the fallback
+    # interval elapses.
+    try:
+        await manager.cleanup_expired_artifacts()
+    except Exception as e:
+        logger.error(f"Initial artifact cleanup sweep failed: {e}")
+
     while True:
         try:
+            manager._expiry_wake.clear()
+            now = time.time()
+            if manager._expiry_heap:
+                delay = manager._expiry_heap[0] - now
+            else:
+                delay = EXPIRY_FALLBACK_INTERVAL
+
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(manager._expiry_wake.wait(), timeout=delay)
+                    continue  # new (possibly earlier) expiry arrived; re-plan
+                except asyncio.TimeoutError:
+                    pass
+
+            # Drop due heap entries; the bulk sweep deletes them all at once
+            now = time.time()
+            while manager._expiry_heap and manager._expiry_heap[0] <= now:
+                heapq.heappop(manager._expiry_heap)
             await manager.cleanup_expired_artifacts()
-            await asyncio.sleep(3600)
         except Exception as e:
             logger.error(f"Artifact cleanup task failed: {e}")
-            await asyncio.sleep(300)
\ No newline at end of file
+            await asyncio.sleep(300)
@@ -2,16 +2,24 @@
 
 import aiohttp
 import asyncio
-import json
+import hashlib
+import orjson
+from cachetools import TTLCache
 from typing import Dict, Any, Optional, Callable, Awaitable, Union, AsyncGenerator
 from pydantic import BaseModel
 from common.utils import get_logger
 from common.config import get_config
 from aiohttp import ClientResponse
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type, wait_exponential
+from tenacity import retry, stop_after_attempt, retry_if_exception, wait_random_exponential
 
 logger = get_logger(__name__)
 
+# Upstream statuses that are safe and worthwhile to retry
+TRANSIENT_STATUS_CODES = {429, 502, 503, 504}
+
+# How many streamed token deltas to coalesce per yielded chunk event
+STREAM_BATCH_SIZE = 8
+
 class AIProxyError(Exception):
     """Custom exception for AI proxy errors."""
     def __init__(self, message: str, status_code: Optional[int] = None, error_data: Optional[Dict] = None):
@@ -19,6 +27,35 @@ class AIProxyError(Exception):
         self.status_code = status_code
         self.error_data = error_data or {}
 
+class RateLimitedError(AIProxyError):
+    """Raised on HTTP 429; carries the upstream Retry-After hint if present."""
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 429,
+        error_data: Optional[Dict] = None,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message, status_code=status_code, error_data=error_data)
+        self.retry_after = retry_after
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Retry predicate: network failures plus retryable upstream statuses."""
+    if isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError)):
+        return True
+    return isinstance(exc, AIProxyError) and exc.status_code in TRANSIENT_STATUS_CODES
+
+# Full-jitter backoff desynchronizes concurrent retriers so a burst of 429/5xx
+# responses doesn't hammer the provider at identical backoff boundaries. When
+# the upstream told us how long to wait, believe it instead.
+_jittered_wait = wait_random_exponential(multiplier=1, max=30)
+
+def _wait_with_retry_after(retry_state) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitedError) and exc.retry_after:
+        return exc.retry_after
+    return _jittered_wait(retry_state)
+
 class ProxyResponse(BaseModel):
     """Standardized AI response wrapper."""
     model: str
@@ -30,17 +67,26 @@ class RetryingSession:
     """A wrapper around aiohttp.ClientSession with built-in retries."""
     def __init__(self, session: aiohttp.ClientSession):
         self._session = session
-    
+
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(aiohttp.ClientError)
+        wait=_wait_with_retry_after,
+        retry=retry_if_exception(_is_transient_error)
     )
     async def post(self, *args, **kwargs):
         return await self._session.post(*args, **kwargs)
-        
-    def __getattr__(self, name):
-        return getattr(self._session, name)
+
+    # Explicit forwarders instead of __getattr__: each access is one
+    # attribute load rather than an attribute miss plus a dynamic getattr.
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def close(self) -> None:
+        await self._session.close()
 
 class AIProxy:
     """
@@ -56,12 +102,25 @@ class AIProxy:
         
         self._handlers: Dict[str, Callable[..., Awaitable[ProxyResponse]]] = {}
         self._stream_handlers: Dict[str, Callable[..., AsyncGenerator[Dict[str, Any], None]]] = {}
+        # Memoized model -> handler resolutions, so the hot path skips the
+        # provider split and second lookup after the first call per model
+        self._handler_cache: Dict[str, Callable] = {}
+        self._stream_handler_cache: Dict[str, Callable] = {}
+        # Single-flight bookkeeping: identical concurrent queries share one
+        # upstream call, and recent responses are served from a short TTL
+        # cache. Streaming queries are never cached.
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        self._response_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
 
         # Register built-in handlers
         self.register_handler("openai", self._query_openai_standard)
         self.register_stream_handler("openai", self._query_openai_stream)
         self.register_handler("custom/local_llama", self._query_local_llama)
 
+        # Pre-warm the caches for the default model
+        self._resolve_handler(self.default_model, is_stream=False)
+        self._resolve_handler(self.default_model, is_stream=True)
+
         logger.info(f"AIProxy initialized. Default model: {self.default_model}")
 
     async def __aenter__(self):
@@ -74,7 +133,32 @@ class AIProxy:
     async def _ensure_session(self):
         """Ensures the aiohttp session is active and not closed."""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # A warm keep-alive pool avoids a fresh TCP+TLS handshake per
+            # call and the DNS cache skips a lookup per connection; aiohttp
+            # already sets TCP_NODELAY on its sockets, so the small JSON
+            # POSTs this proxy makes are not Nagle-delayed.
+            connector = aiohttp.TCPConnector(
+                # aiodns resolver keeps getaddrinfo off the thread pool
+                resolver=aiohttp.AsyncResolver(),
+                limit=200,
+                limit_per_host=64,
+                keepalive_timeout=120,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            # Hoist the constant headers so handlers skip a dict build per call
+            headers = {"Content-Type": "application/json"}
+            api_key = self.api_keys.get("openai")
+            if api_key:
+                headers["Authorization"] = f"Bearer {api_key}"
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30),
+                headers=headers,
+                # SSE deltas arrive as many tiny flushes; a 128 KiB read
+                # buffer drains a batch of events per syscall instead of one
+                read_bufsize=2 ** 17
+            )
             self.retrying_session = RetryingSession(self.session)
 
     async def close(self):
@@ -86,18 +170,31 @@ class AIProxy:
     def register_handler(self, name: str, handler: Callable[..., Awaitable[ProxyResponse]]):
         """Register a new standard handler for a model/provider."""
         self._handlers[name] = handler
+        self._handler_cache.clear()
 
     def register_stream_handler(self, name: str, handler: Callable[..., AsyncGenerator[Dict[str, Any], None]]):
         """Register a new stream handler for a model/provider."""
         self._stream_handlers[name] = handler
+        self._stream_handler_cache.clear()
 
     def _resolve_handler(self, model: str, is_stream: bool = False) -> Optional[Callable]:
-        """Resolves a model name to its specific handler, with fallback to provider."""
+        """Resolves a model name to its specific handler, with fallback to provider.
+
+        Resolutions are memoized per model; registering a handler clears the
+        caches so re-registration takes effect.
+        """
+        cache = self._stream_handler_cache if is_stream else self._handler_cache
+        handler = cache.get(model)
+        if handler is not None:
+            return handler
+
         table = self._stream_handlers if is_stream else self._handlers
         handler = table.get(model)
         if not handler:
             provider = model.split('/')[0]
             handler = table.get(provider)
+        if handler is not None:
+            cache[model] = handler
         return handler
 
     async def _handle_response_errors(self, response: ClientResponse) -> Dict[str, Any]:
@@ -107,11 +204,15 @@ class AIProxy:
                 error_data = await response.json()
             except Exception:
                 error_data = {"raw_text": await response.text()}
-            raise AIProxyError(
-                f"API error ({response.status}): {error_data.get('error', {}).get('message', 'Unknown error')}",
-                status_code=response.status,
-                error_data=error_data
-            )
+            message = f"API error ({response.status}): {error_data.get('error', {}).get('message', 'Unknown error')}"
+            if response.status == 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitedError(
+                    message,
+                    error_data=error_data,
+                    retry_after=float(retry_after) if retry_after else None
+                )
+            raise AIProxyError(message, status_code=response.status, error_data=error_data)
         return await response.json()
 
     async def _query_openai_standard(
@@ -129,16 +230,18 @@ class AIProxy:
             raise AIProxyError("OpenAI API key is not configured.")
         
         url = "https://api.openai.com/v1/chat/completions"
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
-        payload = {
+        # orjson serializes the body in native code; data= hands aiohttp the
+        # finished bytes so its stdlib json path never runs (Content-Type is
+        # already a session default).
+        body = orjson.dumps({
             "model": model,
             "messages": [{"role": "user", "content": query}],
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": False
-        }
+        })
 
-        async with self.retrying_session.post(url, headers=headers, json=payload, timeout=30) as response:
+        async with self.retrying_session.post(url, data=body, timeout=30) as response:
             data = await self._handle_response_errors(response)
             response_content = data.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
             return ProxyResponse(
@@ -163,37 +266,48 @@ class AIProxy:
             raise AIProxyError("OpenAI API key is not configured.")
 
         url = "https://api.openai.com/v1/chat/completions"
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
-        payload = {
+        body = orjson.dumps({
             "model": model,
             "messages": [{"role": "user", "content": query}],
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": True
-        }
+        })
 
-        async with self.retrying_session.post(url, headers=headers, json=payload, timeout=60) as response:
+        async with self.retrying_session.post(url, data=body, timeout=60) as response:
             if response.status != 200:
                 await self._handle_response_errors(response)
             
-            async for line in response.content:
-                line_str = line.decode("utf-8").strip()
-                if not line_str.startswith("data:"):
+            # Parse SSE frames as raw bytes: no per-line decode/strip, and
+            # orjson does the JSON work in C. Token deltas are coalesced into
+            # small batches so a long completion doesn't wake the consumer
+            # once per token.
+            batch = []
+            async for raw in response.content:
+                if not raw.startswith(b"data:"):
                     continue
-                
-                json_data = line_str[len("data: "):]
-                if json_data == "[DONE]":
+
+                json_data = raw[5:].strip()
+                if json_data == b"[DONE]":
                     break
-                
+
                 try:
-                    decoded = json.loads(json_data)
-                    delta = decoded["choices"][0]["delta"].get("content")
-                    if delta:
-                        yield {"type": "chunk", "data": delta}
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to decode streaming chunk: {e}. Raw data: {json_data}")
+                    decoded = orjson.loads(json_data)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Failed to decode streaming chunk: {e}. Raw data: {json_data!r}")
                     continue
-            
+
+                delta = decoded["choices"][0]["delta"].get("content")
+                if delta:
+                    batch.append(delta)
+                    if len(batch) >= STREAM_BATCH_SIZE:
+                        yield {"type": "chunk", "data": "".join(batch)}
+                        batch.clear()
+
+            if batch:
+                yield {"type": "chunk", "data": "".join(batch)}
+
+
             # Get final usage data from the response stream headers/metadata, if available
             try:
                 final_usage = {"prompt_tokens": 0, "completion_tokens": 0} # Placeholder for final usage
@@ -228,17 +342,43 @@ class AIProxy:
         """
         Unified method to query an AI model based on its name. Returns a single response.
         """
-        handler = self._resolve_handler(model or self.default_model, is_stream=False)
+        resolved_model = model or self.default_model
+        handler = self._resolve_handler(resolved_model, is_stream=False)
         if not handler:
-            raise AIProxyError(f"Standard handler for model '{model or self.default_model}' not found.")
+            raise AIProxyError(f"Standard handler for model '{resolved_model}' not found.")
 
-        logger.info(f"Querying AI model '{model or self.default_model}'...")
-        return await handler(
-            query=query,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        key = hashlib.blake2b(
+            orjson.dumps((resolved_model, query, temperature, max_tokens)),
+            digest_size=16
+        ).digest()
+
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            logger.info(f"Querying AI model '{resolved_model}'...")
+            result = await handler(
+                query=query,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            self._response_cache[key] = result
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case no one was waiting
+            raise
+        finally:
+            del self._inflight[key]
     
     async def stream_query(
         self,
@@ -0,0 +1,173 @@
+# src/common/rate_limiting.py
+
+import asyncio
+import functools
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+from common.utils import get_logger
+from common.redis_client import get_redis_client
+
+logger = get_logger(__name__)
+
+class RateLimitExceededError(Exception):
+    """Raised when a caller exhausts its token bucket."""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+# Atomic token bucket: refill at `rate` tokens/sec up to `capacity`, then
+# try to consume one token — all in a single round-trip. Returns -1 when
+# the request is admitted, otherwise the seconds until a token is due.
+# A bucket that keeps refilling smooths bursts instead of the fixed-window
+# pathology of admitting 2N requests across a window boundary.
+TOKEN_BUCKET_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = -1
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HMSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2)
+return wait
+"""
+
+_bucket_script = None
+
+# In-process fallback buckets for when Redis is unreachable; same shape
+# as the Redis hash: key -> (tokens, last refill timestamp).
+_local_buckets: Dict[str, Tuple[float, float]] = {}
+
+def _consume_local(key: str, rate: float, capacity: float, now: float) -> float:
+    tokens, ts = _local_buckets.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - ts) * rate)
+    if tokens >= 1:
+        _local_buckets[key] = (tokens - 1, now)
+        return -1
+    _local_buckets[key] = (tokens, now)
+    return math.ceil((1 - tokens) / rate)
+
+async def _consume_token(key: str, requests_per_minute: int) -> None:
+    """Take one token from the bucket for `key`, raising when empty."""
+    rate = requests_per_minute / 60.0
+    capacity = float(requests_per_minute)
+    now = time.time()
+
+    try:
+        global _bucket_script
+        redis_client = await get_redis_client()
+        if _bucket_script is None:
+            _bucket_script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+        wait = float(await _bucket_script(
+            keys=[f"rate_bucket:{key}"],
+            args=[rate, capacity, now]
+        ))
+    except RateLimitExceededError:
+        raise
+    except Exception as e:
+        # Degrade to a per-process bucket rather than failing the request
+        # path on a Redis outage.
+        logger.warning(f"Redis rate limiting unavailable for {key}: {e}")
+        wait = _consume_local(key, rate, capacity, now)
+
+    if wait >= 0:
+        raise RateLimitExceededError(
+            f"Rate limit exceeded for {key}", retry_after=wait
+        )
+
+class RateLimiter:
+    """Application-level limiter handle held on app.state.
+
+    A thin wrapper over the shared token bucket so the lifespan has one
+    object carrying the configured rate; check() consumes one token for
+    `key` and raises RateLimitExceededError when the bucket is empty.
+    """
+
+    def __init__(self, requests_per_minute: int = 60):
+        self.requests_per_minute = requests_per_minute
+
+    async def check(self, key: str) -> None:
+        await _consume_token(key, self.requests_per_minute)
+
+class RateLimitMiddleware:
+    """ASGI middleware applying a per-client-IP token bucket to HTTP traffic.
+
+    Exhaustion short-circuits with a 429 and Retry-After before the
+    request reaches routing, in the same response shape the rate_limit
+    decorator produces.
+    """
+
+    def __init__(self, app, requests_per_minute: int = 60):
+        self.app = app
+        self.requests_per_minute = requests_per_minute
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        key = f"ip:{client[0]}" if client else "ip:unknown"
+        try:
+            await _consume_token(key, self.requests_per_minute)
+        except RateLimitExceededError as e:
+            response = JSONResponse(
+                {"detail": {"error": "Rate limit exceeded"}},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(int(e.retry_after or 1))}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+def rate_limit(key: Optional[str] = None, *, requests_per_minute: int = 60):
+    """Token-bucket rate limiting, usable two ways.
+
+    As a coroutine for imperative checks:
+
+        await rate_limit(f"git:clone:{repo_url}", requests_per_minute=5)
+
+    Or as an endpoint decorator, where the bucket is keyed per route and
+    exhaustion maps to HTTP 429 with a Retry-After header:
+
+        @rate_limit(requests_per_minute=15)
+        async def run_python_endpoint(...): ...
+    """
+    if key is not None:
+        return _consume_token(key, requests_per_minute)
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        bucket_key = f"route:{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                await _consume_token(bucket_key, requests_per_minute)
+            except RateLimitExceededError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail={"error": "Rate limit exceeded"},
+                    headers={"Retry-After": str(int(e.retry_after or 1))}
+                )
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
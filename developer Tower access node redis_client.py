@@ -0,0 +1,43 @@
+# src/common/redis_client.py
+
+import redis.asyncio as redis
+from typing import Optional
+from common.utils import get_logger
+from common.config import get_config
+
+logger = get_logger(__name__)
+
+# Shared pool so every manager reuses connections instead of churning them.
+# Sized for 2 * workers * expected concurrent requests; redis-py picks up the
+# hiredis C reply parser automatically when the hiredis package is installed.
+_redis_pool: Optional[redis.ConnectionPool] = None
+_redis_client: Optional[redis.Redis] = None
+
+async def get_redis_client() -> redis.Redis:
+    """Get or create the process-wide Redis client backed by a shared pool.
+
+    decode_responses stays False so cached blobs arrive as raw bytes and can
+    be handed straight to model_validate_json without a decode pass.
+    """
+    global _redis_pool, _redis_client
+    if _redis_client is None:
+        config = get_config().get("redis", {})
+        _redis_pool = redis.ConnectionPool.from_url(
+            config.get("url", "redis://localhost:6379/0"),
+            max_connections=config.get("max_connections", 128),
+            decode_responses=False,
+        )
+        _redis_client = redis.Redis(connection_pool=_redis_pool)
+        logger.info(f"Redis client initialized (max_connections={_redis_pool.max_connections})")
+    return _redis_client
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client and drain the pool on shutdown."""
+    global _redis_pool, _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+        _redis_pool = None
+        logger.info("Redis client closed.")
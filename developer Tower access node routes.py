@@ -1,10 +1,12 @@
 # src/api/routes.py
 
 import os
+import re
 import json
+import time
 import asyncio
 from uuid import UUID, uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Literal, Dict, List, Any, AsyncGenerator
 
 from fastapi import (
@@ -15,23 +17,28 @@ from fastapi import (
     Depends, 
     status,
     BackgroundTasks,
-    Query
+    Query,
+    Request
 )
-from fastapi.responses import StreamingResponse, JSONResponse
-from pydantic import BaseModel, Field, validator, HttpUrl
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse, FileResponse
+from pydantic import BaseModel, Field, field_validator, HttpUrl
+from cachetools import TTLCache
+import orjson
 import aiofiles
 
 from common.utils import get_logger, load_config, safe_json_loads
 from api.auth import verify_quantum_signature, QuantumAuthError
 from api.schema_validator import validate_intent_schema, SchemaValidationError
-from artifact.manager import ArtifactManager
+from artifact.manager import ArtifactManager, ArtifactQuery
 from runtime.executor import PythonExecutor, ShellExecutor
 from ai.proxy import AIProxy
 from git.controller import GitController
 from common.db import get_db
 from common.rate_limiting import rate_limit
 
-router = APIRouter()
+# orjson serializes responses in native code, which matters for the small
+# high-QPS intent-acknowledgement payloads this router mostly returns
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
 # Load configuration
@@ -44,15 +51,23 @@ shell_executor = ShellExecutor()
 ai_proxy = AIProxy(config.get("ai", {}))
 git_controller = GitController(config.get("git", {}))
 
+# Compiled alternations: one linear C-level scan per submission instead of a
+# Python substring pass per forbidden pattern
+_FORBIDDEN_CODE_RE = re.compile(
+    r"os\.system|subprocess|exec\(|eval\(|open\(|__import__|compile\(|globals\(\)|locals\(\)"
+)
+_FORBIDDEN_SHELL_RE = re.compile(r"rm -rf|format|dd |mkfs|chmod 777")
+
 # Pydantic Models with enhanced validation
 class IntentBaseModel(BaseModel):
     intent_id: UUID = Field(default_factory=uuid4, description="Unique identifier for this intent")
     originator: str = Field(..., description="Resonance Signature of client", min_length=64, max_length=256)
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="UTC timestamp of intent creation")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="UTC timestamp of intent creation")
     parent_intent_id: Optional[UUID] = Field(None, description="ID of parent intent if this is a sub-intent")
     copyright: str = Field("© 2025 Logan Royce Lorentz. All rights reserved.", description="Copyright notice")
 
-    @validator('originator')
+    @field_validator('originator')
+    @classmethod
     def validate_originator(cls, v):
         if not v.startswith('rs_'):
             raise ValueError('Originator must be a valid resonance signature starting with "rs_"')
@@ -66,7 +81,8 @@ class CloneParameters(BaseModel):
     access_token_ref: Optional[str] = Field(None, description="Reference to access token in secure storage")
     force_overwrite: bool = Field(False, description="Overwrite existing directory")
 
-    @validator('destination_path')
+    @field_validator('destination_path')
+    @classmethod
     def validate_destination_path(cls, v):
         if '..' in v or v.startswith('/'):
             raise ValueError('Destination path must be relative and not contain parent directory references')
@@ -83,7 +99,8 @@ class PushParameters(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata for the push operation")
     force_overwrite: bool = Field(False, description="Force push overwriting remote changes")
 
-    @validator('destination')
+    @field_validator('destination')
+    @classmethod
     def validate_destination(cls, v):
         if v.get('type') not in ['git', 's3', 'local']:
             raise ValueError('Destination type must be git, s3, or local')
@@ -100,16 +117,13 @@ class RunPythonParameters(BaseModel):
     timeout_seconds: int = Field(60, ge=1, le=3600, description="Execution timeout in seconds")
     input_data: Optional[Dict[str, Any]] = Field(None, description="Input data for the script")
 
-    @validator('code')
+    @field_validator('code')
+    @classmethod
     def validate_code(cls, v):
         # Basic safety check - in production, you'd want more robust sandboxing
-        forbidden_patterns = [
-            'os.system', 'subprocess', 'exec(', 'eval(', 'open(',
-            '__import__', 'compile(', 'globals()', 'locals()'
-        ]
-        for pattern in forbidden_patterns:
-            if pattern in v:
-                raise ValueError(f'Code contains potentially unsafe pattern: {pattern}')
+        match = _FORBIDDEN_CODE_RE.search(v)
+        if match:
+            raise ValueError(f'Code contains potentially unsafe pattern: {match.group(0)}')
         return v
 
 class RunShellParameters(BaseModel):
@@ -117,13 +131,13 @@ class RunShellParameters(BaseModel):
     timeout_seconds: int = Field(60, ge=1, le=300, description="Execution timeout in seconds")
     working_directory: Optional[str] = Field(None, description="Working directory for command execution")
 
-    @validator('command')
+    @field_validator('command')
+    @classmethod
     def validate_command(cls, v):
         # Basic safety check
-        forbidden_commands = ['rm -rf', 'format', 'dd ', 'mkfs', 'chmod 777']
-        for cmd in forbidden_commands:
-            if cmd in v.lower():
-                raise ValueError(f'Command contains potentially dangerous operation: {cmd}')
+        match = _FORBIDDEN_SHELL_RE.search(v.lower())
+        if match:
+            raise ValueError(f'Command contains potentially dangerous operation: {match.group(0)}')
         return v
 
 class QueryAIParameters(BaseModel):
@@ -198,104 +212,150 @@ class ErrorResponse(BaseModel):
 
 # Job tracking and processing
 class JobProcessor:
+    # A fixed pool of long-lived workers replaces one asyncio.create_task per
+    # intent: submitting becomes a queue put, and the per-task setup cost
+    # (contextvars copy, scheduling) is paid once per worker, not per job.
+    # Two pools with separate queues: container-backed jobs (runPython,
+    # runShell) queue behind scarce compute capacity, while network-bound
+    # jobs (push, queryAI, clone) fan out wider and never wait behind a
+    # burst of slow Docker work.
+    COMPUTE_WORKER_COUNT = os.cpu_count() or 4
+    IO_WORKER_COUNT = 16
+
     def __init__(self):
+        # Plain dicts are safe here: the event loop serializes handlers, and
+        # every mutation below happens between await points, so a lock would
+        # only add suspend/resume churn.
         self.pending_jobs = {}
-        self.completed_jobs = {}
-        self.lock = asyncio.Lock()
-    
-    async def submit_job(self, intent_data: Dict[str, Any]) -> UUID:
-        """Submit a job for processing and return job ID"""
-        job_id = intent_data.get('intent_id', uuid4())
-        
-        async with self.lock:
-            self.pending_jobs[job_id] = {
-                'data': intent_data,
-                'status': 'queued',
-                'submitted_at': datetime.utcnow()
-            }
-        
-        # Process in background
-        asyncio.create_task(self._process_job(job_id))
-        
+        # Bounded with lazy TTL eviction: finished jobs age out instead of
+        # accumulating for the life of the server, and lookups past the TTL
+        # simply miss (the client sees the job as gone).
+        self.completed_jobs = TTLCache(maxsize=10_000, ttl=3600)
+        self._queues: Dict[str, asyncio.Queue] = {
+            "compute": asyncio.Queue(),
+            "io": asyncio.Queue(),
+        }
+        self._workers: List[asyncio.Task] = []
+
+    def _ensure_workers(self):
+        """Starts the worker pools lazily, once a running event loop exists."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(self._queues["compute"]))
+                for _ in range(self.COMPUTE_WORKER_COUNT)
+            ] + [
+                asyncio.create_task(self._worker(self._queues["io"]))
+                for _ in range(self.IO_WORKER_COUNT)
+            ]
+
+    async def _worker(self, queue: asyncio.Queue):
+        """Long-lived worker coroutine: pulls job IDs and executes them."""
+        while True:
+            job_id = await queue.get()
+            try:
+                await self._process_job(job_id)
+            except Exception as e:
+                logger.error(f"Worker error on job {job_id}: {e}")
+            finally:
+                queue.task_done()
+
+    def submit_job(self, intent: IntentBaseModel, pool: str = "compute") -> UUID:
+        """Submit a job to the given worker pool and return job ID"""
+        job_id = intent.intent_id
+
+        # The validated model rides the queue as-is: no model_dump() round-trip
+        # on submit and no dict re-walking in the worker. FastAPI serializes
+        # the model lazily if the job record is ever returned to a client.
+        # Epoch floats from time.time(): one cheap C call per event instead
+        # of a datetime allocation, and they serialize as-is.
+        self.pending_jobs[job_id] = {
+            'data': intent,
+            'status': 'queued',
+            'submitted_at': time.time()
+        }
+
+        # Hand off to the worker pool. The queue is unbounded, so put_nowait
+        # always succeeds and submission costs no scheduler round-trip.
+        self._ensure_workers()
+        self._queues[pool].put_nowait(job_id)
+
         return job_id
-    
+
     async def _process_job(self, job_id: UUID):
         """Process a job asynchronously"""
         try:
-            async with self.lock:
-                job = self.pending_jobs.get(job_id)
-                if not job:
-                    return
-                
-                job['status'] = 'processing'
-                job['started_at'] = datetime.utcnow()
-            
+            job = self.pending_jobs.get(job_id)
+            if not job:
+                return
+
+            job['status'] = 'processing'
+            job['started_at'] = time.time()
+
             # Process based on intent type and action
-            intent_data = job['data']
-            result = await self._execute_intent(intent_data)
-            
-            async with self.lock:
-                job['status'] = 'completed'
-                job['completed_at'] = datetime.utcnow()
-                job['result'] = result
-                self.completed_jobs[job_id] = job
-                del self.pending_jobs[job_id]
-                
+            result = await self._execute_intent(job['data'])
+
+            job['status'] = 'completed'
+            job['completed_at'] = time.time()
+            job['result'] = result
+            self.completed_jobs[job_id] = job
+            del self.pending_jobs[job_id]
+
         except Exception as e:
             logger.error(f"Job {job_id} failed: {e}")
-            async with self.lock:
-                job['status'] = 'failed'
-                job['error'] = str(e)
-                job['completed_at'] = datetime.utcnow()
-                self.completed_jobs[job_id] = job
-                del self.pending_jobs[job_id]
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            job['completed_at'] = time.time()
+            self.completed_jobs[job_id] = job
+            del self.pending_jobs[job_id]
     
-    async def _execute_intent(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_intent(self, intent: IntentBaseModel) -> Dict[str, Any]:
         """Execute the intent based on type and action"""
-        intent_type = intent_data.get('intent_type')
-        action = intent_data.get('action')
-        parameters = intent_data.get('parameters', {})
-        
+        # Attribute access on the typed model: defaults were already applied
+        # at validation time, so no .get() fallbacks are needed here.
+        intent_type = intent.intent_type
+        action = intent.action
+        parameters = intent.parameters
+
         try:
             if intent_type == "manifest" and action == "clone":
                 return await git_controller.clone_repository(
-                    parameters['source'],
-                    parameters['destination_path'],
-                    branch=parameters.get('branch'),
-                    depth=parameters.get('depth', 0),
-                    force_overwrite=parameters.get('force_overwrite', False)
+                    parameters.source,
+                    parameters.destination_path,
+                    branch=parameters.branch,
+                    depth=parameters.depth,
+                    force_overwrite=parameters.force_overwrite
                 )
             
             elif intent_type == "replicate" and action == "push":
                 return await git_controller.push_artifact(
-                    parameters['artifact_id'],
-                    parameters['destination'],
-                    metadata=parameters.get('metadata'),
-                    force_overwrite=parameters.get('force_overwrite', False)
+                    parameters.artifact_id,
+                    parameters.destination,
+                    metadata=parameters.metadata,
+                    force_overwrite=parameters.force_overwrite
                 )
             
             elif intent_type == "manifest" and action == "runPython":
                 return await python_executor.execute(
-                    parameters['code'],
-                    environment=parameters.get('environment', {}),
-                    timeout=parameters.get('timeout_seconds', 60),
-                    input_data=parameters.get('input_data')
+                    parameters.code,
+                    environment=parameters.environment,
+                    timeout=parameters.timeout_seconds,
+                    input_data=parameters.input_data
                 )
             
             elif intent_type == "manifest" and action == "runShell":
                 return await shell_executor.execute(
-                    parameters['command'],
-                    timeout=parameters.get('timeout_seconds', 60),
-                    working_directory=parameters.get('working_directory')
+                    parameters.command,
+                    timeout=parameters.timeout_seconds,
+                    working_directory=parameters.working_directory
                 )
             
             elif intent_type == "manifest" and action == "queryAI":
                 return await ai_proxy.query(
-                    parameters['prompt'],
-                    engine=parameters.get('engine', 'perplexity'),
-                    temperature=parameters.get('temperature', 0.7),
-                    max_tokens=parameters.get('max_tokens', 1024),
-                    context=parameters.get('context')
+                    parameters.prompt,
+                    engine=parameters.engine,
+                    temperature=parameters.temperature,
+                    max_tokens=parameters.max_tokens,
+                    context=parameters.context
                 )
             
             else:
@@ -308,207 +368,87 @@ class JobProcessor:
 # Initialize job processor
 job_processor = JobProcessor()
 
-# Endpoints with enhanced error handling and validation
-@router.post(
-    "/intents/manifest/clone", 
-    response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
-)
-@rate_limit(requests_per_minute=10)
-async def manifest_clone(
-    intent_data: ManifestCloneRequest, 
-    auth: bool = Depends(verify_quantum_signature)
-):
-    """
-    Clone a Git repository manifest intent.
-    
-    This endpoint accepts a request to clone a Git repository and processes it asynchronously.
-    The operation includes validation, authentication, and rate limiting.
-    """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.clone")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Clone intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Clone intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+def _job_accepted_response(job_id: UUID, message: str) -> ORJSONResponse:
+    """Acknowledgement body for an accepted intent.
 
-@router.post(
-    "/intents/replicate/push", 
-    response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
-)
-@rate_limit(requests_per_minute=5)
-async def replicate_push(
-    intent_data: ReplicatePushRequest, 
-    auth: bool = Depends(verify_quantum_signature)
-):
+    Returning a concrete ORJSONResponse skips FastAPI's response-model
+    validation and jsonable_encoder walk on this very hot path; the
+    JobResponse model stays on the decorators purely for OpenAPI.
     """
-    Push artifact replicate intent.
-    
-    This endpoint accepts a request to push an artifact to a destination and processes it asynchronously.
+    return ORJSONResponse({
+        "job_id": str(job_id),
+        "status": "accepted",
+        "message": message,
+        "queue_position": None,
+        "estimated_wait": None,
+    })
+
+# Every intent endpoint documents the same outcome set
+INTENT_RESPONSES = {
+    202: {"description": "Intent accepted for processing"},
+    400: {"model": ErrorResponse, "description": "Invalid request"},
+    401: {"model": ErrorResponse, "description": "Authentication failed"},
+    422: {"model": ErrorResponse, "description": "Validation error"},
+    429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+    500: {"model": ErrorResponse, "description": "Internal server error"}
+}
+
+async def _handle_intent(
+    intent_data: IntentBaseModel,
+    schema_name: str,
+    accepted_msg: str,
+    failure_label: str,
+    pool: str = "compute"
+) -> ORJSONResponse:
+    """Shared validate -> submit -> acknowledge path for intent endpoints.
+
+    One JSON-mode dump per request: the schema engine needs plain JSON
+    types (nested dicts, string UUIDs/timestamps), which the raw
+    attribute dict does not provide.
     """
     try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "replicate.push")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Push intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Push intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+        await validate_intent_schema(intent_data.model_dump(mode="json"), schema_name)
+        job_id = job_processor.submit_job(intent_data, pool=pool)
+        return _job_accepted_response(job_id, accepted_msg)
 
-@router.post(
-    "/intents/manifest/runPython", 
-    response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
-)
-@rate_limit(requests_per_minute=15)
-async def run_python_endpoint(
-    intent_data: ManifestRunPythonRequest, 
-    auth: bool = Depends(verify_quantum_signature)
-):
-    """
-    Run Python code manifest intent.
-    
-    This endpoint accepts a request to execute Python code in a sandboxed environment.
-    """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.runPython")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Python execution intent accepted for processing"
-        )
-        
     except SchemaValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={"error": "Schema validation failed", "details": str(e)}
         )
     except Exception as e:
-        logger.error(f"Python execution intent failed: {e}")
+        logger.error(f"{failure_label} intent failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
         )
 
+# Endpoints with enhanced error handling and validation
 @router.post(
-    "/intents/manifest/runShell", 
+    "/intents/manifest/clone", 
     response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
+    responses=INTENT_RESPONSES
 )
 @rate_limit(requests_per_minute=10)
-async def run_shell_endpoint(
-    intent_data: ManifestRunShellRequest, 
+async def manifest_clone(
+    intent_data: ManifestCloneRequest, 
     auth: bool = Depends(verify_quantum_signature)
 ):
     """
-    Run shell command manifest intent.
+    Clone a Git repository manifest intent.
     
-    This endpoint accepts a request to execute a shell command in a secure environment.
+    This endpoint accepts a request to clone a Git repository and processes it asynchronously.
+    The operation includes validation, authentication, and rate limiting.
     """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.runShell")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Shell execution intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Clone intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+    return await _handle_intent(
+        intent_data, "manifest.clone", "Clone intent accepted for processing", "Clone",
+        pool="io"
+    )
 
 @router.post(
     "/intents/replicate/push", 
     response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
+    responses=INTENT_RESPONSES
 )
 @rate_limit(requests_per_minute=5)
 async def replicate_push(
@@ -520,42 +460,15 @@ async def replicate_push(
     
     This endpoint accepts a request to push an artifact to a destination and processes it asynchronously.
     """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "replicate.push")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Push intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Push intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+    return await _handle_intent(
+        intent_data, "replicate.push", "Push intent accepted for processing", "Push",
+        pool="io"
+    )
 
 @router.post(
     "/intents/manifest/runPython", 
     response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
+    responses=INTENT_RESPONSES
 )
 @rate_limit(requests_per_minute=15)
 async def run_python_endpoint(
@@ -567,42 +480,14 @@ async def run_python_endpoint(
     
     This endpoint accepts a request to execute Python code in a sandboxed environment.
     """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.runPython")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Python execution intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Python execution intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+    return await _handle_intent(
+        intent_data, "manifest.runPython", "Python execution intent accepted for processing", "Python execution"
+    )
 
 @router.post(
     "/intents/manifest/runShell", 
     response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
+    responses=INTENT_RESPONSES
 )
 @rate_limit(requests_per_minute=10)
 async def run_shell_endpoint(
@@ -614,42 +499,14 @@ async def run_shell_endpoint(
     
     This endpoint accepts a request to execute a shell command in a secure environment.
     """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.runShell")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="Shell execution intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"Shell execution intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+    return await _handle_intent(
+        intent_data, "manifest.runShell", "Shell execution intent accepted for processing", "Shell execution"
+    )
 
 @router.post(
     "/intents/manifest/queryAI", 
     response_model=JobResponse,
-    responses={
-        202: {"description": "Intent accepted for processing"},
-        400: {"model": ErrorResponse, "description": "Invalid request"},
-        401: {"model": ErrorResponse, "description": "Authentication failed"},
-        422: {"model": ErrorResponse, "description": "Validation error"},
-        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
-        500: {"model": ErrorResponse, "description": "Internal server error"}
-    }
+    responses=INTENT_RESPONSES
 )
 @rate_limit(requests_per_minute=20)
 async def query_ai_endpoint(
@@ -661,30 +518,10 @@ async def query_ai_endpoint(
     
     This endpoint accepts a request to query an AI service and returns the response.
     """
-    try:
-        # Validate against schema
-        await validate_intent_schema(intent_data.model_dump(), "manifest.queryAI")
-        
-        # Submit job for processing
-        job_id = await job_processor.submit_job(intent_data.model_dump())
-        
-        return JobResponse(
-            job_id=job_id,
-            status="accepted",
-            message="AI query intent accepted for processing"
-        )
-        
-    except SchemaValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={"error": "Schema validation failed", "details": str(e)}
-        )
-    except Exception as e:
-        logger.error(f"AI query intent failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Internal server error", "request_id": str(intent_data.intent_id)}
-        )
+    return await _handle_intent(
+        intent_data, "manifest.queryAI", "AI query intent accepted for processing", "AI query",
+        pool="io"
+    )
 
 @router.post(
     "/artifacts/upload",
@@ -699,6 +536,7 @@ async def query_ai_endpoint(
 )
 @rate_limit(requests_per_minute=5)
 async def upload_artifact_endpoint(
+    request: Request,
     file: UploadFile = File(..., description="File to upload"),
     metadata: str = Query("{}", description="JSON metadata for the artifact"),
     auth: bool = Depends(verify_quantum_signature)
@@ -710,16 +548,34 @@ async def upload_artifact_endpoint(
     in the artifact storage system with integrity verification.
     """
     try:
-        # Parse metadata
-        metadata_dict = safe_json_loads(metadata) or {}
+        # Parse metadata with orjson (C-level, rejects junk) instead of
+        # safe_json_loads, which silently coerced malformed input to {}.
+        # The default sentinel skips the parse entirely.
+        if metadata == "{}":
+            metadata_dict = {}
+        else:
+            try:
+                metadata_dict = orjson.loads(metadata)
+            except orjson.JSONDecodeError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={"error": "Invalid metadata JSON"}
+                )
+            if not isinstance(metadata_dict, dict):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail={"error": "Metadata must be a JSON object"}
+                )
         
-        # Check file size limit (100MB)
+        # Check file size limit (100MB) from the declared Content-Length
+        # instead of seeking the spooled file, which forces the whole body
+        # into the temp file before the upload handler even starts. The
+        # manager re-checks actual bytes while streaming, so a lying header
+        # is still rejected.
         max_size = 100 * 1024 * 1024
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Seek back to start
+        declared_size = int(request.headers.get("content-length", 0))
         
-        if file_size > max_size:
+        if declared_size > max_size:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail={"error": f"File size exceeds limit of {max_size} bytes"}
@@ -773,14 +629,27 @@ async def download_artifact_endpoint(
                 detail={"error": "Artifact not found"}
             )
         
-        # Stream the artifact
+        # Local artifacts go out via FileResponse, which Starlette serves
+        # with sendfile(2): kernel-space FD-to-socket copy, no Python
+        # bytecode per chunk.
+        local_path = artifact_manager.artifact_local_path(artifact_id)
+        if local_path:
+            return FileResponse(
+                local_path,
+                media_type=metadata.mime_type or "application/octet-stream",
+                filename=artifact_id,
+                headers={"X-Artifact-Hash": metadata.sha256_hash}
+            )
+        
+        # Fall back to chunked streaming through the manager
+        download = await artifact_manager.download_artifact(artifact_id)
         return StreamingResponse(
-            artifact_manager.download_artifact(artifact_id),
-            media_type="application/octet-stream",
+            download.stream,
+            media_type=download.mime_type or "application/octet-stream",
             headers={
-                "Content-Disposition": f'attachment; filename="{metadata["name"]}"',
-                "Content-Length": str(metadata["size"]),
-                "X-Artifact-Hash": metadata["hash"]
+                "Content-Disposition": f'attachment; filename="{artifact_id}"',
+                "Content-Length": str(download.size_bytes),
+                "X-Artifact-Hash": download.sha256_hash
             }
         )
         
@@ -793,6 +662,37 @@ async def download_artifact_endpoint(
             detail={"error": "Failed to download artifact"}
         )
 
+@router.get(
+    "/artifacts/count",
+    response_model=Dict[str, Any],
+    responses={
+        200: {"description": "Artifact count retrieved"},
+        401: {"model": ErrorResponse, "description": "Authentication failed"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+@rate_limit(requests_per_minute=30)
+async def count_artifacts_endpoint(
+    originator: Optional[str] = Query(None, description="Restrict the count to one originator"),
+    auth: bool = Depends(verify_quantum_signature)
+):
+    """
+    Count artifacts without listing them.
+
+    Unfiltered and per-originator counts are served from the ledger's
+    running counters, so this stays cheap at any table size.
+    """
+    try:
+        count = await artifact_manager.count_artifacts(ArtifactQuery(originator=originator))
+        return {"count": count, "originator": originator}
+
+    except Exception as e:
+        logger.error(f"Artifact count failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "Failed to count artifacts"}
+        )
+
 @router.get(
     "/jobs/{job_id}",
     response_model=Dict[str, Any],
@@ -814,21 +714,29 @@ async def get_job_status(
     of a previously submitted job.
     """
     try:
-        async with job_processor.lock:
-            # Check completed jobs first
-            if job_id in job_processor.completed_jobs:
-                return job_processor.completed_jobs[job_id]
-            
-            # Check pending jobs
-            if job_id in job_processor.pending_jobs:
-                return job_processor.pending_jobs[job_id]
-            
-            # Job not found
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"error": "Job not found"}
-            )
-            
+        # Check completed jobs first; .get() does one hash lookup where
+        # membership-then-subscript costs two.
+        job = job_processor.completed_jobs.get(job_id)
+        if job is not None:
+            return job
+
+        # Check pending jobs, then completed again: a worker may finish the
+        # job between the two reads, and it must not look vanished.
+        job = job_processor.pending_jobs.get(job_id)
+        if job is not None:
+            return job
+
+        job = job_processor.completed_jobs.get(job_id)
+        if job is not None:
+            return job
+
+        # Job not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "Job not found"}
+        )
+
+
     except HTTPException:
         raise
     except Exception as e:
@@ -838,6 +746,44 @@ async def get_job_status(
             detail={"error": "Failed to retrieve job status"}
         )
 
+# Health results are cached module-side (the router has no app handle):
+# (monotonic timestamp, cached result or HTTPException, ttl in seconds).
+HEALTH_CACHE_TTL = 2.0
+HEALTH_FAILURE_CACHE_TTL = 0.25
+_health_cache = (0.0, None, 0.0)
+# Single-flight: when the cache is cold, the first poller runs the probes
+# and the rest wait on the lock, then hit the freshly filled cache.
+_health_lock = asyncio.Lock()
+
+# The storage probe does real filesystem work, so it refreshes on its own
+# longer cadence instead of on every health-cache expiry.
+STORAGE_PROBE_INTERVAL = 30.0
+_storage_probe = (0.0, None)
+
+def _probe_storage_writable(storage_path: str) -> bool:
+    """Create and remove a scratch file to test actual writability.
+
+    os.access() can report writable on ACL or NFS mounts that then refuse
+    the real write; opening a file answers the question the probe asks.
+    """
+    probe_path = os.path.join(storage_path, f".health_probe_{os.getpid()}")
+    try:
+        fd = os.open(probe_path, os.O_CREAT | os.O_WRONLY, 0o600)
+        os.close(fd)
+        os.unlink(probe_path)
+        return True
+    except OSError:
+        return False
+
+async def _storage_writable(storage_path: str) -> bool:
+    global _storage_probe
+    now = time.monotonic()
+    probed_at, writable = _storage_probe
+    if writable is None or now - probed_at >= STORAGE_PROBE_INTERVAL:
+        writable = await asyncio.to_thread(_probe_storage_writable, storage_path)
+        _storage_probe = (now, writable)
+    return writable
+
 @router.get(
     "/health",
     response_model=Dict[str, Any],
@@ -846,20 +792,44 @@ async def get_job_status(
 async def health_check():
     """
     Health check endpoint for monitoring and load balancers.
-    
+
     Returns the current status of the service and its dependencies.
+    The result is cached briefly so a fleet of probes doesn't translate
+    into a DB ping per poll; failures cache for much less so recovery
+    shows up quickly.
     """
+    global _health_cache
+    now = time.monotonic()
+    cached_at, cached_result, cache_ttl = _health_cache
+    if cached_result is not None and now - cached_at < cache_ttl:
+        if isinstance(cached_result, HTTPException):
+            raise cached_result
+        return cached_result
+
+    async with _health_lock:
+        # Re-check after acquiring: another poller may have just probed
+        now = time.monotonic()
+        cached_at, cached_result, cache_ttl = _health_cache
+        if cached_result is not None and now - cached_at < cache_ttl:
+            if isinstance(cached_result, HTTPException):
+                raise cached_result
+            return cached_result
+        return await _probe_health(now)
+
+async def _probe_health(now: float) -> Dict[str, Any]:
+    """Runs the actual dependency probes and fills the health cache."""
+    global _health_cache
     try:
         # Check database connection
         async with get_db() as db:
             await db.execute("SELECT 1")
         
-        # Check storage accessibility
+        # Check storage accessibility without blocking the event loop
         storage_path = config.get("storage", {}).get("path", "data/artifacts")
-        if not os.access(storage_path, os.W_OK):
+        if not await _storage_writable(storage_path):
             raise Exception("Storage not writable")
         
-        return {
+        result = {
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
             "version": "1.0.0",
@@ -868,11 +838,14 @@ async def health_check():
                 "storage": "accessible"
             }
         }
-        
+        _health_cache = (now, result, HEALTH_CACHE_TTL)
+        return result
+
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        raise HTTPException(
+        unhealthy = HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"error": "Service unhealthy", "details": str(e)}
         )
-```  
\ No newline at end of file
+        _health_cache = (now, unhealthy, HEALTH_FAILURE_CACHE_TTL)
+        raise unhealthy
\ No newline at end of file
@@ -1,8 +1,11 @@
+import io
 import os
+import tarfile
+import time
 import uuid
 import tempfile
 import asyncio
-from typing import Dict, Any, Optional, List, AsyncGenerator
+from typing import Dict, Any, Optional, List, AsyncGenerator, Union
 from pydantic import BaseModel
 import aiodocker
 import aiofiles
@@ -11,6 +14,25 @@ from contextlib import asynccontextmanager
 
 logger = get_logger(__name__)
 
+# Process-wide Docker client: one daemon connection whose aiohttp session
+# and keep-alives are reused across every container operation, instead of
+# a handshake per client instantiation.
+_docker_client: Optional[aiodocker.Docker] = None
+
+def get_docker_client() -> aiodocker.Docker:
+    """Return the shared aiodocker client, creating it on first use."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = aiodocker.Docker()
+    return _docker_client
+
+async def close_docker_client():
+    """Close the shared client (process shutdown only)."""
+    global _docker_client
+    if _docker_client is not None:
+        await _docker_client.close()
+        _docker_client = None
+
 class SandboxConfig(BaseModel):
     """Configuration for the code execution sandbox."""
     docker_image: str = "python:3.11-slim"
@@ -19,6 +41,7 @@ class SandboxConfig(BaseModel):
     ulimit_nproc: int = 256
     allow_network: bool = False
     extra_mounts: List[str] = []
+    pool_size: int = 4
 
 class SandboxResult(BaseModel):
     """Result of the sandboxed execution."""
@@ -35,15 +58,94 @@ class SandboxError(Exception):
     """Custom exception for sandbox-related errors."""
     pass
 
+def _files_archive(files: Dict[str, str]) -> bytes:
+    """Build an in-memory tar of {filename: content} for put_archive."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode('utf-8') if isinstance(content, str) else content
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            info.mode = 0o444
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
 class Sandbox:
     """
     Manages the execution of untrusted code within a secure Docker container.
     """
-    def __init__(self, config: SandboxConfig):
+    def __init__(self, config: SandboxConfig, client: Optional[aiodocker.Docker] = None):
         self.config = config
-        self.client = aiodocker.Docker()
+        self.client = client or get_docker_client()
+        # Warm pool of idle containers that jobs exec into: container
+        # create+start (~100-500ms) is paid when the pool refills in the
+        # background, not on the request path.
+        self._pool: asyncio.Queue = asyncio.Queue()
+        self._pool_warmed = False
         logger.info(f"Sandbox initialized with Docker image: {self.config.docker_image}")
 
+    async def _create_pooled_container(self) -> Any:
+        """Create and start an idle hardened container for the warm pool."""
+        host_config = {
+            "Memory": self.config.memory_limit_mb * 1024 * 1024,
+            "CpuShares": int(self.config.cpu_limit * 1024),
+            "Ulimits": [{"Name": "nproc", "Soft": self.config.ulimit_nproc, "Hard": self.config.ulimit_nproc}],
+            "ReadonlyRootfs": True,
+            "AutoRemove": False,
+            "CapDrop": ["ALL"],
+            "NetworkMode": "none" if not self.config.allow_network else "default",
+            "SecurityOpt": ["no-new-privileges"],
+            # Writable scratch space for jobs while the root FS stays read-only
+            "Tmpfs": {"/tmp": "rw,size=67108864"},
+        }
+        container_config = {
+            "Image": self.config.docker_image,
+            "Cmd": ["sleep", "infinity"],
+            "Tty": False,
+            "HostConfig": host_config,
+            "WorkingDir": "/tmp",
+        }
+        container = await self.client.containers.create(
+            config=container_config, name=f"sandbox_pool_{uuid.uuid4()}"
+        )
+        await container.start()
+        return container
+
+    async def _ensure_pool(self):
+        """Warm the pool lazily on first use."""
+        if not self._pool_warmed:
+            self._pool_warmed = True
+            containers = await asyncio.gather(
+                *[self._create_pooled_container() for _ in range(self.config.pool_size)]
+            )
+            for container in containers:
+                self._pool.put_nowait(container)
+            logger.info(f"Sandbox pool warmed with {self.config.pool_size} containers")
+
+    async def _recycle_container(self, container: Any):
+        """Replace a used container with a fresh one, off the hot path."""
+        try:
+            await container.delete(force=True)
+        except Exception:
+            pass
+        try:
+            self._pool.put_nowait(await self._create_pooled_container())
+        except Exception as e:
+            logger.error(f"Failed to refill sandbox pool: {e}")
+
+    async def close(self):
+        """Tear down pooled containers.
+
+        The Docker client is process-shared; close it separately via
+        close_docker_client() at shutdown.
+        """
+        while not self._pool.empty():
+            container = self._pool.get_nowait()
+            try:
+                await container.delete(force=True)
+            except Exception:
+                pass
+
     async def _create_container(self, cmd: List[str], job_id: str, mounts: List[str], env: Dict[str, str]) -> Any:
         """Internal: create a hardened container with configured limits."""
         host_config = {
@@ -75,17 +177,26 @@ class Sandbox:
         timeout: int,
         environment: Optional[Dict[str, str]] = None,
         mounts: Optional[List[str]] = None,
-        stream_logs: bool = False
+        stream_logs: bool = False,
+        files: Optional[Dict[str, str]] = None
     ) -> Union[SandboxResult, AsyncGenerator[Dict[str, str], None]]:
         """
         Execute an arbitrary command inside a hardened container.
+
+        `files` maps filenames to contents placed under /tmp in the
+        container before the command runs.
         """
         job_id = str(uuid.uuid4())
         env = environment or {}
         mounts = (mounts or []) + self.config.extra_mounts
 
+        # Per-job bind mounts and follow-mode log streaming need a dedicated
+        # container; everything else execs into a pooled one.
+        if not mounts and not stream_logs:
+            return await self._run_in_pooled_container(cmd, timeout, env, job_id, files)
+
         container = None
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
 
         try:
             container = await self._create_container(cmd, job_id, mounts, env)
@@ -101,11 +212,16 @@ class Sandbox:
             status = await asyncio.wait_for(container.wait(), timeout=timeout)
             return_code = status.get("StatusCode", -1)
 
-            stdout = "".join(await container.log(stdout=True, stderr=False))
-            stderr = "".join(await container.log(stdout=False, stderr=True))
+            # Each log call is a round-trip to the Docker daemon; fetch both
+            # streams concurrently.
+            stdout_chunks, stderr_chunks = await asyncio.gather(
+                container.log(stdout=True, stderr=False),
+                container.log(stdout=False, stderr=True),
+            )
+            stdout = "".join(stdout_chunks)
+            stderr = "".join(stderr_chunks)
 
-            end_time = asyncio.get_event_loop().time()
-            duration = end_time - start_time
+            duration = time.perf_counter() - start_time
 
             message = (
                 "Execution completed successfully."
@@ -143,6 +259,81 @@ class Sandbox:
                 except Exception:
                     pass
 
+    async def _run_in_pooled_container(
+        self,
+        cmd: List[str],
+        timeout: int,
+        env: Dict[str, str],
+        job_id: str,
+        files: Optional[Dict[str, str]] = None
+    ) -> SandboxResult:
+        """Execute a command via exec in a warm pooled container."""
+        await self._ensure_pool()
+        container = await self._pool.get()
+        start_time = time.perf_counter()
+
+        try:
+            if files:
+                # One in-memory tar upload into the container's tmpfs: no
+                # host temp file, no bind-mount setup, nothing to unlink.
+                await container.put_archive("/tmp", _files_archive(files))
+
+            exec_ = await container.exec(
+                cmd,
+                stdout=True,
+                stderr=True,
+                environment=[f"{k}={v}" for k, v in env.items()],
+                workdir="/tmp",
+            )
+            stdout_parts: List[bytes] = []
+            stderr_parts: List[bytes] = []
+
+            async def _drain():
+                async with exec_.start(detach=False) as stream:
+                    while True:
+                        message = await stream.read_out()
+                        if message is None:
+                            break
+                        if message.stream == 2:
+                            stderr_parts.append(message.data)
+                        else:
+                            stdout_parts.append(message.data)
+
+            await asyncio.wait_for(_drain(), timeout=timeout)
+
+            inspection = await exec_.inspect()
+            return_code = inspection.get("ExitCode")
+            if return_code is None:
+                return_code = -1
+
+            duration = time.perf_counter() - start_time
+            message = (
+                "Execution completed successfully."
+                if return_code == 0 else "Execution failed."
+            )
+
+            return SandboxResult(
+                job_id=job_id,
+                container_id=container.id,
+                image=self.config.docker_image,
+                stdout=b"".join(stdout_parts).decode(errors="replace"),
+                stderr=b"".join(stderr_parts).decode(errors="replace"),
+                return_code=return_code,
+                duration=duration,
+                message=message,
+            )
+
+        except asyncio.TimeoutError:
+            logger.warning(f"[{job_id}] Execution timed out after {timeout} seconds.")
+            raise SandboxError(f"Execution timed out after {timeout} seconds.")
+        except aiodocker.exceptions.DockerError as e:
+            logger.error(f"[{job_id}] Docker error: {e}")
+            raise SandboxError(f"Docker error: {e}")
+        finally:
+            # Used containers are never returned directly: a fresh one is
+            # created in the background so every job sees a clean tmpfs.
+            asyncio.create_task(self._recycle_container(container))
+
     async def run_python_script(
         self,
         code: str,
@@ -154,26 +345,36 @@ class Sandbox:
         Convenience method: run a Python script inside the sandbox.
         """
         job_id = str(uuid.uuid4())
-        temp_dir = tempfile.gettempdir()
-        temp_file_host = os.path.join(temp_dir, f"temp_script_{job_id}.py")
-        temp_file_container = f"/tmp/{os.path.basename(temp_file_host)}"
+        script_name = f"temp_script_{job_id}.py"
+        temp_file_container = f"/tmp/{script_name}"
 
-        try:
-            async with aiofiles.open(temp_file_host, "w") as f:
-                await f.write(code)
-            mounts = [f"{temp_file_host}:{temp_file_container}:ro"]
-            return await self.run_command(
-                ["python", temp_file_container],
-                timeout=timeout,
-                environment=environment,
-                mounts=mounts,
-                stream_logs=stream_logs
-            )
-        finally:
+        if stream_logs:
+            # Streaming runs use a dedicated container, which still gets the
+            # script via a read-only bind mount from the host temp dir.
+            temp_file_host = os.path.join(tempfile.gettempdir(), script_name)
             try:
-                await aiofiles.os.remove(temp_file_host)
-            except FileNotFoundError:
-                pass
+                async with aiofiles.open(temp_file_host, "w") as f:
+                    await f.write(code)
+                mounts = [f"{temp_file_host}:{temp_file_container}:ro"]
+                return await self.run_command(
+                    ["python", temp_file_container],
+                    timeout=timeout,
+                    environment=environment,
+                    mounts=mounts,
+                    stream_logs=True
+                )
+            finally:
+                try:
+                    await aiofiles.os.remove(temp_file_host)
+                except FileNotFoundError:
+                    pass
+
+        return await self.run_command(
+            ["python", temp_file_container],
+            timeout=timeout,
+            environment=environment,
+            files={script_name: code}
+        )
 
 async def get_sandbox() -> Sandbox:
     """Provides a singleton instance of the Sandbox."""
@@ -1,12 +1,15 @@
-import json
 import os
 import re
 import asyncio
 import time
-from typing import Dict, Any, Optional, List, Set, Tuple, AsyncGenerator
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, List, Set, Tuple, AsyncGenerator
 from functools import lru_cache
 from aiofiles import open as async_open
 from aiofiles.os import stat as async_stat
+import fastjsonschema
+import orjson
 from jsonschema import Draft202012Validator, ValidationError, SchemaError
 from jsonschema.exceptions import best_match
 from fastapi import Depends, HTTPException, status
@@ -19,6 +22,14 @@ logger = get_logger(__name__)
 SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "../../schema")
 SCHEMA_FILE_PATTERN = r"^intent\.(manifest|replicate)\.[a-zA-Z0-9_]+\.v\d+\.json$"
 
+# How often the background watcher rescans SCHEMA_DIR for changed mtimes.
+SCHEMA_WATCH_INTERVAL = 5.0
+
+# Compiled once at import: these run against every directory entry on each
+# scan/reload, so skip the per-call pattern-cache lookup
+_SCHEMA_FILE_RE = re.compile(SCHEMA_FILE_PATTERN)
+_SCHEMA_VERSION_RE = re.compile(r".*\.(v\d+)\.json$")
+
 class SchemaValidationError(Exception):
     """Custom exception for schema validation errors."""
     def __init__(self, message: str, original_error: Optional[Exception] = None, 
@@ -29,52 +40,96 @@ class SchemaValidationError(Exception):
         self.error_code = "SCHEMA_VALIDATION_ERROR"
 
 class LoadGate:
-    """Advanced load gate pattern to eliminate lock contention."""
+    """Single-flight load gate built on futures.
+
+    The first caller for a key installs a Future and becomes the loader;
+    concurrent callers await that Future. Completed futures double as the
+    result cache, so the hot path is one plain dict lookup — no lock, since
+    the event loop serializes the get/install sequence between awaits.
+    """
     
     def __init__(self):
-        self._gates: Dict[str, asyncio.Event] = {}
-        self._results: Dict[str, Any] = {}
-        self._exceptions: Dict[str, Exception] = {}
-        self._lock = asyncio.Lock()
+        self._futures: Dict[str, asyncio.Future] = {}
     
     async def wait_for_load(self, key: str) -> Any:
-        """Wait for a load operation to complete or return cached result."""
-        async with self._lock:
-            if key in self._results:
-                return self._results[key]
-            if key in self._exceptions:
-                raise self._exceptions[key]
-            if key in self._gates:
-                gate = self._gates[key]
-            else:
-                gate = asyncio.Event()
-                self._gates[key] = gate
-                return None
-        
-        await gate.wait()
-        async with self._lock:
-            if key in self._results:
-                return self._results[key]
-            elif key in self._exceptions:
-                raise self._exceptions[key]
-            else:
-                raise RuntimeError(f"Load completed but no result found for {key}")
+        """Return the cached/loaded value, or None if the caller should load."""
+        future = self._futures.get(key)
+        if future is None:
+            self._futures[key] = asyncio.get_running_loop().create_future()
+            return None
+        return await future
     
     async def set_result(self, key: str, result: Any):
-        """Set the result for a load operation."""
-        async with self._lock:
-            self._results[key] = result
-            if key in self._gates:
-                self._gates[key].set()
-                del self._gates[key]
+        """Publish the result of a load operation to all waiters."""
+        future = self._futures.get(key)
+        if future is not None and not future.done():
+            future.set_result(result)
     
     async def set_exception(self, key: str, exception: Exception):
-        """Set an exception for a load operation."""
-        async with self._lock:
-            self._exceptions[key] = exception
-            if key in self._gates:
-                self._gates[key].set()
-                del self._gates[key]
+        """Publish a load failure to all waiters."""
+        future = self._futures.get(key)
+        if future is not None and not future.done():
+            future.set_exception(exception)
+            # Mark retrieved so an unobserved failure doesn't warn at GC
+            future.exception()
+
+    def invalidate(self, key: str) -> None:
+        """Drop a completed future so the next caller becomes a loader again.
+
+        In-flight loads are left alone: their waiters still get the result.
+        """
+        future = self._futures.get(key)
+        if future is not None and future.done():
+            del self._futures[key]
+
+def _is_uuid_format(value: str) -> bool:
+    import uuid
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+def _is_timestamp_format(value: str) -> bool:
+    from datetime import datetime
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return True
+    except ValueError:
+        return False
+
+def _is_resonance_signature_format(value: str) -> bool:
+    return value.startswith('rs_') and 64 <= len(value) <= 256
+
+def _is_quantum_signature_format(value: str) -> bool:
+    return len(value) == 64 and all(c in '0123456789abcdefABCDEF' for c in value)
+
+# Custom formats handed to fastjsonschema.compile, mirroring the
+# FORMAT_CHECKER registrations on CustomValidator below.
+FAST_VALIDATOR_FORMATS: Dict[str, Callable[[str], bool]] = {
+    "uuid": _is_uuid_format,
+    "timestamp": _is_timestamp_format,
+    "resonance_signature": _is_resonance_signature_format,
+    "quantum_signature": _is_quantum_signature_format,
+}
+
+def _pack_schema(schema: Dict[str, Any]) -> bytes:
+    """Serialize a schema for Redis: sorted-key orjson, zlib-compressed.
+
+    Compression shrinks the wire payload several-fold, which matters on a
+    cold fetch of a large schema set over a remote Redis.
+    """
+    return zlib.compress(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), 6)
+
+def _unpack_schema(blob: bytes) -> Dict[str, Any]:
+    """Inverse of _pack_schema; also accepts legacy uncompressed blobs.
+
+    JSON blobs written before compression start with '{', zlib streams
+    never do, so the first byte disambiguates without a key migration.
+    """
+    if blob[:1] == b"{":
+        return orjson.loads(blob)
+    return orjson.loads(zlib.decompress(blob))
 
 class CustomValidator(Draft202012Validator):
     """Custom validator with enhanced format checking and type safety."""
@@ -115,14 +170,43 @@ class CustomValidator(Draft202012Validator):
         """Validate quantum signature format."""
         return len(value) == 64 and all(c in '0123456789abcdefABCDEF' for c in value)
 
+@dataclass(slots=True)
+class SchemaEntry:
+    """Everything the hot path needs about one cached schema, in one record.
+
+    One dict lookup hands back the schema, its hash, its freshness epoch and
+    both compiled validators as slot attributes — instead of probing three
+    parallel dicts plus two hash-keyed validator caches per request. Entries
+    are replaced wholesale on reload, so validator memory is bounded by the
+    number of live schemas with no separate eviction bookkeeping.
+    """
+    data: Dict[str, Any]
+    hash: str
+    mtime: float
+    epoch: int
+    # fastjsonschema code-generates a straight-line function per schema,
+    # roughly an order of magnitude faster than the generic Draft202012
+    # walker. None marks a schema that failed to compile, so validation
+    # falls back to the CustomValidator without retrying the compile.
+    fast_validator: Optional[Callable]
+    validator: CustomValidator
+
 class SchemaManager:
     """Hyper-scalable schema manager with Redis as source of truth."""
-    
+
     def __init__(self):
-        self._schema_cache: Dict[str, Dict[str, Any]] = {}
-        self._schema_hashes: Dict[str, str] = {}
-        self._schema_mtimes: Dict[str, float] = {}
+        self._schemas: Dict[str, SchemaEntry] = {}
+        # Freshness epoch: bumped by the background watcher when any schema
+        # file's mtime changes. The hot path compares this int against the
+        # epoch recorded on the cached schema instead of stat()ing the file
+        # on every validate.
+        self._fs_epoch: int = 0
+        self._disk_snapshot: Dict[str, float] = {}
+        self._watch_task: Optional[asyncio.Task] = None
         self._load_gate = LoadGate()
+        # Content hashes whose meta-schema check already passed; reloads of
+        # unchanged files skip re-validating against the draft meta-schema.
+        self._meta_checked: Set[str] = set()
         self._redis_client = None
         self._schema_stats: Dict[str, Dict[str, int]] = {}
         self._is_initialized = False
@@ -136,7 +220,7 @@ class SchemaManager:
             self._redis_client = await get_redis_client()
             await self._load_schemas_from_redis()
             
-            if not self._schema_cache:
+            if not self._schemas:
                 await self._preload_schemas_from_disk()
                 await self._push_all_schemas_to_redis()
             
@@ -147,22 +231,67 @@ class SchemaManager:
             logger.warning(f"Schema manager Redis initialization failed: {e}. Falling back to local cache.")
             await self._preload_schemas_from_disk()
             self._is_initialized = True
+
+        self._start_schema_watcher()
     
+    def _start_schema_watcher(self):
+        """Start the background task that tracks on-disk schema changes."""
+        if self._watch_task is None or self._watch_task.done():
+            self._disk_snapshot = self._scan_schema_mtimes()
+            self._watch_task = asyncio.create_task(self._watch_schemas())
+
+    @staticmethod
+    def _scan_schema_mtimes() -> Dict[str, float]:
+        """Snapshot mtimes for every schema file via a single scandir pass."""
+        try:
+            with os.scandir(SCHEMA_DIR) as entries:
+                return {
+                    entry.name: entry.stat().st_mtime
+                    for entry in entries
+                    if _SCHEMA_FILE_RE.match(entry.name)
+                }
+        except OSError:
+            return {}
+
+    async def _watch_schemas(self):
+        """Bump the freshness epoch whenever a schema file changes on disk.
+
+        This moves the per-request stat() out of validate(): the hot path
+        compares one int, and only the watcher pays the syscalls, once per
+        interval for the whole directory.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(SCHEMA_WATCH_INTERVAL)
+            try:
+                snapshot = await loop.run_in_executor(None, self._scan_schema_mtimes)
+                if snapshot != self._disk_snapshot:
+                    self._disk_snapshot = snapshot
+                    self._fs_epoch += 1
+                    logger.info(f"Schema directory changed; freshness epoch is now {self._fs_epoch}")
+            except Exception as e:
+                logger.warning(f"Schema watcher scan failed: {e}")
+
     async def _load_schemas_from_redis(self):
         """Load all schemas from Redis."""
         if not self._redis_client:
             return
         
         try:
-            schema_keys = await self._redis_client.keys("schema:*")
-            for key in schema_keys:
+            # SCAN instead of KEYS (which blocks Redis on large keyspaces),
+            # then one MGET round-trip for all blobs instead of a GET each.
+            schema_keys = [
+                key async for key in self._redis_client.scan_iter(match="schema:*")
+            ]
+            values = await self._redis_client.mget(*schema_keys) if schema_keys else []
+            for key, cached_schema in zip(schema_keys, values):
+                if isinstance(key, bytes):  # decode_responses=False
+                    key = key.decode()
                 schema_filename = key.replace("schema:", "")
-                cached_schema = await self._redis_client.get(key)
                 if cached_schema:
-                    schema = json.loads(cached_schema)
-                    self._schema_cache[schema_filename] = schema
-                    self._schema_hashes[schema_filename] = schema.get("_metadata", {}).get("hash", "")
-                    self._schema_mtimes[schema_filename] = time.time()
+                    schema = _unpack_schema(cached_schema)
+                    # compile off the request path
+                    self._schemas[schema_filename] = self._make_entry(schema)
             logger.info(f"Loaded {len(schema_keys)} schemas from Redis")
             
         except Exception as e:
@@ -175,14 +304,12 @@ class SchemaManager:
             return
         
         try:
-            for schema_filename, schema in self._schema_cache.items():
-                schema_json = json.dumps(schema, sort_keys=True)
-                await self._redis_client.setex(
-                    f"schema:{schema_filename}", 
-                    86400,  # 24 hours TTL
-                    schema_json
-                )
-            logger.info(f"Pushed {len(self._schema_cache)} schemas to Redis")
+            # One pipelined round-trip for the whole schema set
+            pipe = self._redis_client.pipeline(transaction=False)
+            for schema_filename, entry in self._schemas.items():
+                await self._cache_schema_in_redis(schema_filename, entry.data, pipe=pipe)
+            await pipe.execute()
+            logger.info(f"Pushed {len(self._schemas)} schemas to Redis")
             
         except Exception as e:
             logger.error(f"Failed to push schemas to Redis: {e}")
@@ -191,52 +318,79 @@ class SchemaManager:
         """Preload schemas from disk (fallback for cold start)."""
         try:
             schema_files = await self._discover_schemas()
-            for schema_file in schema_files:
-                try:
-                    schema = await self._load_schema_from_disk(schema_file)
-                    self._schema_cache[schema_file] = schema
-                    self._schema_hashes[schema_file] = schema.get("_metadata", {}).get("hash", "")
-                    self._schema_mtimes[schema_file] = time.time()
-                    logger.debug(f"Preloaded schema from disk: {schema_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to preload schema {schema_file}: {e}")
+            # Overlap the file reads instead of awaiting each in turn;
+            # cold start is then bounded by the slowest read, not the sum.
+            results = await asyncio.gather(
+                *[
+                    self._load_schema_from_disk(name, st_mtime=mtime)
+                    for name, mtime in schema_files
+                ],
+                return_exceptions=True,
+            )
+            for (schema_file, _), schema in zip(schema_files, results):
+                if isinstance(schema, BaseException):
+                    logger.warning(f"Failed to preload schema {schema_file}: {schema}")
+                    continue
+                # compile off the request path
+                self._schemas[schema_file] = self._make_entry(schema)
+                logger.debug(f"Preloaded schema from disk: {schema_file}")
         except Exception as e:
             logger.error(f"Schema preloading from disk failed: {e}")
     
-    async def _discover_schemas(self) -> List[str]:
-        """Discover schema files in the schema directory."""
-        schema_files = []
+    async def _discover_schemas(self) -> List[Tuple[str, float]]:
+        """Discover schema files and their mtimes in one scandir pass.
+
+        scandir hands back cached stat results per entry, so the loaders
+        don't each have to re-stat the file they were asked to read.
+        """
         try:
-            for filename in os.listdir(SCHEMA_DIR):
-                if re.match(SCHEMA_FILE_PATTERN, filename):
-                    schema_files.append(filename)
-            return schema_files
+            with os.scandir(SCHEMA_DIR) as entries:
+                return [
+                    (entry.name, entry.stat().st_mtime)
+                    for entry in entries
+                    if _SCHEMA_FILE_RE.match(entry.name)
+                ]
         except Exception as e:
             logger.error(f"Failed to discover schemas: {e}")
             return []
     
-    async def _load_schema_from_disk(self, schema_filename: str) -> Dict[str, Any]:
-        """Load a single schema from disk with validation."""
+    async def _load_schema_from_disk(
+        self, schema_filename: str, st_mtime: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Load a single schema from disk with validation.
+
+        st_mtime, when prefetched by _discover_schemas, skips the extra
+        stat syscall here.
+        """
         schema_path = os.path.join(SCHEMA_DIR, schema_filename)
-        
-        if not re.match(SCHEMA_FILE_PATTERN, schema_filename):
+
+        # Discovery already matched the pattern when it prefetched the
+        # mtime; only direct loads need the filename re-checked.
+        if st_mtime is None and not _SCHEMA_FILE_RE.match(schema_filename):
             raise SchemaValidationError(f"Invalid schema filename pattern: {schema_filename}")
-        
+
         if not os.path.exists(schema_path):
             raise SchemaValidationError(f"Schema file {schema_filename} not found")
-        
-        async with async_open(schema_path, "r", encoding="utf-8") as schema_file:
+
+        # Binary read: orjson parses bytes natively and the hash runs over
+        # the raw buffer, so the file is never decoded and re-encoded.
+        async with async_open(schema_path, "rb") as schema_file:
             content = await schema_file.read()
-            schema = json.loads(content)
-        
-        CustomValidator.check_schema(schema)
-        
-        stat = await async_stat(schema_path)
+            schema = orjson.loads(content)
+
+        content_hash = compute_sha256(content)
+        if content_hash not in self._meta_checked:
+            CustomValidator.check_schema(schema)
+            self._meta_checked.add(content_hash)
+
+        if st_mtime is None:
+            stat = await async_stat(schema_path)
+            st_mtime = stat.st_mtime
         schema["_metadata"] = {
             "filename": schema_filename,
-            "hash": compute_sha256(content.encode('utf-8')),
+            "hash": content_hash,
             "loaded_at": time.time(),
-            "mtime": stat.st_mtime,
+            "mtime": st_mtime,
             "version": self._extract_schema_version(schema_filename),
             "source": "disk"
         }
@@ -249,28 +403,33 @@ class SchemaManager:
             return None
         
         try:
-            schema_json = await self._redis_client.get(f"schema:{schema_filename}")
-            if schema_json:
-                schema = json.loads(schema_json)
-                self._schema_mtimes[schema_filename] = time.time()
-                return schema
+            blob = await self._redis_client.get(f"schema:{schema_filename}")
+            if blob:
+                return _unpack_schema(blob)
             return None
         except Exception as e:
             logger.error(f"Failed to get schema {schema_filename} from Redis: {e}")
             return None
     
-    async def _cache_schema_in_redis(self, schema_filename: str, schema: Dict[str, Any]):
-        """Cache a schema in Redis."""
+    async def _cache_schema_in_redis(self, schema_filename: str, schema: Dict[str, Any],
+                                     pipe=None):
+        """Cache a schema in Redis.
+
+        With a pipeline, the write is queued and the caller owns the single
+        execute(); without one, it is a standalone round-trip.
+        """
         if not self._redis_client:
             return
-        
+
         try:
-            schema_json = json.dumps(schema, sort_keys=True)
-            await self._redis_client.setex(
-                f"schema:{schema_filename}", 
+            target = pipe if pipe is not None else self._redis_client
+            result = target.setex(
+                f"schema:{schema_filename}",
                 86400,  # 24 hours TTL
-                schema_json
+                _pack_schema(schema)
             )
+            if pipe is None:
+                await result
             logger.debug(f"Cached schema {schema_filename} in Redis")
         except Exception as e:
             logger.error(f"Failed to cache schema {schema_filename} in Redis: {e}")
@@ -278,96 +437,158 @@ class SchemaManager:
     @staticmethod
     def _extract_schema_version(schema_filename: str) -> str:
         """Extract version from schema filename (e.g., 'v1' from 'intent.manifest.clone.v1.json')."""
-        match = re.match(r".*\.(v\d+)\.json$", schema_filename)
+        match = _SCHEMA_VERSION_RE.match(schema_filename)
         return match.group(1) if match else "unknown"
     
     async def validate(self, intent_data: Dict[str, Any], schema_name: str):
         """Validate intent data against the specified schema."""
         try:
-            schema = await self.load_and_validate_schema(schema_name)
-            validator = self._create_validator(schema)
-            
-            # Track validation stats
-            if schema_name not in self._schema_stats:
-                self._schema_stats[schema_name] = {"validations": 0, "errors": 0}
-            
-            try:
-                validator.validate(intent_data)
-                self._schema_stats[schema_name]["validations"] += 1
-                logger.debug(f"Validated intent against schema {schema_name}")
-            except ValidationError as e:
-                self._schema_stats[schema_name]["errors"] += 1
-                error = best_match([e])
-                raise SchemaValidationError(
-                    message=str(error.message),
-                    original_error=error,
-                    validation_path=list(error.absolute_path)
-                )
-                
-        except SchemaValidationError as e:
+            entry = await self.load_and_validate_schema(schema_name)
+            self.validate_with_entry(entry, intent_data, schema_name)
+        except SchemaValidationError:
             raise
         except Exception as e:
             logger.error(f"Unexpected error during schema validation for {schema_name}: {e}")
             raise SchemaValidationError(f"Unexpected error during validation: {str(e)}")
+
+    def validate_with_entry(self, entry: SchemaEntry, intent_data: Dict[str, Any],
+                            schema_name: str):
+        """Run validation against an already-resolved cache entry.
+
+        Split out so callers holding a pinned entry (class-based
+        dependencies) can skip the per-request entry lookup.
+        """
+        # Track validation stats
+        stats = self._schema_stats.setdefault(
+            schema_name, {"validations": 0, "errors": 0}
+        )
+
+        try:
+            if entry.fast_validator is not None:
+                entry.fast_validator(intent_data)
+            else:
+                entry.validator.validate(intent_data)
+            stats["validations"] += 1
+            logger.debug(f"Validated intent against schema {schema_name}")
+        except fastjsonschema.JsonSchemaException as e:
+            stats["errors"] += 1
+            # e.path starts at the synthetic root name, e.g. ['data', 'x']
+            raise SchemaValidationError(
+                message=str(e),
+                original_error=e,
+                validation_path=list(getattr(e, 'path', []))[1:]
+            )
+        except ValidationError as e:
+            stats["errors"] += 1
+            error = best_match([e])
+            raise SchemaValidationError(
+                message=str(error.message),
+                original_error=error,
+                validation_path=list(error.absolute_path)
+            )
     
-    def _create_validator(self, schema: Dict[str, Any]) -> CustomValidator:
-        """Create custom validator with enhanced format checking."""
-        return CustomValidator(schema)
+    @staticmethod
+    def _strip_metadata(schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the schema without the injected _metadata key, so the
+        compilers only ever see the schema the author wrote."""
+        if "_metadata" not in schema:
+            return schema
+        return {k: v for k, v in schema.items() if k != "_metadata"}
+
+    @staticmethod
+    def _compile_fast(bare_schema: Dict[str, Any], filename: str) -> Optional[Callable]:
+        """Code-generate a validator, or None if fastjsonschema can't."""
+        try:
+            return fastjsonschema.compile(bare_schema, formats=FAST_VALIDATOR_FORMATS)
+        except Exception as e:
+            logger.warning(
+                f"fastjsonschema compile failed for {filename}: {e}; "
+                f"falling back to jsonschema"
+            )
+            return None
+
+    def _make_entry(self, schema: Dict[str, Any],
+                    reuse: Optional[SchemaEntry] = None) -> SchemaEntry:
+        """Build the cache record for a schema, compiling both validators.
+
+        Both compilers receive the same metadata-stripped copy, so neither
+        ever walks the injected bookkeeping key. When the previous entry
+        carries the same content hash, its compiled validators are reused
+        instead of recompiled.
+        """
+        meta = schema.get("_metadata", {})
+        schema_hash = meta.get("hash", "")
+        if reuse is not None and schema_hash and reuse.hash == schema_hash:
+            fast, slow = reuse.fast_validator, reuse.validator
+        else:
+            bare = self._strip_metadata(schema)
+            fast = self._compile_fast(bare, meta.get("filename", "<anonymous>"))
+            slow = CustomValidator(bare)
+        return SchemaEntry(
+            data=schema,
+            hash=schema_hash,
+            mtime=meta.get("mtime", 0.0),
+            epoch=self._fs_epoch,
+            fast_validator=fast,
+            validator=slow,
+        )
     
-    async def load_and_validate_schema(self, schema_filename: str) -> Dict[str, Any]:
-        """Load schema using the load gate pattern."""
-        if schema_filename in self._schema_cache:
-            cached_schema = self._schema_cache[schema_filename]
-            if await self._check_schema_freshness(schema_filename, cached_schema):
-                return cached_schema
-        
+    async def load_and_validate_schema(self, schema_filename: str) -> SchemaEntry:
+        """Load a schema's cache entry using the load gate pattern."""
+        entry = self._schemas.get(schema_filename)
+        if entry is not None:
+            # Fresh while the epoch it was cached under is still current;
+            # the watcher bumps the epoch on any on-disk change.
+            if entry.epoch == self._fs_epoch:
+                return entry
+            # Stale: retire the completed gate entry so a fresh load runs
+            # instead of every caller being handed the old result.
+            self._load_gate.invalidate(schema_filename)
+
         result = await self._load_gate.wait_for_load(schema_filename)
         if result is not None:
             return result
-        
+
         try:
             schema = await self._get_schema_from_redis(schema_filename)
             if not schema:
                 schema = await self._load_schema_from_disk(schema_filename)
                 await self._cache_schema_in_redis(schema_filename, schema)
-            
-            self._schema_cache[schema_filename] = schema
-            self._schema_hashes[schema_filename] = schema.get("_metadata", {}).get("hash", "")
-            self._schema_mtimes[schema_filename] = time.time()
-            await self._load_gate.set_result(schema_filename, schema)
-            return schema
-            
+
+            new_entry = self._make_entry(schema, reuse=entry)
+            self._schemas[schema_filename] = new_entry
+            await self._load_gate.set_result(schema_filename, new_entry)
+            return new_entry
+
         except Exception as e:
             await self._load_gate.set_exception(schema_filename, e)
             raise
-    
-    async def _check_schema_freshness(self, schema_filename: str, schema: Dict[str, Any]) -> bool:
-        """Check if cached schema is fresh by comparing mtime or Redis timestamp."""
-        try:
-            if schema.get("_metadata", {}).get("source") == "disk":
-                schema_path = os.path.join(SCHEMA_DIR, schema_filename)
-                if os.path.exists(schema_path):
-                    stat = await async_stat(schema_path)
-                    return stat.st_mtime <= schema["_metadata"].get("mtime", 0)
-            return True  # Redis-sourced schemas are considered fresh
-        except Exception as e:
-            logger.warning(f"Failed to check schema freshness for {schema_filename}: {e}")
-            return False
 
 # FastAPI Dependency Classes
 class ValidateIntentSchema:
-    """Class-based dependency for intent schema validation."""
-    
+    """Class-based dependency for intent schema validation.
+
+    Dependency instances are long-lived, so the schema's cache entry is
+    pinned after the first request: the warm path goes straight to the
+    compiled validator with no manager lookup, re-resolving only when the
+    freshness epoch moves.
+    """
+
     def __init__(self, schema_name: str):
         self.schema_name = schema_name
-    
+        self._entry: Optional[SchemaEntry] = None
+
     async def __call__(
-        self, 
+        self,
         intent_data: Dict[str, Any],
         schema_manager: SchemaManager = Depends(get_schema_manager)
     ) -> Dict[str, Any]:
         try:
-            await schema_manager.validate(intent_data, self.schema_name)
+            entry = self._entry
+            if entry is None or entry.epoch != schema_manager._fs_epoch:
+                entry = await schema_manager.load_and_validate_schema(self.schema_name)
+                self._entry = entry
+            schema_manager.validate_with_entry(entry, intent_data, self.schema_name)
             return intent_data
         except SchemaValidationError as e:
             logger.warning(f"Schema validation failed for {self.schema_name}: {e}")
@@ -405,4 +626,16 @@ async def get_schema_manager() -> SchemaManager:
     if _schema_manager_instance is None:
         _schema_manager_instance = SchemaManager()
         await _schema_manager_instance.initialize()
-    return _schema_manager_instance
\ No newline at end of file
+    return _schema_manager_instance
+
+async def validate_intent_schema(
+    intent_data: Dict[str, Any], intent_name: str, version: str = "v1"
+) -> None:
+    """Validate intent data against a named intent schema.
+
+    intent_name is the dotted short form used by the API layer (e.g.
+    "manifest.clone"); it maps onto the versioned schema filename. The
+    compiled validator is reused across calls via the manager's cache.
+    """
+    schema_manager = await get_schema_manager()
+    await schema_manager.validate(intent_data, f"intent.{intent_name}.{version}.json")
\ No newline at end of file
@@ -2,9 +2,9 @@ import hmac
 import hashlib
 import base64
 import time
-import json
+import orjson
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 class SMPSignatureError(Exception):
     """Custom exception for SMP signature validation errors."""
@@ -18,6 +18,11 @@ class SMPMessage(BaseModel):
     payload: Dict[str, Any] = Field(..., description="Core message payload to be signed.")
     timestamp: int = Field(..., description="Millisecond epoch timestamp when the message was signed.")
     signature: Optional[str] = Field(None, description="Base64-encoded message signature (URL-safe, no padding).")
+    # Canonical payload bytes cached at signing time so verify() skips
+    # re-serialization. A private attribute, never a field: parsed inbound
+    # JSON must not be able to supply canonical bytes that disagree with
+    # payload, or verify() would accept forged payloads.
+    _canonical: Optional[bytes] = PrivateAttr(default=None)
 
 class SMPSignature:
     """
@@ -31,10 +36,15 @@ class SMPSignature:
         if self.algorithm not in hashlib.algorithms_available:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
 
+    def _digest(self, message: bytes) -> bytes:
+        """Raw HMAC digest for given message bytes."""
+        # hmac.digest is the one-shot C fast path (no HMAC object, no
+        # Python-level key padding) — ~3x faster on short messages.
+        return hmac.digest(self.secret_key, message, self.algorithm)
+
     def _sign_bytes(self, message: bytes) -> str:
         """Generate HMAC signature for given message bytes, returns Base64 string."""
-        digest = hmac.new(self.secret_key, message, getattr(hashlib, self.algorithm)).digest()
-        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+        return base64.urlsafe_b64encode(self._digest(message)).decode().rstrip("=")
 
     def sign(self, payload: Dict[str, Any], timestamp: Optional[int] = None) -> SMPMessage:
         """
@@ -42,14 +52,18 @@ class SMPSignature:
         Uses millisecond timestamp and JSON-serialized payload.
         """
         ts = timestamp or (time.time_ns() // 1_000_000)
-        message_bytes = f"{ts}:{json.dumps(payload, sort_keys=True)}".encode()
-        signature = self._sign_bytes(message_bytes)
+        # Serialize once, in C, straight to bytes; the canonical form rides
+        # on the message so verify() never repeats this work.
+        canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        signature = self._sign_bytes(str(ts).encode() + b":" + canonical)
 
-        return SMPMessage(
+        message = SMPMessage(
             payload=payload,
             timestamp=ts,
             signature=signature
         )
+        message._canonical = canonical
+        return message
 
     def verify(self, smp_message: SMPMessage, tolerance: int = 300_000) -> bool:
         """
@@ -59,10 +73,22 @@ class SMPSignature:
         if not smp_message.signature:
             raise SMPSignatureError("Missing signature in SMP message.")
 
-        message_bytes = f"{smp_message.timestamp}:{json.dumps(smp_message.payload, sort_keys=True)}".encode()
-        expected_sig = self._sign_bytes(message_bytes)
+        # Only locally signed messages carry the cache; anything parsed from
+        # the wire recomputes from payload.
+        canonical = smp_message._canonical
+        if canonical is None:
+            canonical = orjson.dumps(smp_message.payload, option=orjson.OPT_SORT_KEYS)
+        message_bytes = str(smp_message.timestamp).encode() + b":" + canonical
+
+        # Compare raw digests: decode the supplied signature once (restoring
+        # the stripped base64 padding) instead of encoding the expected one.
+        signature = smp_message.signature
+        try:
+            given = base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4))
+        except ValueError:
+            raise SMPSignatureError("Invalid signature.")
 
-        if not hmac.compare_digest(expected_sig.encode(), smp_message.signature.encode()):
+        if not hmac.compare_digest(self._digest(message_bytes), given):
             raise SMPSignatureError("Invalid signature.")
 
         # Check for replay (timestamp tolerance)
@@ -2,10 +2,12 @@
 
 import os
 import asyncio
+import errno
 import re
 import hashlib
 import shutil
-from typing import AsyncGenerator, Optional, Tuple, Dict, Any
+import time
+from typing import AsyncGenerator, List, Optional, Tuple, Dict, Any
 from aiofiles import open as async_open
 from aiofiles.os import makedirs as async_makedirs, remove as async_remove, rename as async_rename, stat as async_stat
 from pydantic import BaseModel, Field, validator
@@ -14,6 +16,10 @@ from common.redis_client import get_redis_client
 
 logger = get_logger(__name__)
 
+# Compiled once: the sanitizer runs on every path derivation, so skip the
+# per-call pattern-cache lookup.
+_ID_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]+')
+
 class StorageError(Exception):
     """Custom exception for storage-related errors."""
     pass
@@ -21,7 +27,7 @@ class StorageError(Exception):
 class StorageConfig(BaseModel):
     base_path: str = Field(..., description="Base directory for artifact storage")
     max_file_size: int = Field(100 * 1024 * 1024, description="Maximum file size in bytes")  # 100MB
-    chunk_size: int = Field(8192, description="Chunk size for streaming")  # 8KB chunks
+    chunk_size: int = Field(1 << 20, description="Chunk size for streaming")  # 1MB chunks
     temp_dir: str = Field(".tmp", description="Temporary directory for uploads")
     max_files: int = Field(10000, description="Maximum number of files to store")
     cleanup_interval: int = Field(3600, description="Cleanup interval in seconds")  # 1 hour
@@ -90,15 +96,20 @@ class ArtifactStorage:
         self._metrics = StorageMetrics()
         self._redis_client = None
         self._cleanup_task = None
-        self._active_uploads: Dict[str, asyncio.Lock] = {}
-        self._active_uploads_lock = asyncio.Lock()
+        # artifact_id -> [lock, refcount]; the count tracks every coroutine
+        # holding or awaiting the lock so entries die exactly when idle.
+        self._active_uploads: Dict[str, List[Any]] = {}
+        # Maintained on upload/delete so limit checks read an int instead
+        # of rescanning the directory; resynced by the cleanup task.
+        self._file_count = 0
     
     async def initialize(self):
         """Asynchronously initializes storage with comprehensive setup."""
         try:
             await async_makedirs(self.config.base_path, exist_ok=True)
             await async_makedirs(self._temp_path, exist_ok=True)
-            
+            self._file_count = self._scan_file_count()
+
             # Initialize Redis client for caching
             self._redis_client = await get_redis_client()
             
@@ -123,11 +134,12 @@ class ArtifactStorage:
     
     def _sanitize_id(self, artifact_id: str) -> str:
         """Sanitize artifact ID to prevent path traversal and injection attacks."""
+        # Fast path: well-formed IDs (UUIDs and the like) are pure
+        # ASCII alphanumerics plus -/_ and skip the regex engine entirely.
+        if artifact_id.isascii() and artifact_id.replace('-', '').replace('_', '').isalnum():
+            return artifact_id[:255]
         # Allow only alphanumeric, hyphens, and underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', artifact_id)
-        if len(sanitized) > 255:
-            sanitized = sanitized[:255]
-        return sanitized
+        return _ID_SANITIZE_RE.sub('', artifact_id)[:255]
     
     def _get_file_path(self, artifact_id: str) -> str:
         """Get the full path for an artifact."""
@@ -139,19 +151,58 @@ class ArtifactStorage:
         sanitized_id = self._sanitize_id(artifact_id)
         return os.path.join(self._temp_path, f"{sanitized_id}.tmp")
     
-    async def _get_upload_lock(self, artifact_id: str) -> asyncio.Lock:
-        """Get or create a lock for a specific artifact upload."""
-        async with self._active_uploads_lock:
-            if artifact_id not in self._active_uploads:
-                self._active_uploads[artifact_id] = asyncio.Lock()
-            return self._active_uploads[artifact_id]
-    
-    async def _release_upload_lock(self, artifact_id: str):
-        """Release upload lock after operation completion."""
-        async with self._active_uploads_lock:
-            if artifact_id in self._active_uploads:
+    def _get_upload_lock(self, artifact_id: str) -> asyncio.Lock:
+        """Get or create a lock for a specific artifact upload.
+
+        dict.setdefault is atomic under the GIL and nothing awaits between
+        lookup and refcount bump, so no outer lock is needed.
+        """
+        entry = self._active_uploads.setdefault(artifact_id, [asyncio.Lock(), 0])
+        entry[1] += 1
+        return entry[0]
+
+    def _release_upload_lock(self, artifact_id: str):
+        """Drop one reference; the entry is removed when no one needs it.
+
+        Deleting unconditionally (as before) raced with coroutines still
+        waiting on the lock, which would then serialize against a fresh
+        lock instead of the one actually held.
+        """
+        entry = self._active_uploads.get(artifact_id)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
                 del self._active_uploads[artifact_id]
     
+    @staticmethod
+    def _copy_across_filesystems(src: str, dst: str) -> None:
+        """Copy src to dst for renames that fail with EXDEV.
+
+        Uses os.copy_file_range where the kernel supports it (zero-copy,
+        no userspace round-trip); otherwise falls back to shutil.copyfile.
+        """
+        if not hasattr(os, "copy_file_range"):
+            shutil.copyfile(src, dst)
+            return
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+
+    @staticmethod
+    async def _try_stat(path: str) -> Optional[os.stat_result]:
+        """stat() a path in one syscall, returning None when it's absent.
+
+        Replaces the exists()+stat() double syscall on the common path.
+        """
+        try:
+            return await async_stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     async def _check_storage_limits(self, additional_bytes: int = 0) -> None:
         """Check if storage limits would be exceeded."""
         try:
@@ -168,13 +219,21 @@ class ArtifactStorage:
             # Don't fail the operation on monitoring failure
     
     async def _get_file_count(self) -> int:
-        """Get current number of stored files."""
+        """Get current number of stored files from the maintained counter."""
+        return self._file_count
+
+    def _scan_file_count(self) -> int:
+        """Count stored files with one scandir pass (init and resync only).
+
+        DirEntry.is_file() comes from the directory stream, so this costs
+        one syscall total rather than one stat per entry.
+        """
         try:
-            count = 0
-            for entry in os.listdir(self.config.base_path):
-                if entry.endswith('.bin') and os.path.isfile(os.path.join(self.config.base_path, entry)):
-                    count += 1
-            return count
+            with os.scandir(self.config.base_path) as entries:
+                return sum(
+                    1 for entry in entries
+                    if entry.name.endswith('.bin') and entry.is_file()
+                )
         except Exception as e:
             logger.warning(f"Failed to count files: {e}")
             return 0
@@ -199,7 +258,7 @@ class ArtifactStorage:
         Raises:
             StorageError: If any validation or I/O operation fails
         """
-        upload_lock = await self._get_upload_lock(artifact_id)
+        upload_lock = self._get_upload_lock(artifact_id)
         
         try:
             async with upload_lock:
@@ -211,45 +270,65 @@ class ArtifactStorage:
                 
                 sha256 = hashlib.sha256()
                 total_size = 0
-                
-                # Stream to temporary file with hash calculation
+                max_file_size = self.config.max_file_size
+
+                # Stream to temporary file with hash calculation. The
+                # per-chunk work is bound to locals: on small chunks the
+                # attribute lookups cost as much as the hashing itself.
+                hash_update = sha256.update
                 async with async_open(temp_file_path, "wb") as f:
+                    write = f.write
                     async for chunk in stream:
                         if not chunk:
                             continue
-                            
+
                         total_size += len(chunk)
-                        
+
                         # Validate size limits
-                        if total_size > self.config.max_file_size:
-                            raise StorageError(f"Artifact size {total_size} exceeds limit of {self.config.max_file_size} bytes")
-                        
-                        sha256.update(chunk)
-                        await f.write(chunk)
+                        if total_size > max_file_size:
+                            raise StorageError(f"Artifact size {total_size} exceeds limit of {max_file_size} bytes")
+
+                        hash_update(chunk)
+                        await write(chunk)
                 
                 # Validate expected size if provided
                 if expected_size is not None and total_size != expected_size:
                     raise StorageError(f"Size mismatch: expected {expected_size}, got {total_size} bytes")
                 
                 # Atomic move from temp to final location
-                await async_rename(temp_file_path, final_file_path)
-                
+                is_new_file = not os.path.exists(final_file_path)
+                try:
+                    await async_rename(temp_file_path, final_file_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # temp_dir sits on a different filesystem: copy through
+                    # the kernel instead of a userspace buffer shuffle.
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self._copy_across_filesystems,
+                        temp_file_path, final_file_path
+                    )
+                    await async_remove(temp_file_path)
+                if is_new_file:
+                    self._file_count += 1
+
                 # Update metrics
                 await self._metrics.increment_upload(total_size)
                 
-                # Cache file metadata in Redis
+                # Cache file metadata in Redis as a hash: fields read back
+                # clean with HGETALL/HMGET (the old str(dict) blob was not
+                # parseable), and single fields can be updated in place.
                 if self._redis_client:
-                    metadata = {
+                    meta_key = f"artifact:{artifact_id}:meta"
+                    pipe = self._redis_client.pipeline(transaction=False)
+                    pipe.hset(meta_key, mapping={
                         "size": total_size,
                         "hash": sha256.hexdigest(),
                         "path": final_file_path,
-                        "timestamp": asyncio.get_event_loop().time()
-                    }
-                    await self._redis_client.setex(
-                        f"artifact:{artifact_id}:meta",
-                        3600,  # 1 hour TTL
-                        str(metadata)
-                    )
+                        "ts": time.time()
+                    })
+                    pipe.expire(meta_key, 3600)  # 1 hour TTL
+                    await pipe.execute()
                 
                 logger.info(f"Successfully saved artifact '{artifact_id}' ({total_size} bytes)")
                 return total_size, sha256.hexdigest()
@@ -261,8 +340,107 @@ class ArtifactStorage:
             logger.error(f"Failed to save artifact '{artifact_id}': {e}")
             raise StorageError(f"Failed to save artifact: {str(e)}")
         finally:
-            await self._release_upload_lock(artifact_id)
+            self._release_upload_lock(artifact_id)
     
+    async def save_bytes(self, artifact_id: str, data: bytes) -> str:
+        """
+        Persist a fully-buffered small artifact in a single write.
+
+        Skips the temp-file + rename dance used by save_stream; callers are
+        expected to have already validated size and computed the hash.
+
+        Args:
+            artifact_id: Unique identifier for the artifact
+            data: Complete artifact content
+
+        Returns:
+            Final storage path of the artifact
+
+        Raises:
+            StorageError: If the write fails
+        """
+        file_path = self._get_file_path(artifact_id)
+
+        try:
+            await self._check_storage_limits()
+
+            is_new_file = not os.path.exists(file_path)
+            async with async_open(file_path, "wb") as f:
+                await f.write(data)
+            if is_new_file:
+                self._file_count += 1
+
+            await self._metrics.increment_upload(len(data))
+            logger.info(f"Successfully saved artifact '{artifact_id}' ({len(data)} bytes, buffered)")
+            return file_path
+
+        except Exception as e:
+            await self._cleanup_upload(artifact_id)
+            await self._metrics.increment_failure()
+            logger.error(f"Failed to save artifact '{artifact_id}': {e}")
+            raise StorageError(f"Failed to save artifact: {str(e)}")
+
+    async def save_file(self, artifact_id: str, source_path: str) -> str:
+        """
+        Adopt an already-written file on local disk as an artifact.
+
+        Used by the large-upload path: content was streamed and hashed into
+        source_path by the caller, so persisting is just a rename (or a
+        kernel-side copy when the source sits on another filesystem).
+
+        Args:
+            artifact_id: Unique identifier for the artifact
+            source_path: Path of the fully-written source file
+
+        Returns:
+            Final storage path of the artifact
+
+        Raises:
+            StorageError: If the source is missing or the move fails
+        """
+        file_path = self._get_file_path(artifact_id)
+
+        try:
+            await self._check_storage_limits()
+
+            stat = await self._try_stat(source_path)
+            if stat is None:
+                raise StorageError(f"Source file '{source_path}' not found")
+            size = stat.st_size
+
+            is_new_file = not os.path.exists(file_path)
+            try:
+                await async_rename(source_path, file_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._copy_across_filesystems,
+                    source_path, file_path
+                )
+                await async_remove(source_path)
+            if is_new_file:
+                self._file_count += 1
+
+            await self._metrics.increment_upload(size)
+            logger.info(f"Successfully saved artifact '{artifact_id}' ({size} bytes, from file)")
+            return file_path
+
+        except Exception as e:
+            await self._cleanup_upload(artifact_id)
+            await self._metrics.increment_failure()
+            logger.error(f"Failed to save artifact '{artifact_id}': {e}")
+            raise StorageError(f"Failed to save artifact: {str(e)}")
+
+    def local_path(self, artifact_id: str) -> Optional[str]:
+        """Return the on-disk path of an artifact, or None if absent.
+
+        Lets the API layer hand local files to sendfile-based responses
+        instead of streaming chunks through Python.
+        """
+        file_path = self._get_file_path(artifact_id)
+        return file_path if os.path.exists(file_path) else None
+
     async def load_stream(self, artifact_id: str) -> AsyncGenerator[bytes, None]:
         """
         Stream an artifact from storage with validation and caching.
@@ -279,21 +457,20 @@ class ArtifactStorage:
         file_path = self._get_file_path(artifact_id)
         
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                raise StorageError(f"Artifact '{artifact_id}' not found")
-            
-            # Stream file content
+            # Open directly: a missing file surfaces as FileNotFoundError,
+            # instead of paying an exists() syscall on every download.
             async with async_open(file_path, "rb") as f:
                 while True:
                     chunk = await f.read(self.config.chunk_size)
                     if not chunk:
                         break
                     yield chunk
-            
+
             # Update metrics
             await self._metrics.increment_download()
-            
+
+        except FileNotFoundError:
+            raise StorageError(f"Artifact '{artifact_id}' not found")
         except StorageError:
             raise
         except Exception as e:
@@ -303,13 +480,26 @@ class ArtifactStorage:
     
     async def get_artifact_info(self, artifact_id: str) -> Optional[Dict[str, Any]]:
         """Get artifact metadata and information."""
+        # Fast path: the metadata hash cached at upload answers without
+        # touching the filesystem.
+        if self._redis_client:
+            try:
+                cached = await self._redis_client.hgetall(f"artifact:{artifact_id}:meta")
+                if cached:
+                    return {
+                        "size": int(cached[b"size"]),
+                        "modified": float(cached[b"ts"]),
+                        "path": cached[b"path"].decode()
+                    }
+            except Exception as e:
+                logger.debug(f"Metadata cache read failed for '{artifact_id}': {e}")
+
         file_path = self._get_file_path(artifact_id)
-        
-        if not os.path.exists(file_path):
-            return None
-        
+
         try:
-            stat = await async_stat(file_path)
+            stat = await self._try_stat(file_path)
+            if stat is None:
+                return None
             return {
                 "size": stat.st_size,
                 "modified": stat.st_mtime,
@@ -326,22 +516,27 @@ class ArtifactStorage:
         
         try:
             # Get file size for metrics before deletion
-            file_size = 0
-            if os.path.exists(file_path):
-                stat = await async_stat(file_path)
-                file_size = stat.st_size
-            
-            # Delete both final and temp files
+            stat = await self._try_stat(file_path)
+            file_size = stat.st_size if stat is not None else 0
+
+            # Delete both final and temp files; a FileNotFoundError just
+            # means someone else got there first.
             deleted = False
-            if os.path.exists(file_path):
-                await async_remove(file_path)
-                deleted = True
-            
-            if os.path.exists(temp_path):
+            if stat is not None:
+                try:
+                    await async_remove(file_path)
+                    deleted = True
+                except FileNotFoundError:
+                    pass
+
+            try:
                 await async_remove(temp_path)
-            
+            except FileNotFoundError:
+                pass
+
             # Update metrics
             if deleted:
+                self._file_count = max(0, self._file_count - 1)
                 await self._metrics.increment_delete(file_size)
             
             # Invalidate Redis cache
@@ -350,10 +545,7 @@ class ArtifactStorage:
             
             logger.info(f"Deleted artifact '{artifact_id}'")
             return deleted
-            
-        except FileNotFoundError:
-            logger.debug(f"Artifact '{artifact_id}' not found for deletion")
-            return False
+
         except Exception as e:
             await self._metrics.increment_failure()
             logger.error(f"Failed to delete artifact '{artifact_id}': {e}")
@@ -364,38 +556,61 @@ class ArtifactStorage:
         temp_path = self._get_temp_path(artifact_id)
         file_path = self._get_file_path(artifact_id)
         
-        try:
-            if os.path.exists(temp_path):
-                await async_remove(temp_path)
-            if os.path.exists(file_path):
-                await async_remove(file_path)
-        except Exception as e:
-            logger.warning(f"Cleanup failed for artifact '{artifact_id}': {e}")
+        for path in (temp_path, file_path):
+            try:
+                await async_remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Cleanup failed for artifact '{artifact_id}': {e}")
     
+    def _collect_stale_temps(self) -> List[str]:
+        """Find .tmp files older than an hour with one scandir pass.
+
+        DirEntry.stat() comes from the directory stream, so this is one
+        syscall per entry instead of listdir plus a stat each.
+        """
+        stale = []
+        now = time.time()
+        try:
+            with os.scandir(self._temp_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.tmp'):
+                        continue
+                    try:
+                        if now - entry.stat().st_mtime > 3600:
+                            stale.append(entry.path)
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return stale
+
     async def _cleanup_old_temp_files(self):
         """Background task to clean up old temporary files."""
         while True:
             try:
                 await asyncio.sleep(self.config.cleanup_interval)
-                
-                if not os.path.exists(self._temp_path):
-                    continue
-                
+
+                # st_mtime is wall-clock time; the old comparison against
+                # event-loop time mixed clock domains and aged files wrong.
+                stale = await asyncio.to_thread(self._collect_stale_temps)
                 cleanup_count = 0
-                for filename in os.listdir(self._temp_path):
-                    if filename.endswith('.tmp'):
-                        file_path = os.path.join(self._temp_path, filename)
-                        try:
-                            # Remove files older than 1 hour
-                            stat = await async_stat(file_path)
-                            if asyncio.get_event_loop().time() - stat.st_mtime > 3600:
-                                await async_remove(file_path)
-                                cleanup_count += 1
-                        except Exception as e:
-                            logger.warning(f"Failed to clean up temp file {filename}: {e}")
-                
+                for file_path in stale:
+                    try:
+                        await async_remove(file_path)
+                        cleanup_count += 1
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        logger.warning(f"Failed to clean up temp file {file_path}: {e}")
+
                 if cleanup_count > 0:
                     logger.info(f"Cleaned up {cleanup_count} temporary files")
+
+                # Resync the maintained counter so any drift from external
+                # file changes is bounded by one cleanup interval.
+                self._file_count = self._scan_file_count()
                     
             except asyncio.CancelledError:
                 break
@@ -438,7 +653,7 @@ async def get_artifact_storage() -> ArtifactStorage:
     config = StorageConfig(
         base_path=os.getenv("ARTIFACT_STORAGE_PATH", "C:/AccessNode/artifacts"),
         max_file_size=100 * 1024 * 1024,  # 100MB
-        chunk_size=8192,  # 8KB
+        chunk_size=1 << 20,  # 1MB
         temp_dir=".tmp",
         max_files=10000,
         cleanup_interval=3600
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import pytest_asyncio
 import aiohttp
@@ -8,8 +9,22 @@ from src.common.config import get_config
 
 logger = get_logger(__name__)
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session so session-scoped async
+    fixtures outlive individual tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
 async def ai_proxy():
+    """One AIProxy — and one pooled ClientSession — for the whole file.
+
+    Tests patch aiohttp at the class level and never mutate proxy state,
+    so sharing is safe; a function-scoped proxy paid a session
+    setup/teardown per test for nothing.
+    """
     config = {
         "api_keys": {"openai": "test_key"},
         "default_model": "openai/gpt-4o-mini"
@@ -1,7 +1,9 @@
+import asyncio
+import functools
 import pytest
 import pytest_asyncio
 import json
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.main import app
 from src.core.executor import Executor, get_executor
@@ -11,89 +13,123 @@ from src.common.auth import authenticate_request
 from src.common.smp_signature import SMPSignature, SMPMessage
 import base64
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+
+# Frozen once at import: the old fixture rebuilt this dict literal inside
+# the side_effect lambda on every single config.get call.
+_CONFIG_DEFAULTS = MappingProxyType({
+    "app.secret_key": "test-secret-key",
+    "app.environment": "testing",
+    "app.version": "2.1.0",
+    "manifest.intents.runPython.allowed": True,
+    "manifest.intents.runPython.timeout_sec": 10,
+    "manifest.intents.runPython.resource_limits.cpu": 0.5,
+    "manifest.intents.runPython.resource_limits.memory_mb": 128,
+    "manifest.intents.runShell.allowed": True,
+    "manifest.intents.runShell.timeout_sec": 10,
+    "manifest.intents.clone.allowed": True,
+    "manifest.intents.clone.shallow_default": False,
+    "manifest.intents.clone.submodules_default": False,
+    "manifest.intents.push.allowed": True,
+    "manifest.intents.queryAI.allowed": True,
+    "manifest.intents.queryAI.stream_default": False,
+    "crypto.signature_required": True,
+    "crypto.key_store_path": "/etc/echo/keys",
+    "security.require_auth": True,
+    "security.allowed_roles": ["admin", "devops", "ai_operator"]
+})
 
 # -------------------------------
 # Fixtures
 # -------------------------------
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session so session-scoped async
+    fixtures outlive individual tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
 async def async_client():
-    """Provide an AsyncClient for testing HTTP requests."""
-    async with AsyncClient(app=app, base_url="http://testserver") as client:
+    """One pooled ASGI client shared across the whole suite."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
         yield client
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Mock the Config object with default values from config.yaml."""
+    """Mock the Config object with default values from config.yaml.
+
+    Read-only, so one instance serves the whole session; tests needing
+    different values monkeypatch get.side_effect, which restores itself.
+    """
     config = MagicMock(spec=Config)
-    config.get.side_effect = lambda key, default=None: {
-        "app.secret_key": "test-secret-key",
-        "app.environment": "testing",
-        "app.version": "2.1.0",
-        "manifest.intents.runPython.allowed": True,
-        "manifest.intents.runPython.timeout_sec": 10,
-        "manifest.intents.runPython.resource_limits.cpu": 0.5,
-        "manifest.intents.runPython.resource_limits.memory_mb": 128,
-        "manifest.intents.runShell.allowed": True,
-        "manifest.intents.runShell.timeout_sec": 10,
-        "manifest.intents.clone.allowed": True,
-        "manifest.intents.clone.shallow_default": False,
-        "manifest.intents.clone.submodules_default": False,
-        "manifest.intents.push.allowed": True,
-        "manifest.intents.queryAI.allowed": True,
-        "manifest.intents.queryAI.stream_default": False,
-        "crypto.signature_required": True,
-        "crypto.key_store_path": "/etc/echo/keys",
-        "security.require_auth": True,
-        "security.allowed_roles": ["admin", "devops", "ai_operator"]
-    }.get(key, default)
+    config.get.side_effect = lambda key, default=None: _CONFIG_DEFAULTS.get(key, default)
     return config
 
-@pytest.fixture
-def auth_token(mock_config):
-    """Generate a mock JWT token for authentication."""
-    with patch("src.common.config.get_config", return_value=mock_config):
-        from src.api.auth import authenticate_request
-        return "mock-jwt-token"
+@pytest.fixture(scope="session")
+def auth_token():
+    """Mock JWT token for authentication."""
+    return "mock-jwt-token"
+
+@pytest_asyncio.fixture(scope="session")
+async def authenticated_client(auth_token):
+    """Pooled client with the auth header baked in at construction.
+
+    A separate instance over the same app, rather than mutating
+    async_client.headers, so the anonymous client stays anonymous for
+    the unauthenticated tests.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://testserver",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    ) as client:
+        yield client
 
-@pytest_asyncio.fixture
-async def authenticated_client(async_client, auth_token):
-    """Provide an authenticated AsyncClient."""
-    async_client.headers.update({"Authorization": f"Bearer {auth_token}"})
-    return async_client
+# Canned executor responses, frozen once at import: the old AsyncMock
+# fixture rebuilt this whole dict inside a lambda on every dispatch.
+_RESPONSES = MappingProxyType({
+    "runPython": {
+        "status": "completed",
+        "logs": "Hello World\n",
+        "exit_code": 0
+    },
+    "runShell": {
+        "status": "completed",
+        "logs": "dir contents\n",
+        "exit_code": 0
+    },
+    "clone": {
+        "status": "success",
+        "path": "/tmp/repos/test-org/test-repo/main",
+        "commit_sha": "abc123"
+    },
+    "push": {
+        "status": "success",
+        "commit_sha": "def456"
+    },
+    "queryAI": {
+        "response": "Hello from AI",
+        "model": "openai/gpt-4o-mini",
+        "usage": {"total_tokens": 5, "prompt_tokens": 2, "completion_tokens": 3}
+    }
+})
 
-@pytest_asyncio.fixture
-async def mock_executor():
-    """Mock the Executor class for testing intent execution."""
-    executor = AsyncMock(spec=Executor)
-    # Mock runPython intent
-    executor.execute_intent.side_effect = lambda intent: {
-        "runPython": {
-            "status": "completed",
-            "logs": "Hello World\n",
-            "exit_code": 0
-        },
-        "runShell": {
-            "status": "completed",
-            "logs": "dir contents\n",
-            "exit_code": 0
-        },
-        "clone": {
-            "status": "success",
-            "path": "/tmp/repos/test-org/test-repo/main",
-            "commit_sha": "abc123"
-        },
-        "push": {
-            "status": "success",
-            "commit_sha": "def456"
-        },
-        "queryAI": {
-            "response": "Hello from AI",
-            "model": "openai/gpt-4o-mini",
-            "usage": {"total_tokens": 5, "prompt_tokens": 2, "completion_tokens": 3}
-        }
-    }[intent.intent]
-    yield executor
+async def _dispatch(intent):
+    return _RESPONSES[intent.intent]
+
+@pytest.fixture
+def mock_executor():
+    """Stand-in executor dispatching to the frozen response table.
+
+    A plain SimpleNamespace skips AsyncMock's call-recording machinery;
+    tests needing custom behaviour reassign execute_intent directly.
+    """
+    return SimpleNamespace(execute_intent=_dispatch)
 
 @pytest_asyncio.fixture
 async def mock_smp_signature():
@@ -106,16 +142,21 @@ async def mock_smp_signature():
 # Helper Functions
 # -------------------------------
 
-def create_smp_message(intent_type: str, payload: dict) -> SMPMessage:
-    """Create a mock SMPMessage for testing."""
+# No test asserts on message timestamps, so one constant pair lets
+# identical payloads share a cached message.
+_SMP_CREATED_AT = datetime.utcnow().isoformat() + "Z"
+_SMP_TIMESTAMP = int(datetime.utcnow().timestamp() * 1000)
+
+@functools.lru_cache(maxsize=64)
+def _build_smp_message(intent_type: str, payload_json: str) -> SMPMessage:
     return SMPMessage(
         payload={
             "intent": intent_type,
             "version": "v1",
-            "payload": payload,
+            "payload": json.loads(payload_json),
             "metadata": {
                 "id": "test-id",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _SMP_CREATED_AT,
                 "requester": "rs_user:admin:lorentz",
                 "tags": ["test"]
             },
@@ -126,10 +167,33 @@ def create_smp_message(intent_type: str, payload: dict) -> SMPMessage:
             },
             "originator": "rs_user:admin:lorentz"
         },
-        timestamp=int(datetime.utcnow().timestamp() * 1000),
+        timestamp=_SMP_TIMESTAMP,
         signature="mock-signature"
     )
 
+def create_smp_message(intent_type: str, payload: dict) -> SMPMessage:
+    """Create a mock SMPMessage for testing.
+
+    Memoized per distinct payload so the many tests posting the same
+    literal payloads skip repeated pydantic construction. The returned
+    message is shared — copy(deep=True) before mutating it.
+    """
+    return _build_smp_message(intent_type, json.dumps(payload, sort_keys=True))
+
+_JSON_HDR = {"content-type": "application/json"}
+
+@functools.lru_cache(maxsize=64)
+def _smp_body_cached(intent_type: str, payload_json: str) -> bytes:
+    return _build_smp_message(intent_type, payload_json).json().encode()
+
+def smp_body(intent_type: str, payload: dict) -> bytes:
+    """Pre-serialized request body for an SMP message, cached per payload.
+
+    Posting content= bytes skips the per-call pydantic .dict() plus httpx
+    JSON encoding pipeline, which dominates these assertion-light tests.
+    """
+    return _smp_body_cached(intent_type, json.dumps(payload, sort_keys=True))
+
 # -------------------------------
 # Health Check Tests
 # -------------------------------
@@ -156,7 +220,7 @@ async def test_run_python_endpoint_success(authenticated_client, mock_executor,
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("runPython", {
+        body = smp_body("runPython", {
             "code": "print('Hello World')",
             "timeout_seconds": 5,
             "environment": {},
@@ -164,7 +228,8 @@ async def test_run_python_endpoint_success(authenticated_client, mock_executor,
         })
         response = await authenticated_client.post(
             "/run/python",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         data = response.json()
@@ -173,38 +238,99 @@ async def test_run_python_endpoint_success(authenticated_client, mock_executor,
         assert data["exit_code"] == 0
 
 @pytest.mark.asyncio
-async def test_run_python_endpoint_invalid_code(authenticated_client, mock_executor, mock_smp_signature, mock_config):
-    """Test error handling for invalid Python code."""
-    mock_executor.execute_intent.side_effect = Exception("SyntaxError: invalid syntax")
-    with patch("src.common.config.get_config", return_value=mock_config), \
-         patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
-         patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("runPython", {
+@pytest.mark.parametrize("route, intent_type, payload, error_message", [
+    pytest.param(
+        "/run/python", "runPython",
+        {
             "code": "print('Hello World",
             "timeout_seconds": 5,
             "environment": {},
             "stream_logs": False
-        })
+        },
+        "SyntaxError: invalid syntax", id="python"
+    ),
+    pytest.param(
+        "/run/shell", "runShell",
+        {
+            "command": "invalid_cmd",
+            "args": [],
+            "timeout_seconds": 5,
+            "environment": {},
+            "stream_logs": False
+        },
+        "Command not found", id="shell"
+    ),
+    pytest.param(
+        "/run/clone", "clone",
+        {
+            "source": {
+                "type": "git",
+                "identifier": "invalid-url",
+                "branch": "main"
+            },
+            "destination": {
+                "type": "filesystem",
+                "path": "/tmp/repos/test-org/test-repo/main",
+                "overwrite": True
+            },
+            "shallow": False,
+            "submodules": False
+        },
+        "Invalid repository URL", id="clone"
+    ),
+    pytest.param(
+        "/run/push", "push",
+        {
+            "target": {
+                "type": "git",
+                "identifier": "invalid-url",
+                "branch": "main"
+            },
+            "artifacts": [
+                {
+                    "name": "test.txt",
+                    "content": base64.b64encode(b"Hello World").decode()
+                }
+            ],
+            "commit_message": "Test push",
+            "overwrite": False
+        },
+        "Invalid target repository", id="push"
+    ),
+])
+async def test_endpoint_500_on_executor_exception(
+    authenticated_client, mock_executor, mock_smp_signature, mock_config,
+    route, intent_type, payload, error_message
+):
+    """Each execution endpoint surfaces executor failures as a 500."""
+    async def _raise(intent):
+        raise Exception(error_message)
+    mock_executor.execute_intent = _raise
+    with patch("src.common.config.get_config", return_value=mock_config), \
+         patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
+         patch("src.api.routes.get_executor", return_value=mock_executor):
         response = await authenticated_client.post(
-            "/run/python",
-            json=smp_message.dict()
+            route,
+            content=smp_body(intent_type, payload),
+            headers=_JSON_HDR
         )
         assert response.status_code == 500
-        assert "SyntaxError" in response.json()["detail"]
+        assert error_message in response.json()["detail"]
 
 @pytest.mark.asyncio
 async def test_run_python_endpoint_missing_code(authenticated_client, mock_smp_signature, mock_config):
     """Test validation for missing code parameter."""
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature):
-        smp_message = create_smp_message("runPython", {
+        body = smp_body("runPython", {
             "timeout_seconds": 5,
             "environment": {},
             "stream_logs": False
         })
         response = await authenticated_client.post(
             "/run/python",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 400
         assert "Invalid intent" in response.json()["detail"]
@@ -215,7 +341,7 @@ async def test_run_shell_endpoint_success(authenticated_client, mock_executor, m
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("runShell", {
+        body = smp_body("runShell", {
             "command": "ls",
             "args": ["-l"],
             "timeout_seconds": 5,
@@ -224,7 +350,8 @@ async def test_run_shell_endpoint_success(authenticated_client, mock_executor, m
         })
         response = await authenticated_client.post(
             "/run/shell",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         data = response.json()
@@ -232,27 +359,6 @@ async def test_run_shell_endpoint_success(authenticated_client, mock_executor, m
         assert data["logs"] == "dir contents\n"
         assert data["exit_code"] == 0
 
-@pytest.mark.asyncio
-async def test_run_shell_endpoint_invalid_command(authenticated_client, mock_executor, mock_smp_signature, mock_config):
-    """Test error handling for invalid shell command."""
-    mock_executor.execute_intent.side_effect = Exception("Command not found")
-    with patch("src.common.config.get_config", return_value=mock_config), \
-         patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
-         patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("runShell", {
-            "command": "invalid_cmd",
-            "args": [],
-            "timeout_seconds": 5,
-            "environment": {},
-            "stream_logs": False
-        })
-        response = await authenticated_client.post(
-            "/run/shell",
-            json=smp_message.dict()
-        )
-        assert response.status_code == 500
-        assert "Command not found" in response.json()["detail"]
-
 # -------------------------------
 # AI Proxy API Tests
 # -------------------------------
@@ -263,7 +369,7 @@ async def test_query_ai_endpoint_success(authenticated_client, mock_executor, mo
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("queryAI", {
+        body = smp_body("queryAI", {
             "prompt": "Hello AI",
             "model": "openai/gpt-4o-mini",
             "temperature": 0.7,
@@ -272,7 +378,8 @@ async def test_query_ai_endpoint_success(authenticated_client, mock_executor, mo
         })
         response = await authenticated_client.post(
             "/query/ai",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         data = response.json()
@@ -285,7 +392,7 @@ async def test_query_ai_endpoint_missing_prompt(authenticated_client, mock_smp_s
     """Test validation for missing prompt parameter."""
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature):
-        smp_message = create_smp_message("queryAI", {
+        body = smp_body("queryAI", {
             "model": "openai/gpt-4o-mini",
             "temperature": 0.7,
             "max_tokens": 1000,
@@ -293,7 +400,8 @@ async def test_query_ai_endpoint_missing_prompt(authenticated_client, mock_smp_s
         })
         response = await authenticated_client.post(
             "/query/ai",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 400
         assert "Invalid intent" in response.json()["detail"]
@@ -308,7 +416,7 @@ async def test_clone_endpoint_success(authenticated_client, mock_executor, mock_
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("clone", {
+        body = smp_body("clone", {
             "source": {
                 "type": "git",
                 "identifier": "https://github.com/test-org/test-repo.git",
@@ -326,7 +434,8 @@ async def test_clone_endpoint_success(authenticated_client, mock_executor, mock_
         })
         response = await authenticated_client.post(
             "/run/clone",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         data = response.json()
@@ -334,41 +443,13 @@ async def test_clone_endpoint_success(authenticated_client, mock_executor, mock_
         assert data["path"] == "/tmp/repos/test-org/test-repo/main"
         assert data["commit_sha"] == "abc123"
 
-@pytest.mark.asyncio
-async def test_clone_endpoint_invalid_source(authenticated_client, mock_executor, mock_smp_signature, mock_config):
-    """Test error handling for invalid clone source."""
-    mock_executor.execute_intent.side_effect = Exception("Invalid repository URL")
-    with patch("src.common.config.get_config", return_value=mock_config), \
-         patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
-         patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("clone", {
-            "source": {
-                "type": "git",
-                "identifier": "invalid-url",
-                "branch": "main"
-            },
-            "destination": {
-                "type": "filesystem",
-                "path": "/tmp/repos/test-org/test-repo/main",
-                "overwrite": True
-            },
-            "shallow": False,
-            "submodules": False
-        })
-        response = await authenticated_client.post(
-            "/run/clone",
-            json=smp_message.dict()
-        )
-        assert response.status_code == 500
-        assert "Invalid repository URL" in response.json()["detail"]
-
 @pytest.mark.asyncio
 async def test_push_endpoint_success(authenticated_client, mock_executor, mock_smp_signature, mock_config):
     """Test successful push intent execution."""
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("push", {
+        body = smp_body("push", {
             "target": {
                 "type": "git",
                 "identifier": "https://github.com/test-org/test-repo.git",
@@ -388,42 +469,14 @@ async def test_push_endpoint_success(authenticated_client, mock_executor, mock_s
         })
         response = await authenticated_client.post(
             "/run/push",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         assert data["commit_sha"] == "def456"
 
-@pytest.mark.asyncio
-async def test_push_endpoint_invalid_target(authenticated_client, mock_executor, mock_smp_signature, mock_config):
-    """Test error handling for invalid push target."""
-    mock_executor.execute_intent.side_effect = Exception("Invalid target repository")
-    with patch("src.common.config.get_config", return_value=mock_config), \
-         patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
-         patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("push", {
-            "target": {
-                "type": "git",
-                "identifier": "invalid-url",
-                "branch": "main"
-            },
-            "artifacts": [
-                {
-                    "name": "test.txt",
-                    "content": base64.b64encode(b"Hello World").decode()
-                }
-            ],
-            "commit_message": "Test push",
-            "overwrite": False
-        })
-        response = await authenticated_client.post(
-            "/run/push",
-            json=smp_message.dict()
-        )
-        assert response.status_code == 500
-        assert "Invalid target repository" in response.json()["detail"]
-
 # -------------------------------
 # Authentication Tests
 # -------------------------------
@@ -432,7 +485,7 @@ async def test_push_endpoint_invalid_target(authenticated_client, mock_executor,
 async def test_protected_endpoint_without_auth(async_client, mock_config):
     """Test that protected endpoints require authentication."""
     with patch("src.common.config.get_config", return_value=mock_config):
-        smp_message = create_smp_message("runPython", {
+        body = smp_body("runPython", {
             "code": "print('test')",
             "timeout_seconds": 5,
             "environment": {},
@@ -440,18 +493,24 @@ async def test_protected_endpoint_without_auth(async_client, mock_config):
         })
         response = await async_client.post(
             "/run/python",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 401
 
 @pytest.mark.asyncio
-async def test_protected_endpoint_invalid_role(authenticated_client, mock_executor, mock_smp_signature, mock_config):
+async def test_protected_endpoint_invalid_role(authenticated_client, mock_executor, mock_smp_signature, mock_config, monkeypatch):
     """Test that invalid roles are rejected."""
-    mock_config.get.side_effect = lambda key, default=None: {
+    restricted = {
         "app.secret_key": "test-secret-key",
         "security.require_auth": True,
         "security.allowed_roles": ["admin", "devops", "ai_operator"]
-    }.get(key, default)
+    }
+    # monkeypatch restores the shared session mock's side_effect at teardown
+    monkeypatch.setattr(
+        mock_config.get, "side_effect",
+        lambda key, default=None: restricted.get(key, default)
+    )
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
@@ -461,6 +520,8 @@ async def test_protected_endpoint_invalid_role(authenticated_client, mock_execut
             "environment": {},
             "stream_logs": False
         })
+        # Cached messages are shared across tests: copy before mutating.
+        smp_message = smp_message.copy(deep=True)
         smp_message.payload["metadata"]["requester"] = "rs_user:invalid_role:lorentz"
         response = await authenticated_client.post(
             "/run/python",
@@ -480,7 +541,7 @@ async def test_ai_to_sandbox_integration(authenticated_client, mock_executor, mo
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
         # Mock AI to generate code
-        mock_executor.execute_intent.side_effect = lambda intent: {
+        responses = {
             "queryAI": {
                 "response": "print('Generated by AI')",
                 "model": "openai/gpt-4o-mini",
@@ -491,10 +552,13 @@ async def test_ai_to_sandbox_integration(authenticated_client, mock_executor, mo
                 "logs": "Generated by AI\n",
                 "exit_code": 0
             }
-        }[intent.intent]
+        }
+        async def _integration_dispatch(intent):
+            return responses[intent.intent]
+        mock_executor.execute_intent = _integration_dispatch
         
         # First get code from AI
-        ai_smp_message = create_smp_message("queryAI", {
+        ai_body = smp_body("queryAI", {
             "prompt": "Generate Python code to print a message",
             "model": "openai/gpt-4o-mini",
             "temperature": 0.7,
@@ -503,13 +567,14 @@ async def test_ai_to_sandbox_integration(authenticated_client, mock_executor, mo
         })
         ai_response = await authenticated_client.post(
             "/query/ai",
-            json=ai_smp_message.dict()
+            content=ai_body,
+            headers=_JSON_HDR
         )
         assert ai_response.status_code == 200
         generated_code = ai_response.json()["response"]
         
         # Then execute the generated code
-        python_smp_message = create_smp_message("runPython", {
+        python_body = smp_body("runPython", {
             "code": generated_code,
             "timeout_seconds": 5,
             "environment": {},
@@ -517,7 +582,8 @@ async def test_ai_to_sandbox_integration(authenticated_client, mock_executor, mo
         })
         sandbox_response = await authenticated_client.post(
             "/run/python",
-            json=python_smp_message.dict()
+            content=python_body,
+            headers=_JSON_HDR
         )
         assert sandbox_response.status_code == 200
         assert "Generated by AI" in sandbox_response.json()["logs"]
@@ -530,15 +596,17 @@ async def test_ai_to_sandbox_integration(authenticated_client, mock_executor, mo
 async def test_large_code_execution(authenticated_client, mock_executor, mock_smp_signature, mock_config):
     """Test execution of large code snippets."""
     large_code = "print('start');" + "\n".join([f"x_{i} = {i}" for i in range(1000)]) + "\nprint('end')"
-    mock_executor.execute_intent.return_value = {
-        "status": "completed",
-        "logs": "start\nend\n",
-        "exit_code": 0
-    }
+    async def _run(intent):
+        return {
+            "status": "completed",
+            "logs": "start\nend\n",
+            "exit_code": 0
+        }
+    mock_executor.execute_intent = _run
     with patch("src.common.config.get_config", return_value=mock_config), \
          patch("src.common.smp_signature.SMPSignature", return_value=mock_smp_signature), \
          patch("src.api.routes.get_executor", return_value=mock_executor):
-        smp_message = create_smp_message("runPython", {
+        body = smp_body("runPython", {
             "code": large_code,
             "timeout_seconds": 10,
             "environment": {},
@@ -546,7 +614,8 @@ async def test_large_code_execution(authenticated_client, mock_executor, mock_sm
         })
         response = await authenticated_client.post(
             "/run/python",
-            json=smp_message.dict()
+            content=body,
+            headers=_JSON_HDR
         )
         assert response.status_code == 200
         assert "start" in response.json()["logs"]
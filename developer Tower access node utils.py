@@ -6,6 +6,10 @@ import uuid
 from typing import Any, Dict, Optional
 from src.common.config import get_config
 
+def load_config():
+    """Return the process-wide cached Config instance."""
+    return get_config()
+
 def get_logger(name: Optional[str] = None, level: Optional[int] = None) -> logging.Logger:
     """
     Create and return a standardized logger instance.